@@ -19,19 +19,15 @@ except ImportError:
 import json
 import re
 import threading
-from collections import Counter
+from collections import Counter, deque
+from dataclasses import dataclass, fields as dataclass_fields, replace as dataclass_replace
 from datetime import datetime
 import queue
 import uuid
 
-import requests
-from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QDialog, QDialogButtonBox, QLineEdit, QFormLayout, QCheckBox, QListWidget, QListWidgetItem, QMenu, QWidgetAction, QRadioButton, QButtonGroup, QToolTip, QComboBox, QPlainTextEdit, QTextEdit, QSpinBox, QFileDialog, QStackedWidget, QFrame, QTabWidget, QMainWindow, QDoubleSpinBox, QGridLayout, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QTimer, QRect, QPoint, QEventLoop, pyqtSignal, QMetaObject, QEvent, QSize, QObject, QSettings, pyqtSlot
-from PyQt5.QtGui import QFont, QPainter, QColor, QPen, QClipboard, QCursor, QFontMetrics, QTextDocument, QIcon, QTextCursor, QPixmap
-
-from capture_mac import create_capture, DynamicRegionCapture
-from vision_ocr import VisionOCR
-from audio_pipeline import AudioPipeline
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QDialog, QDialogButtonBox, QLineEdit, QFormLayout, QCheckBox, QListWidget, QListWidgetItem, QMenu, QWidgetAction, QRadioButton, QButtonGroup, QToolTip, QComboBox, QPlainTextEdit, QTextEdit, QSpinBox, QFileDialog, QStackedWidget, QFrame, QTabWidget, QMainWindow, QDoubleSpinBox, QGridLayout, QGraphicsOpacityEffect, QListView, QStyledItemDelegate, QShortcut
+from PyQt5.QtCore import Qt, QTimer, QRect, QPoint, QEventLoop, pyqtSignal, QMetaObject, QEvent, QSize, QObject, QSettings, pyqtSlot, QStringListModel, QPointF, QPropertyAnimation, QEasingCurve, QModelIndex, QPersistentModelIndex
+from PyQt5.QtGui import QFont, QPainter, QColor, QPen, QClipboard, QCursor, QFontMetrics, QTextDocument, QIcon, QTextCursor, QPixmap, QStaticText, QTransform, QKeySequence
 
 
 class _DebugOutputEmitter(QObject):
@@ -42,9 +38,15 @@ class _DebugOutputEmitter(QObject):
 class _TeeStream:
     """Writes to both real stdout/stderr and emits to debug terminal."""
 
+    _EMIT_THRESHOLD = 4096  # chars buffered before emitting without a newline
+
     def __init__(self, stream, emitter):
         self._stream = stream
         self._emitter = emitter
+        # print() issues separate write() calls; batch them into one emit per line
+        self._buf = []
+        self._buf_len = 0
+        self._buf_lock = threading.Lock()
 
     def write(self, data):
         try:
@@ -52,9 +54,27 @@ class _TeeStream:
             self._stream.flush()
         except Exception:
             pass
+        if not data or not self._emitter:
+            return
+        data = str(data)
+        with self._buf_lock:
+            self._buf.append(data)
+            self._buf_len += len(data)
+            if "\n" not in data and self._buf_len <= self._EMIT_THRESHOLD:
+                return
+            text = self._take_buffer()
+        self._emit(text)
+
+    def _take_buffer(self):
+        text = "".join(self._buf)
+        self._buf.clear()
+        self._buf_len = 0
+        return text
+
+    def _emit(self, text):
         try:
-            if data and self._emitter:
-                self._emitter.text_written.emit(str(data))
+            if text:
+                self._emitter.text_written.emit(text)
         except Exception:
             pass
 
@@ -63,6 +83,10 @@ class _TeeStream:
             self._stream.flush()
         except Exception:
             pass
+        if self._emitter:
+            with self._buf_lock:
+                text = self._take_buffer()
+            self._emit(text)
 
     def __getattr__(self, name):
         return getattr(self._stream, name)
@@ -89,23 +113,38 @@ class DebugTerminal(QWidget):
         self._text.setLineWrapMode(QPlainTextEdit.NoWrap)
         layout.addWidget(self._text)
         self._max_lines = 5000
+        # Qt drops the oldest block itself once the cap is reached (no manual trim)
+        self._text.setMaximumBlockCount(self._max_lines)
+        # Coalesce bursts of writes into one insert per flush interval
+        self._pending = deque()
+        self._flush_scheduled = False
+        self._flush_interval_ms = 50
         self.hide()
 
     @pyqtSlot(str)
     def append(self, text):
         if not text:
             return
+        self._pending.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(self._flush_interval_ms, self._flush_pending)
+
+    def _flush_pending(self):
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        # Read-only view: the cursor normally stays at End, so skip the move + setTextCursor
         cursor = self._text.textCursor()
-        cursor.movePosition(cursor.End)
-        self._text.setTextCursor(cursor)
+        if not cursor.atEnd():
+            cursor.movePosition(QTextCursor.End)
+            self._text.setTextCursor(cursor)
         self._text.insertPlainText(text)
-        doc = self._text.document()
-        if doc.blockCount() > self._max_lines:
-            cursor = self._text.textCursor()
-            cursor.setPosition(0)
-            cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor, doc.blockCount() - self._max_lines)
-            cursor.removeSelectedText()
-        self._text.verticalScrollBar().setValue(self._text.verticalScrollBar().maximum())
+        sb = self._text.verticalScrollBar()
+        if sb.value() != sb.maximum():
+            sb.setValue(sb.maximum())
 
     def toggle(self):
         if self.isVisible():
@@ -117,6 +156,10 @@ class DebugTerminal(QWidget):
             self.activateWindow()
 
 
+# Focus widgets that consume typed keys (Space/Enter/T must not be hijacked)
+_TEXT_FIELD_TYPES = (QLineEdit, QPlainTextEdit, QTextEdit, QSpinBox)
+
+
 class _GlobalKeyFilter(QObject):
     """Event filter: Space toggles OCR pause, Enter resumes. Both work regardless of focus."""
 
@@ -129,11 +172,9 @@ class _GlobalKeyFilter(QObject):
         fw = QApplication.focusWidget()
         if not fw:
             return False
-        if isinstance(fw, (QLineEdit, QPlainTextEdit, QTextEdit, QSpinBox)):
+        if isinstance(fw, _TEXT_FIELD_TYPES):
             return True
-        if isinstance(fw, QComboBox) and fw.isEditable():
-            return True
-        return False
+        return isinstance(fw, QComboBox) and fw.isEditable()
 
     def _ocr_is_running(self):
         """True when OCR is actively reading. Box is white."""
@@ -238,131 +279,140 @@ class _GlobalKeyFilter(QObject):
                 return True
         return False
 
-def _mac_set_activation_policy_accessory():
-    """Set app to accessory (no Dock icon) so windows can float above fullscreen apps."""
-    if sys.platform != "darwin":
-        return
+# libobjc handle and selectors used by the _mac_* helpers, resolved once (macOS only)
+_OBJC = None
+_SEL = {}
+# objc_msgSend bound once per signature (no argtypes swapping between calls)
+_msg_send_0 = None    # (id, SEL)
+_msg_send_1ul = None  # (id, SEL, unsigned long)
+_msg_send_1l = None   # (id, SEL, long)
+if sys.platform == "darwin":
     try:
         import ctypes
         from ctypes import util
-        libobjc = ctypes.CDLL(util.find_library("objc"))
-        libobjc.objc_getClass.restype = ctypes.c_void_p
-        libobjc.objc_getClass.argtypes = [ctypes.c_char_p]
-        libobjc.sel_registerName.restype = ctypes.c_void_p
-        libobjc.sel_registerName.argtypes = [ctypes.c_char_p]
-        libobjc.objc_msgSend.restype = ctypes.c_void_p
-        libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-
-        nsapp_class = libobjc.objc_getClass(b"NSApplication")
-        sel_shared = libobjc.sel_registerName(b"sharedApplication")
-        nsapp = libobjc.objc_msgSend(nsapp_class, sel_shared)
-        if nsapp:
-            # NSApplicationActivationPolicyAccessory = 1
-            libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_long]
-            sel_policy = libobjc.sel_registerName(b"setActivationPolicy:")
-            libobjc.objc_msgSend(ctypes.c_void_p(nsapp), sel_policy, 1)
+        _OBJC = ctypes.CDLL(util.find_library("objc"))
+        _OBJC.objc_getClass.restype = ctypes.c_void_p
+        _OBJC.objc_getClass.argtypes = [ctypes.c_char_p]
+        _OBJC.sel_registerName.restype = ctypes.c_void_p
+        _OBJC.sel_registerName.argtypes = [ctypes.c_char_p]
+        _msg_send_0 = ctypes.cast(
+            _OBJC.objc_msgSend, ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+        _msg_send_1ul = ctypes.cast(
+            _OBJC.objc_msgSend, ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong))
+        _msg_send_1l = ctypes.cast(
+            _OBJC.objc_msgSend, ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_long))
+        _SEL = {
+            name: _OBJC.sel_registerName(name.encode())
+            for name in (
+                "window", "setLevel:", "setCollectionBehavior:", "orderFrontRegardless",
+                "setActivationPolicy:", "sharedApplication",
+            )
+        }
     except Exception:
-        pass
+        _OBJC = None
+        _SEL = {}
+        _msg_send_0 = _msg_send_1ul = _msg_send_1l = None
 
 
-def _mac_set_fullscreen_overlay(widget):
-    """Configure Qt window to appear above fullscreen apps on macOS."""
-    if sys.platform != "darwin":
-        return
-    debug = "--debug" in sys.argv
-    try:
-        import ctypes
-        from ctypes import util
-
-        # On macOS Qt, winId() returns NSView* (the content view)
-        wid = widget.winId()
-        if not wid:
-            if debug:
-                print("[Fullscreen overlay] winId is 0")
+if sys.platform == "darwin":
+    def _mac_set_activation_policy_accessory():
+        """Set app to accessory (no Dock icon) so windows can float above fullscreen apps."""
+        if _OBJC is None:
             return
+        try:
+            nsapp_class = _OBJC.objc_getClass(b"NSApplication")
+            nsapp = _msg_send_0(nsapp_class, _SEL["sharedApplication"])
+            if nsapp:
+                # NSApplicationActivationPolicyAccessory = 1
+                _msg_send_1l(nsapp, _SEL["setActivationPolicy:"], 1)
+        except Exception:
+            pass
 
-        view_ptr = ctypes.c_void_p(int(wid))
-
-        # Use ctypes + objc_msgSend (no PyObjC required)
-        libobjc = ctypes.CDLL(util.find_library("objc"))
-        libobjc.sel_registerName.restype = ctypes.c_void_p
-        libobjc.sel_registerName.argtypes = [ctypes.c_char_p]
-        libobjc.objc_msgSend.restype = ctypes.c_void_p
-        libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
 
-        # [view window] -> NSWindow*
-        sel_window = libobjc.sel_registerName(b"window")
-        nswin_ptr = libobjc.objc_msgSend(view_ptr, sel_window)
-        if not nswin_ptr:
+    def _mac_set_fullscreen_overlay(widget):
+        """Configure Qt window to appear above fullscreen apps on macOS."""
+        debug = "--debug" in sys.argv
+        if _OBJC is None:
             if debug:
-                print("[Fullscreen overlay] view.window() returned NULL")
+                print("[Fullscreen overlay] libobjc unavailable")
             return
+        try:
+            import ctypes
 
-        nswin = ctypes.c_void_p(nswin_ptr)
-
-        # Add third arg for methods that take one argument
-        libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong]
-
-        # Use CGWindowLevelForKey(.screenSaverWindow) = 1000 to float above fullscreen video
-        # NSStatusWindowLevel (25) is too low for fullscreen apps
-        kCGWindowLevelForKey = 1000
-        NSWindowCollectionBehaviorCanJoinAllSpaces = 1 << 0   # 1
-        NSWindowCollectionBehaviorFullScreenAuxiliary = 1 << 8  # 256
-        NSWindowCollectionBehaviorStationary = 1 << 4           # 16
-        behavior = (
-            NSWindowCollectionBehaviorCanJoinAllSpaces
-            | NSWindowCollectionBehaviorFullScreenAuxiliary
-            | NSWindowCollectionBehaviorStationary
-        )
+            # On macOS Qt, winId() returns NSView* (the content view)
+            wid = widget.winId()
+            if not wid:
+                if debug:
+                    print("[Fullscreen overlay] winId is 0")
+                return
 
-        sel_level = libobjc.sel_registerName(b"setLevel:")
-        libobjc.objc_msgSend(nswin, sel_level, kCGWindowLevelForKey)
+            view_ptr = ctypes.c_void_p(int(wid))
 
-        sel_behavior = libobjc.sel_registerName(b"setCollectionBehavior:")
-        libobjc.objc_msgSend(nswin, sel_behavior, behavior)
+            # Use ctypes + objc_msgSend (no PyObjC required)
+            # [view window] -> NSWindow*
+            nswin_ptr = _msg_send_0(view_ptr, _SEL["window"])
+            if not nswin_ptr:
+                if debug:
+                    print("[Fullscreen overlay] view.window() returned NULL")
+                return
 
-        # Force window to front - critical for fullscreen overlay
-        sel_order = libobjc.sel_registerName(b"orderFrontRegardless")
-        libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-        libobjc.objc_msgSend(nswin, sel_order)
+            nswin = ctypes.c_void_p(nswin_ptr)
+
+            # Use CGWindowLevelForKey(.screenSaverWindow) = 1000 to float above fullscreen video
+            # NSStatusWindowLevel (25) is too low for fullscreen apps
+            kCGWindowLevelForKey = 1000
+            NSWindowCollectionBehaviorCanJoinAllSpaces = 1 << 0   # 1
+            NSWindowCollectionBehaviorFullScreenAuxiliary = 1 << 8  # 256
+            NSWindowCollectionBehaviorStationary = 1 << 4           # 16
+            behavior = (
+                NSWindowCollectionBehaviorCanJoinAllSpaces
+                | NSWindowCollectionBehaviorFullScreenAuxiliary
+                | NSWindowCollectionBehaviorStationary
+            )
 
-        if debug:
-            print("[Fullscreen overlay] OK (level=1000, orderFrontRegardless)")
-    except Exception as e:
-        if debug:
-            import traceback
-            print(f"[Fullscreen overlay] {e}")
-            traceback.print_exc()
+            _msg_send_1ul(nswin, _SEL["setLevel:"], kCGWindowLevelForKey)
+            _msg_send_1ul(nswin, _SEL["setCollectionBehavior:"], behavior)
 
+            # Force window to front - critical for fullscreen overlay
+            _msg_send_0(nswin, _SEL["orderFrontRegardless"])
 
-def _mac_raise_dialog_above_overlays(dialog):
-    """Set dialog window level above our overlays (1000) so menus appear on top."""
-    if sys.platform != "darwin":
-        return
-    try:
-        wid = dialog.winId()
-        if not wid:
-            return
-        import ctypes
-        from ctypes import util
-        view_ptr = ctypes.c_void_p(int(wid))
-        libobjc = ctypes.CDLL(util.find_library("objc"))
-        libobjc.sel_registerName.restype = ctypes.c_void_p
-        libobjc.sel_registerName.argtypes = [ctypes.c_char_p]
-        libobjc.objc_msgSend.restype = ctypes.c_void_p
-        libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-        sel_window = libobjc.sel_registerName(b"window")
-        nswin_ptr = libobjc.objc_msgSend(view_ptr, sel_window)
-        if not nswin_ptr:
+            if debug:
+                print("[Fullscreen overlay] OK (level=1000, orderFrontRegardless)")
+        except Exception as e:
+            if debug:
+                import traceback
+                print(f"[Fullscreen overlay] {e}")
+                traceback.print_exc()
+
+
+    def _mac_raise_dialog_above_overlays(dialog):
+        """Set dialog window level above our overlays (1000) so menus appear on top."""
+        if _OBJC is None:
             return
-        nswin = ctypes.c_void_p(nswin_ptr)
-        libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong]
-        sel_level = libobjc.sel_registerName(b"setLevel:")
-        libobjc.objc_msgSend(nswin, sel_level, 1001)  # Above overlays (1000)
-        sel_order = libobjc.sel_registerName(b"orderFrontRegardless")
-        libobjc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-        libobjc.objc_msgSend(nswin, sel_order)
-    except Exception:
+        try:
+            wid = dialog.winId()
+            if not wid:
+                return
+            import ctypes
+            view_ptr = ctypes.c_void_p(int(wid))
+            nswin_ptr = _msg_send_0(view_ptr, _SEL["window"])
+            if not nswin_ptr:
+                return
+            nswin = ctypes.c_void_p(nswin_ptr)
+            _msg_send_1ul(nswin, _SEL["setLevel:"], 1001)  # Above overlays (1000)
+            _msg_send_0(nswin, _SEL["orderFrontRegardless"])
+        except Exception:
+            pass
+
+else:
+    # Off macOS the helpers are plain no-ops, so call sites need no platform check
+    def _mac_set_activation_policy_accessory():
+        pass
+
+    def _mac_set_fullscreen_overlay(widget):
+        pass
+
+    def _mac_raise_dialog_above_overlays(dialog):
         pass
 
 
@@ -376,6 +426,19 @@ class _DialogRaiseFilter(QObject):
         return False
 
 
+_DIALOG_FILTER_INSTANCE = None
+
+
+def _install_dialog_raise_filter(dlg):
+    """Install the shared _DialogRaiseFilter on dlg (created once, parented to the QApplication)."""
+    global _DIALOG_FILTER_INSTANCE
+    if sys.platform != "darwin":
+        return
+    if _DIALOG_FILTER_INSTANCE is None:
+        _DIALOG_FILTER_INSTANCE = _DialogRaiseFilter(QApplication.instance())
+    dlg.installEventFilter(_DIALOG_FILTER_INSTANCE)
+
+
 # Language codes: internal -> (DeepL, Baidu, Youdao, Google). None = API uses auto or omit.
 _LANG_MAP = {
     "auto": (None, "auto", "auto", None),
@@ -427,6 +490,18 @@ _LANG_MAP = {
     "eu": ("EU", "baq", "eu", "eu"),
 }
 
+
+def _lang_column(i):
+    """One backend's column of _LANG_MAP as a flat dict (codes interned)."""
+    return {sys.intern(k): (sys.intern(v[i]) if v[i] else v[i]) for k, v in _LANG_MAP.items()}
+
+
+# Per-backend code tables: one dict probe per lookup instead of tuple indexing
+_DEEPL_CODE = _lang_column(0)
+_BAIDU_CODE = _lang_column(1)
+_YOUDAO_CODE = _lang_column(2)
+_GOOGLE_CODE = _lang_column(3)
+
 # Display order for dropdowns: (label, internal_code)
 _LANG_OPTIONS = [
     # ("Auto (detect)", "auto"),
@@ -479,6 +554,9 @@ _LANG_OPTIONS = [
 ]
 
 _LANG_OPTIONS_TARGET = [(lbl, code) for lbl, code in _LANG_OPTIONS if code != "auto"]
+# Selector index -> language code
+_LANG_CODES = tuple(code for _, code in _LANG_OPTIONS)
+_LANG_CODES_TARGET = tuple(code for _, code in _LANG_OPTIONS_TARGET)
 
 
 def _app_dir():
@@ -488,13 +566,48 @@ def _app_dir():
     return os.path.dirname(os.path.abspath(__file__))
 
 
+# Resolved once: the app directory cannot change while the process runs
+_APP_DIR = _app_dir()
+_HOME_DIR = os.path.expanduser("~")
+
+
+def _resolve_start_dir(current):
+    """Start directory for file dialogs: current if it is an existing directory, else the home dir."""
+    return current if current and os.path.isdir(current) else _HOME_DIR
+
+
+_API_KEY_NAMES = (
+    "DEEPL_AUTH_KEY", "GOOGLE_TRANSLATE_API_KEY",
+    "OPENAI_API_KEY", "ELEVENLABS_API_KEY", "SILICONFLOW_COM_API_KEY", "SILICONFLOW_CN_API_KEY", "DEEPSEEK_API_KEY", "ANTHROPIC_API_KEY",
+    "GROQ_API_KEY", "TOGETHER_API_KEY", "HF_API_KEY", "YANDEX_API_KEY", "LIBRETRANSLATE_API_KEY",
+    "CAIYUN_TOKEN", "NIUTRANS_APIKEY",
+)
+
+# Paired credentials: checked per provider, not counted by _has_any_api_key
+_API_KEY_PAIR_NAMES = ("BAIDU_APP_ID", "BAIDU_APP_SECRET", "YOUDAO_APP_KEY", "YOUDAO_APP_SECRET")
+
+# Keys only change through show_api_keys_dialog, which marks this dirty
+_api_key_cache = {"dirty": True, "value": False, "present": {}}
+
+
+def _refresh_api_key_cache():
+    if _api_key_cache["dirty"]:
+        present = {k: bool(os.environ.get(k)) for k in _API_KEY_NAMES + _API_KEY_PAIR_NAMES}
+        _api_key_cache["present"] = present
+        _api_key_cache["value"] = any(present[k] for k in _API_KEY_NAMES)
+        _api_key_cache["dirty"] = False
+
+
 def _has_any_api_key():
-    return any(os.environ.get(k) for k in (
-        "DEEPL_AUTH_KEY", "GOOGLE_TRANSLATE_API_KEY",
-        "OPENAI_API_KEY", "ELEVENLABS_API_KEY", "SILICONFLOW_COM_API_KEY", "SILICONFLOW_CN_API_KEY", "DEEPSEEK_API_KEY", "ANTHROPIC_API_KEY",
-        "GROQ_API_KEY", "TOGETHER_API_KEY", "HF_API_KEY", "YANDEX_API_KEY", "LIBRETRANSLATE_API_KEY",
-        "CAIYUN_TOKEN", "NIUTRANS_APIKEY",
-    ))
+    _refresh_api_key_cache()
+    return _api_key_cache["value"]
+
+
+def _api_key_present(name):
+    """Whether env var name is set (snapshot, refreshed after the API keys dialog saves)."""
+    _refresh_api_key_cache()
+    present = _api_key_cache["present"].get(name)
+    return bool(os.environ.get(name)) if present is None else present
 
 
 def show_api_keys_dialog(parent=None):
@@ -511,22 +624,6 @@ def show_api_keys_dialog(parent=None):
     form = QFormLayout()
     pw_edits = []
     
-    # Helper function to delete a key from .env file
-    def delete_key_from_env(env_key_name):
-        """Remove a key from .env file."""
-        env_path = os.path.join(_app_dir(), ".env")
-        if not os.path.exists(env_path):
-            return
-        try:
-            with open(env_path, "r") as f:
-                lines = f.readlines()
-            with open(env_path, "w") as f:
-                for line in lines:
-                    if not line.strip().startswith(env_key_name + "="):
-                        f.write(line)
-        except OSError:
-            pass
-    
     # Helper function to create a row with delete button
     def create_key_row(label_text, env_key_name, placeholder_text=""):
         """Create a form row with label, text input, and delete button."""
@@ -555,14 +652,8 @@ def show_api_keys_dialog(parent=None):
             }
         """)
         
-        def on_delete():
-            key_edit.clear()
-            delete_key_from_env(env_key_name)
-            # Also remove from environment
-            if env_key_name in os.environ:
-                del os.environ[env_key_name]
-        
-        delete_btn.clicked.connect(on_delete)
+        # Cleared keys are dropped from .env and os.environ on Save
+        delete_btn.clicked.connect(key_edit.clear)
         
         # Horizontal layout for edit + button
         row_layout = QHBoxLayout()
@@ -630,13 +721,7 @@ def show_api_keys_dialog(parent=None):
         }
     """)
     
-    def on_delete_url():
-        libretranslate_url_edit.clear()
-        delete_key_from_env("LIBRETRANSLATE_URL")
-        if "LIBRETRANSLATE_URL" in os.environ:
-            del os.environ["LIBRETRANSLATE_URL"]
-    
-    delete_url_btn.clicked.connect(on_delete_url)
+    delete_url_btn.clicked.connect(libretranslate_url_edit.clear)
     
     url_row_layout = QHBoxLayout()
     url_row_layout.addWidget(libretranslate_url_edit, 1)
@@ -670,11 +755,11 @@ def show_api_keys_dialog(parent=None):
 
     layout.addWidget(btns)
 
-    dlg.installEventFilter(_DialogRaiseFilter(dlg))
+    _install_dialog_raise_filter(dlg)
     if dlg.exec_() != QDialog.Accepted:
         return
 
-    env_path = os.path.join(_app_dir(), ".env")
+    env_path = os.path.join(_APP_DIR, ".env")
     lines = []
     env_keys = (
         "DEEPL_AUTH_KEY", "GOOGLE_TRANSLATE_API_KEY",
@@ -682,11 +767,12 @@ def show_api_keys_dialog(parent=None):
         "GROQ_API_KEY", "TOGETHER_API_KEY", "HF_API_KEY", "YANDEX_API_KEY", "LIBRETRANSLATE_API_KEY", "LIBRETRANSLATE_URL",
         "CAIYUN_TOKEN", "NIUTRANS_APIKEY",
     )
+    env_prefixes = tuple(k + "=" for k in env_keys)
     try:
         if os.path.exists(env_path):
             with open(env_path) as f:
                 for line in f:
-                    if not any(line.strip().startswith(k + "=") for k in env_keys):
+                    if not line.lstrip().startswith(env_prefixes):
                         lines.append(line.rstrip())
     except OSError:
         pass
@@ -695,6 +781,8 @@ def show_api_keys_dialog(parent=None):
         if v := v.strip():
             os.environ[k] = v
             lines.append(f"{k}={v}")
+        else:
+            os.environ.pop(k, None)
 
     add("DEEPL_AUTH_KEY", deepl.text())
     add("GOOGLE_TRANSLATE_API_KEY", google_key.text())
@@ -709,10 +797,10 @@ def show_api_keys_dialog(parent=None):
     add("HF_API_KEY", hf_key.text())
     add("YANDEX_API_KEY", yandex_key.text())
     add("LIBRETRANSLATE_API_KEY", libretranslate_key.text())
-    if libretranslate_url_edit.text().strip():
-        add("LIBRETRANSLATE_URL", libretranslate_url_edit.text())
+    add("LIBRETRANSLATE_URL", libretranslate_url_edit.text())
     add("CAIYUN_TOKEN", caiyun_key.text())
     add("NIUTRANS_APIKEY", niutrans_key.text())
+    _api_key_cache["dirty"] = True
 
     try:
         with open(env_path, "w") as f:
@@ -732,123 +820,176 @@ _SETTINGS_ORG = "BiliOCR"
 _SETTINGS_APP = "BiliOCR"
 
 
-def get_app_settings():
-    """Load persisted settings. Returns dict with detect_mixed_content, max_words_enabled, allow_overlap, etc."""
-    s = QSettings(_SETTINGS_ORG, _SETTINGS_APP)
-    return {
-        "detect_mixed_content": s.value("detect_mixed_content", False, type=bool),
-        "max_words_enabled": s.value("max_words_enabled", False, type=bool),
-        "max_words_for_translation": s.value("max_words_for_translation", 50, type=int),
-        "allow_overlap": s.value("allow_overlap", False, type=bool),
-        "auto_detect_text_region": s.value("auto_detect_text_region", False, type=bool),
-        "llm_context_count": s.value("llm_context_count", 3, type=int),
-        "session_output_enabled": s.value("session_output_enabled", False, type=bool),
-        "session_output_path": s.value("session_output_path", "", type=str) or "",
-        # Audio reconciler: X sec period, Y checks, min words
-        "audio_reconciler_period_sec": s.value("audio_reconciler_period_sec", 2.0, type=float),
-        "audio_reconciler_num_checks": s.value("audio_reconciler_num_checks", 4, type=int),
-        "audio_reconciler_min_words": s.value("audio_reconciler_min_words", 7, type=int),
-        "audio_silence_duration": s.value("audio_silence_duration", 1.0, type=float),
-        "audio_max_phrase_duration": s.value("audio_max_phrase_duration", 5.0, type=float),
-        # OCR reconciler settings
-        "ocr_mt_reconciler_stability": s.value("ocr_mt_reconciler_stability", 0.2, type=float),
-        "ocr_llm_reconciler_stability": s.value("ocr_llm_reconciler_stability", 0.12, type=float),
-        "ocr_llm_reconciler_max_buffer": s.value("ocr_llm_reconciler_max_buffer", 0.6, type=float),
-        "ocr_min_words_before_translate": s.value("ocr_min_words_before_translate", 0, type=int),
-        "ocr_similarity_substring_chars": s.value("ocr_similarity_substring_chars", 15, type=int),
+@dataclass(frozen=True)
+class AppSettings:
+    """Persisted settings. Field names are the QSettings keys; read once per process, see get_app_settings()."""
+    detect_mixed_content: bool = False
+    max_words_enabled: bool = False
+    max_words_for_translation: int = 50
+    allow_overlap: bool = False
+    auto_detect_text_region: bool = False
+    llm_context_count: int = 3
+    session_output_enabled: bool = False
+    session_output_path: str = ""
+    # Audio reconciler: X sec period, Y checks, min words
+    audio_reconciler_period_sec: float = 2.0
+    audio_reconciler_num_checks: int = 4
+    audio_reconciler_min_words: int = 7
+    audio_silence_duration: float = 1.0
+    audio_max_phrase_duration: float = 5.0
+    # OCR reconciler settings
+    ocr_mt_reconciler_stability: float = 0.2
+    ocr_llm_reconciler_stability: float = 0.12
+    ocr_llm_reconciler_max_buffer: float = 0.6
+    ocr_min_words_before_translate: int = 0
+    ocr_similarity_substring_chars: int = 15
+
+    def __post_init__(self):
+        # Clamp/clean once at construction so consumers can assign fields as-is
+        for key, norm in _SETTINGS_NORMALIZERS.items():
+            object.__setattr__(self, key, norm(getattr(self, key)))
+
+
+_SETTINGS_NORMALIZERS = {
+    "max_words_for_translation": lambda v: max(1, v),
+    "llm_context_count": lambda v: max(0, v),
+    "session_output_path": lambda v: (v or "").strip(),
+    "ocr_similarity_substring_chars": lambda v: max(0, v),
+}
+_SETTINGS_FIELDS = tuple((f.name, f.default, f.type) for f in dataclass_fields(AppSettings))
 
-    }
+_SETTINGS_CACHE = None
 
 
-def save_app_settings(settings):
-    """Persist settings."""
+def get_app_settings() -> AppSettings:
+    """Load persisted settings. QSettings is read once and cached; the result is immutable so it is shared."""
+    global _SETTINGS_CACHE
+    if _SETTINGS_CACHE is None:
+        s = QSettings(_SETTINGS_ORG, _SETTINGS_APP)
+        stored = set(s.allKeys())
+        _SETTINGS_CACHE = AppSettings(**{
+            key: s.value(key, default, type=typ) if key in stored else default
+            for key, default, typ in _SETTINGS_FIELDS
+        })
+    return _SETTINGS_CACHE
+
+
+def save_app_settings(settings: AppSettings):
+    """Persist settings (only keys that differ from the cached values) and make them the cached values."""
+    global _SETTINGS_CACHE
+    current = get_app_settings()
+    if settings == current:
+        return
     s = QSettings(_SETTINGS_ORG, _SETTINGS_APP)
-    for k, v in settings.items():
-        s.setValue(k, v)
+    for key, _default, _typ in _SETTINGS_FIELDS:
+        value = getattr(settings, key)
+        if getattr(current, key) != value:
+            s.setValue(key, value)
     s.sync()
+    _SETTINGS_CACHE = settings
+
 
+_AUDIO_BUFFER_KEYS = {
+    "audio_reconciler_period_sec": "reconciler_period_sec",
+    "audio_reconciler_num_checks": "reconciler_num_checks",
+    "audio_reconciler_min_words": "reconciler_min_words",
+    "audio_silence_duration": "silence_duration",
+    "audio_max_phrase_duration": "max_phrase_duration",
+}
 
-def _apply_settings_to_translator(translator, settings):
-    """Apply settings to running translator (real-time)."""
+
+def _apply_settings_to_translator(translator, settings: AppSettings):
+    """Apply settings to running translator (real-time). Only keys that changed since the last apply are written."""
     if not translator:
         return
-    translator.detect_mixed_content = settings.get("detect_mixed_content", False)
-    translator.max_words_enabled = settings.get("max_words_enabled", False)
-    translator.max_words_for_translation = max(1, settings.get("max_words_for_translation", 50))
-    translator.allow_overlap = settings.get("allow_overlap", False)
-    translator.auto_detect_text_region = settings.get("auto_detect_text_region", False)
-    translator.session_output_enabled = settings.get("session_output_enabled", False)
-    translator.session_output_path = (settings.get("session_output_path", "") or "").strip()
-    translator._session_output_path = None
-    if not translator.auto_detect_text_region:
-        translator._text_region = None
-        translator._text_region_readings = 0
-        translator._text_region_min_y = []
-        translator._text_region_max_y = []
+    last = getattr(translator, "_last_applied_settings", None)
+    if last == settings:
+        return
+    translator._last_applied_settings = settings
+    changed = {
+        key for key, _default, _typ in _SETTINGS_FIELDS
+        if last is None or getattr(last, key) != getattr(settings, key)
+    }
+    if "detect_mixed_content" in changed:
+        translator.detect_mixed_content = settings.detect_mixed_content
+    if "max_words_enabled" in changed:
+        translator.max_words_enabled = settings.max_words_enabled
+    if "max_words_for_translation" in changed:
+        translator.max_words_for_translation = settings.max_words_for_translation
+    if "allow_overlap" in changed:
+        translator.allow_overlap = settings.allow_overlap
+    if "auto_detect_text_region" in changed:
+        translator.auto_detect_text_region = settings.auto_detect_text_region
+        if not translator.auto_detect_text_region:
+            translator._text_region = None
+            translator._text_region_readings = 0
+            translator._text_region_min_y = []
+            translator._text_region_max_y = []
+    if "session_output_enabled" in changed or "session_output_path" in changed:
+        translator.session_output_enabled = settings.session_output_enabled
+        translator.session_output_path = settings.session_output_path
+        translator._session_output_path = None
     # OCR reconciler: update settings dynamically
-    if hasattr(translator, "reconciler") and translator.reconciler:
-        translator.reconciler.stability_threshold = settings.get("ocr_mt_reconciler_stability", 0.2)
-    if hasattr(translator, "llm_reconciler") and translator.llm_reconciler:
-        translator.llm_reconciler.stability_threshold = settings.get("ocr_llm_reconciler_stability", 0.12)
-        translator.llm_reconciler.max_buffer_time = settings.get("ocr_llm_reconciler_max_buffer", 0.6)
+    if "ocr_mt_reconciler_stability" in changed and getattr(translator, "reconciler", None):
+        translator.reconciler.stability_threshold = settings.ocr_mt_reconciler_stability
+    if getattr(translator, "llm_reconciler", None):
+        if "ocr_llm_reconciler_stability" in changed:
+            translator.llm_reconciler.stability_threshold = settings.ocr_llm_reconciler_stability
+        if "ocr_llm_reconciler_max_buffer" in changed:
+            translator.llm_reconciler.max_buffer_time = settings.ocr_llm_reconciler_max_buffer
     # Store min words setting for use in OCR processing
-    translator.ocr_min_words_before_translate = settings.get("ocr_min_words_before_translate", 0)
-    translator.ocr_similarity_substring_chars = max(0, settings.get("ocr_similarity_substring_chars", 15))
-    translator.llm_context_count = max(0, settings.get("llm_context_count", 3))
+    if "ocr_min_words_before_translate" in changed:
+        translator.ocr_min_words_before_translate = settings.ocr_min_words_before_translate
+    if "ocr_similarity_substring_chars" in changed:
+        translator.ocr_similarity_substring_chars = settings.ocr_similarity_substring_chars
+    if "llm_context_count" in changed:
+        translator.llm_context_count = settings.llm_context_count
     # Audio mode: mutable settings for real-time tuning
-    if hasattr(translator, "audio_buffer_settings"):
+    if hasattr(translator, "audio_buffer_settings") and not changed.isdisjoint(_AUDIO_BUFFER_KEYS):
         translator.audio_buffer_settings.update({
-            "reconciler_period_sec": settings.get("audio_reconciler_period_sec", 2.0),
-            "reconciler_num_checks": settings.get("audio_reconciler_num_checks", 4),
-            "reconciler_min_words": settings.get("audio_reconciler_min_words", 7),
-            "silence_duration": settings.get("audio_silence_duration", 1.0),
-            "max_phrase_duration": settings.get("audio_max_phrase_duration", 5.0),
+            buf_key: getattr(settings, key) for key, buf_key in _AUDIO_BUFFER_KEYS.items()
         })
 
 
-def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr"):
-    """Show settings dialog. Apply = real-time update; OK = save and close; Cancel = discard."""
-    settings = get_app_settings()
-    dlg = QDialog(parent)
-    dlg.setWindowTitle("Settings")
-    dlg.setMinimumWidth(420)
-    dlg.setStyleSheet(f"""
-        QDialog {{ background: rgba(255, 255, 255, 0.92); }}
-        QLabel {{ color: #333; font-size: 13px; }}
-        QCheckBox {{ color: #333; font-size: 13px; }}
-        QPushButton {{ background: {_BILIBILI_BLUE}; color: white; border: none; border-radius: 8px; padding: 10px 18px; }}
-        QPushButton:hover {{ background: #0090bc; }}
-        QDialogButtonBox QPushButton[text="OK"] {{ background: {_BILIBILI_BLUE}; }}
-        QDialogButtonBox QPushButton[text="Cancel"] {{ background: #aaa; color: #333; }}
-        QTabWidget::pane {{ border: 1px solid #ddd; border-radius: 6px; }}
-        QDoubleSpinBox, QSpinBox {{ min-width: 80px; }}
-    """)
-    layout = QVBoxLayout(dlg)
-    layout.setSpacing(14)
-    layout.setContentsMargins(24, 24, 24, 24)
-    title = QLabel("Settings")
-    title.setStyleSheet(f"color: {_BILIBILI_PURPLE}; font-size: 18px; font-weight: bold;")
-    layout.addWidget(title)
-    tabs = QTabWidget()
-    
-    # --- General tab (shared) ---
+_STABILITY_TOOLTIP = "Stability threshold: How long OCR text must remain unchanged before sending for translation.\n\nLower = faster translation (may catch incomplete text)\nHigher = waits longer for complete text (more accurate)"
+
+# Settings dialog tooltips shared by a setting's label and its input widget
+_TOOLTIPS = {
+    "llm_context_count": "Number of previous translations to include in LLM prompt for context.\n\nHelps with topic/name consistency and terminology. Higher = more context but longer prompts.\n0 = no context (faster, less consistent)",
+    "ocr_mt_reconciler_stability": _STABILITY_TOOLTIP,
+    "ocr_llm_reconciler_stability": _STABILITY_TOOLTIP,
+    "ocr_llm_reconciler_max_buffer": "Max buffer time: Maximum time to wait before forcing translation (even if text is still changing).\n\nPrevents long delays when text keeps updating. If text hasn't stabilized after this time, it sends anyway.",
+    "ocr_min_words_before_translate": "Don't translate if text has fewer than this many words.\n\n0 = translate any length (default)\nUseful to filter out noise from partial OCR captures or very short text.",
+    "ocr_similarity_substring_chars": "When new text contains recently translated text as a substring, skip translation if the extra chars are ≤ this value.\n\nHigher = more aggressive dedup (fewer repeated translations)\nLower = less dedup (may translate similar text again)",
+}
+
+# Value readers for settings widgets registered in the settings dialog
+_GETTERS = {
+    QSpinBox: QSpinBox.value,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+    QCheckBox: QCheckBox.isChecked,
+    QLineEdit: lambda w: w.text().strip(),
+}
+
+
+def _build_general_tab(settings, reg):
+    """General tab (shared). reg(key, widget) registers each settings widget."""
     general = QWidget()
     general_layout = QVBoxLayout(general)
     session_output_cb = QCheckBox("Save session to JSON (OCR, translations, model used)")
-    session_output_cb.setChecked(settings.get("session_output_enabled", False))
+    session_output_cb.setChecked(settings.session_output_enabled)
     session_output_cb.setToolTip("When enabled: writes session data to a JSON file every ~10 translations.")
     general_layout.addWidget(session_output_cb)
     session_path_row = QHBoxLayout()
     session_path_edit = QLineEdit()
     session_path_edit.setPlaceholderText("Default: app directory")
-    session_path_edit.setText(settings.get("session_output_path", "") or "")
+    session_path_edit.setText(settings.session_output_path)
     session_path_row.addWidget(QLabel("Output path:"))
     session_path_row.addWidget(session_path_edit)
     browse_btn = QPushButton("Browse...")
     def pick_session_dir():
         current = session_path_edit.text().strip()
-        start = current if current and os.path.isdir(current) else os.path.expanduser("~")
-        path = QFileDialog.getExistingDirectory(dlg, "Session output directory", start)
+        path = QFileDialog.getExistingDirectory(general.window(), "Session output directory", _resolve_start_dir(current))
         if path:
             session_path_edit.setText(path)
     browse_btn.clicked.connect(pick_session_dir)
@@ -858,13 +999,12 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     # LLM context count
     general_layout.addWidget(QLabel(""))  # Spacer
     llm_context_label = QLabel("LLM context count (previous translations):")
-    llm_context_tooltip = "Number of previous translations to include in LLM prompt for context.\n\nHelps with topic/name consistency and terminology. Higher = more context but longer prompts.\n0 = no context (faster, less consistent)"
-    llm_context_label.setToolTip(llm_context_tooltip)
+    llm_context_label.setToolTip(_TOOLTIPS["llm_context_count"])
     llm_context_spin = QSpinBox()
     llm_context_spin.setRange(0, 10)
     llm_context_spin.setSuffix(" translations")
-    llm_context_spin.setValue(settings.get("llm_context_count", 3))
-    llm_context_spin.setToolTip(llm_context_tooltip)
+    llm_context_spin.setValue(settings.llm_context_count)
+    llm_context_spin.setToolTip(_TOOLTIPS["llm_context_count"])
     llm_context_row = QHBoxLayout()
     llm_context_row.addWidget(llm_context_label)
     llm_context_row.addWidget(llm_context_spin)
@@ -872,20 +1012,41 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     general_layout.addLayout(llm_context_row)
     
     general_layout.addStretch()
-    tabs.addTab(general, "General")
-    
-    # --- OCR tab ---
+    reg("session_output_enabled", session_output_cb)
+    reg("session_output_path", session_path_edit)
+    reg("llm_context_count", llm_context_spin)
+    return general
+
+
+def _make_spin_row(form, label_text, tooltip, range_, step, suffix, value, cls=QDoubleSpinBox):
+    """Add a labelled spin box row to form (label and spin share the tooltip). Returns the spin box."""
+    lbl = QLabel(label_text)
+    lbl.setToolTip(tooltip)
+    sp = cls()
+    sp.setRange(*range_)
+    if step is not None:
+        sp.setSingleStep(step)
+    if suffix:
+        sp.setSuffix(suffix)
+    sp.setValue(value)
+    sp.setToolTip(tooltip)
+    form.addRow(lbl, sp)
+    return sp
+
+
+def _build_ocr_tab(settings, reg):
+    """OCR tab."""
     ocr_tab = QWidget()
     ocr_layout = QVBoxLayout(ocr_tab)
     detect_mixed_cb = QCheckBox("Detect mixed content (warn if OCR area captures static content besides subtitles)")
-    detect_mixed_cb.setChecked(settings.get("detect_mixed_content", False))
+    detect_mixed_cb.setChecked(settings.detect_mixed_content)
     ocr_layout.addWidget(detect_mixed_cb)
     max_words_cb = QCheckBox("Disable translation if text exceeds")
-    max_words_cb.setChecked(settings.get("max_words_enabled", False))
+    max_words_cb.setChecked(settings.max_words_enabled)
     max_words_spin = QSpinBox()
     max_words_spin.setRange(1, 500)
     max_words_spin.setSuffix(" words")
-    max_words_spin.setValue(settings.get("max_words_for_translation", 50))
+    max_words_spin.setValue(settings.max_words_for_translation)
     max_words_spin.setToolTip("Typical subtitles are 5–50 words; large values suggest UI/metadata capture.")
     max_words_spin.setEnabled(max_words_cb.isChecked())
     max_words_cb.toggled.connect(max_words_spin.setEnabled)
@@ -895,10 +1056,10 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     max_words_row.addStretch()
     ocr_layout.addLayout(max_words_row)
     auto_detect_cb = QCheckBox("Auto-detect OCR text area (learn from first few readings)")
-    auto_detect_cb.setChecked(settings.get("auto_detect_text_region", False))
+    auto_detect_cb.setChecked(settings.auto_detect_text_region)
     ocr_layout.addWidget(auto_detect_cb)
     allow_overlap_cb = QCheckBox("Allow overlay overlap with OCR area (causes flickering)")
-    allow_overlap_cb.setChecked(settings.get("allow_overlap", False))
+    allow_overlap_cb.setChecked(settings.allow_overlap)
     allow_overlap_cb.setToolTip("When unchecked (default): overlap pauses OCR and shows a message. When checked: overlay hides briefly during capture, causing flicker.")
     ocr_layout.addWidget(allow_overlap_cb)
     
@@ -914,68 +1075,38 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     reconciler_form = QFormLayout()
     
     # MT Reconciler (StreamingReconciler)
-    mt_stability_label = QLabel("MT Stability threshold:")
-    mt_stability_tooltip = "Stability threshold: How long OCR text must remain unchanged before sending for translation.\n\nLower = faster translation (may catch incomplete text)\nHigher = waits longer for complete text (more accurate)"
-    mt_stability_label.setToolTip(mt_stability_tooltip)
-    ocr_mt_stability = QDoubleSpinBox()
-    ocr_mt_stability.setRange(0.1, 2.0)
-    ocr_mt_stability.setSingleStep(0.1)
-    ocr_mt_stability.setSuffix(" s")
-    ocr_mt_stability.setValue(settings.get("ocr_mt_reconciler_stability", 0.2))
-    ocr_mt_stability.setToolTip(mt_stability_tooltip)
-    reconciler_form.addRow(mt_stability_label, ocr_mt_stability)
-    
+    reg("ocr_mt_reconciler_stability", _make_spin_row(
+        reconciler_form, "MT Stability threshold:", _TOOLTIPS["ocr_mt_reconciler_stability"],
+        (0.1, 2.0), 0.1, " s", settings.ocr_mt_reconciler_stability))
     # LLM Reconciler settings
-    llm_stability_label = QLabel("LLM Stability threshold:")
-    llm_stability_tooltip = "Stability threshold: How long OCR text must remain unchanged before sending for translation.\n\nLower = faster translation (may catch incomplete text)\nHigher = waits longer for complete text (more accurate)"
-    llm_stability_label.setToolTip(llm_stability_tooltip)
-    ocr_llm_stability = QDoubleSpinBox()
-    ocr_llm_stability.setRange(0.05, 1.0)
-    ocr_llm_stability.setSingleStep(0.05)
-    ocr_llm_stability.setSuffix(" s")
-    ocr_llm_stability.setValue(settings.get("ocr_llm_reconciler_stability", 0.12))
-    ocr_llm_stability.setToolTip(llm_stability_tooltip)
-    reconciler_form.addRow(llm_stability_label, ocr_llm_stability)
-    
-    llm_max_buffer_label = QLabel("LLM Max buffer time:")
-    llm_max_buffer_tooltip = "Max buffer time: Maximum time to wait before forcing translation (even if text is still changing).\n\nPrevents long delays when text keeps updating. If text hasn't stabilized after this time, it sends anyway."
-    llm_max_buffer_label.setToolTip(llm_max_buffer_tooltip)
-    ocr_llm_max_buffer = QDoubleSpinBox()
-    ocr_llm_max_buffer.setRange(0.2, 3.0)
-    ocr_llm_max_buffer.setSingleStep(0.1)
-    ocr_llm_max_buffer.setSuffix(" s")
-    ocr_llm_max_buffer.setValue(settings.get("ocr_llm_reconciler_max_buffer", 0.6))
-    ocr_llm_max_buffer.setToolTip(llm_max_buffer_tooltip)
-    reconciler_form.addRow(llm_max_buffer_label, ocr_llm_max_buffer)
-    
+    reg("ocr_llm_reconciler_stability", _make_spin_row(
+        reconciler_form, "LLM Stability threshold:", _TOOLTIPS["ocr_llm_reconciler_stability"],
+        (0.05, 1.0), 0.05, " s", settings.ocr_llm_reconciler_stability))
+    reg("ocr_llm_reconciler_max_buffer", _make_spin_row(
+        reconciler_form, "LLM Max buffer time:", _TOOLTIPS["ocr_llm_reconciler_max_buffer"],
+        (0.2, 3.0), 0.1, " s", settings.ocr_llm_reconciler_max_buffer))
     # Minimum words before sending
-    min_words_label = QLabel("Minimum words before send:")
-    min_words_tooltip = "Don't translate if text has fewer than this many words.\n\n0 = translate any length (default)\nUseful to filter out noise from partial OCR captures or very short text."
-    min_words_label.setToolTip(min_words_tooltip)
-    ocr_min_words = QSpinBox()
-    ocr_min_words.setRange(0, 50)
-    ocr_min_words.setSuffix(" words")
-    ocr_min_words.setValue(settings.get("ocr_min_words_before_translate", 0))
-    ocr_min_words.setToolTip(min_words_tooltip)
-    reconciler_form.addRow(min_words_label, ocr_min_words)
-    
+    reg("ocr_min_words_before_translate", _make_spin_row(
+        reconciler_form, "Minimum words before send:", _TOOLTIPS["ocr_min_words_before_translate"],
+        (0, 50), None, " words", settings.ocr_min_words_before_translate, cls=QSpinBox))
     # Similarity threshold for avoiding repeated translations
-    similarity_label = QLabel("Similarity: substring extension (chars):")
-    similarity_tooltip = "When new text contains recently translated text as a substring, skip translation if the extra chars are ≤ this value.\n\nHigher = more aggressive dedup (fewer repeated translations)\nLower = less dedup (may translate similar text again)"
-    similarity_label.setToolTip(similarity_tooltip)
-    ocr_similarity_chars = QSpinBox()
-    ocr_similarity_chars.setRange(0, 50)
-    ocr_similarity_chars.setSuffix(" chars")
-    ocr_similarity_chars.setValue(settings.get("ocr_similarity_substring_chars", 15))
-    ocr_similarity_chars.setToolTip(similarity_tooltip)
-    reconciler_form.addRow(similarity_label, ocr_similarity_chars)
+    reg("ocr_similarity_substring_chars", _make_spin_row(
+        reconciler_form, "Similarity: substring extension (chars):", _TOOLTIPS["ocr_similarity_substring_chars"],
+        (0, 50), None, " chars", settings.ocr_similarity_substring_chars, cls=QSpinBox))
     
     ocr_layout.addLayout(reconciler_form)
     
     ocr_layout.addStretch()
-    tabs.addTab(ocr_tab, "OCR")
-    
-    # --- Audio tab: reconciler (X sec period, Y checks) ---
+    reg("detect_mixed_content", detect_mixed_cb)
+    reg("max_words_enabled", max_words_cb)
+    reg("max_words_for_translation", max_words_spin)
+    reg("allow_overlap", allow_overlap_cb)
+    reg("auto_detect_text_region", auto_detect_cb)
+    return ocr_tab
+
+
+def _build_audio_tab(settings, reg):
+    """Audio tab: reconciler (X sec period, Y checks)."""
     audio_tab = QWidget()
     audio_layout = QFormLayout(audio_tab)
     audio_layout.addRow(QLabel("Reconciler: within X seconds, check Y times for sentence completion:"))
@@ -983,17 +1114,17 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     audio_reconciler_period.setRange(0.5, 5.0)
     audio_reconciler_period.setSingleStep(0.5)
     audio_reconciler_period.setSuffix(" s")
-    audio_reconciler_period.setValue(settings.get("audio_reconciler_period_sec", 2.0))
+    audio_reconciler_period.setValue(settings.audio_reconciler_period_sec)
     audio_reconciler_period.setToolTip("Max seconds before forcing send (X).")
     audio_layout.addRow("Period (X sec):", audio_reconciler_period)
     audio_reconciler_checks = QSpinBox()
     audio_reconciler_checks.setRange(2, 20)
-    audio_reconciler_checks.setValue(settings.get("audio_reconciler_num_checks", 4))
+    audio_reconciler_checks.setValue(settings.audio_reconciler_num_checks)
     audio_reconciler_checks.setToolTip("Number of completion checks in that period (Y).")
     audio_layout.addRow("Num checks (Y):", audio_reconciler_checks)
     audio_reconciler_min_words = QSpinBox()
     audio_reconciler_min_words.setRange(1, 50)
-    audio_reconciler_min_words.setValue(settings.get("audio_reconciler_min_words", 7))
+    audio_reconciler_min_words.setValue(settings.audio_reconciler_min_words)
     audio_reconciler_min_words.setToolTip("Minimum word count before sending.")
     audio_layout.addRow("Min words:", audio_reconciler_min_words)
     audio_layout.addRow(QLabel(""))
@@ -1002,42 +1133,86 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     audio_silence.setRange(0.3, 3.0)
     audio_silence.setSingleStep(0.1)
     audio_silence.setSuffix(" s")
-    audio_silence.setValue(settings.get("audio_silence_duration", 1.0))
+    audio_silence.setValue(settings.audio_silence_duration)
     audio_silence.setToolTip("Silence duration to finalize a phrase.")
     audio_layout.addRow("Silence duration (finalize):", audio_silence)
     audio_max_phrase = QDoubleSpinBox()
     audio_max_phrase.setRange(2.0, 15.0)
     audio_max_phrase.setSingleStep(0.5)
     audio_max_phrase.setSuffix(" s")
-    audio_max_phrase.setValue(settings.get("audio_max_phrase_duration", 5.0))
+    audio_max_phrase.setValue(settings.audio_max_phrase_duration)
     audio_max_phrase.setToolTip("Force finalize after this many seconds of speech.")
     audio_layout.addRow("Max phrase duration:", audio_max_phrase)
     audio_layout.addRow(QLabel("Changes apply in real time when you click Apply."))
-    tabs.addTab(audio_tab, "Audio")
-    
+    reg("audio_reconciler_period_sec", audio_reconciler_period)
+    reg("audio_reconciler_num_checks", audio_reconciler_checks)
+    reg("audio_reconciler_min_words", audio_reconciler_min_words)
+    reg("audio_silence_duration", audio_silence)
+    reg("audio_max_phrase_duration", audio_max_phrase)
+    return audio_tab
+
+
+_DIALOG_QSS = f"""
+    QDialog {{ background: rgba(255, 255, 255, 0.92); }}
+    QLabel {{ color: #333; font-size: 13px; }}
+    QCheckBox {{ color: #333; font-size: 13px; }}
+    QPushButton {{ background: {_BILIBILI_BLUE}; color: white; border: none; border-radius: 8px; padding: 10px 18px; }}
+    QPushButton:hover {{ background: #0090bc; }}
+    QDialogButtonBox QPushButton[text="OK"] {{ background: {_BILIBILI_BLUE}; }}
+    QDialogButtonBox QPushButton[text="Cancel"] {{ background: #aaa; color: #333; }}
+    QTabWidget::pane {{ border: 1px solid #ddd; border-radius: 6px; }}
+    QDoubleSpinBox, QSpinBox {{ min-width: 80px; }}
+"""
+_TITLE_QSS = f"color: {_BILIBILI_PURPLE}; font-size: 18px; font-weight: bold;"
+
+# Settings dialog tabs, built on first visit: (title, builder)
+_SETTINGS_TABS = (
+    ("General", _build_general_tab),
+    ("OCR", _build_ocr_tab),
+    ("Audio", _build_audio_tab),
+)
+
+
+def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr"):
+    """Show settings dialog. Apply = real-time update; OK = save and close; Cancel = discard."""
+    settings = get_app_settings()
+    dlg = QDialog(parent)
+    dlg.setUpdatesEnabled(False)  # build everything, then paint once
+    dlg.setWindowTitle("Settings")
+    dlg.setMinimumWidth(420)
+    dlg.setStyleSheet(_DIALOG_QSS)
+    layout = QVBoxLayout(dlg)
+    layout.setSpacing(14)
+    layout.setContentsMargins(24, 24, 24, 24)
+    title = QLabel("Settings")
+    title.setStyleSheet(_TITLE_QSS)
+    layout.addWidget(title)
+    tabs = QTabWidget()
+    # Empty pages up front; each tab's widgets are built the first time it is shown
+    registry = []  # (setting key, widget) for every built settings widget
+    built_tabs = set()
+    for tab_title, _ in _SETTINGS_TABS:
+        tabs.addTab(QWidget(), tab_title)
+
+    def reg(key, widget):
+        registry.append((key, widget))
+
+    def ensure_tab_built(index):
+        if index in built_tabs or not 0 <= index < len(_SETTINGS_TABS):
+            return
+        built_tabs.add(index)
+        content = _SETTINGS_TABS[index][1](settings, reg)
+        page_layout = QVBoxLayout(tabs.widget(index))
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(content)
+
+    tabs.currentChanged.connect(ensure_tab_built)
+    ensure_tab_built(tabs.currentIndex())
     layout.addWidget(tabs)
     
     def gather_settings():
-        return {
-            "detect_mixed_content": detect_mixed_cb.isChecked(),
-            "max_words_enabled": max_words_cb.isChecked(),
-            "max_words_for_translation": max_words_spin.value(),
-            "allow_overlap": allow_overlap_cb.isChecked(),
-            "auto_detect_text_region": auto_detect_cb.isChecked(),
-            "session_output_enabled": session_output_cb.isChecked(),
-            "session_output_path": session_path_edit.text().strip(),
-            "audio_reconciler_period_sec": audio_reconciler_period.value(),
-            "audio_reconciler_num_checks": audio_reconciler_checks.value(),
-            "audio_reconciler_min_words": audio_reconciler_min_words.value(),
-            "audio_silence_duration": audio_silence.value(),
-            "audio_max_phrase_duration": audio_max_phrase.value(),
-            "ocr_mt_reconciler_stability": ocr_mt_stability.value(),
-            "ocr_llm_reconciler_stability": ocr_llm_stability.value(),
-            "ocr_llm_reconciler_max_buffer": ocr_llm_max_buffer.value(),
-            "ocr_min_words_before_translate": ocr_min_words.value(),
-            "ocr_similarity_substring_chars": ocr_similarity_chars.value(),
-            "llm_context_count": llm_context_spin.value(),
-        }
+        # Tabs never opened keep their stored values
+        return dataclass_replace(settings, **{k: _GETTERS[type(w)](w) for k, w in registry})
     
     def do_apply():
         s = gather_settings()
@@ -1057,7 +1232,8 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     btns2.rejected.connect(dlg.reject)
     btns.addWidget(btns2)
     layout.addLayout(btns)
-    dlg.installEventFilter(_DialogRaiseFilter(dlg))
+    _install_dialog_raise_filter(dlg)
+    dlg.setUpdatesEnabled(True)
     if dlg.exec_() == QDialog.Accepted:
         s = gather_settings()
         save_app_settings(s)
@@ -1066,6 +1242,13 @@ def show_settings_dialog(parent=None, translator=None, transcription_mode="ocr")
     return False
 
 
+_LANG_MENU_QSS = f"""
+    QListView {{ background: white; border: 1px solid {_BILIBILI_BLUE}; }}
+    QListView::item {{ padding: 4px 8px; min-height: 24px; }}
+    QListView::item:selected {{ background: {_BILIBILI_BLUE}; color: white; }}
+"""
+
+
 class _LanguageSelector(QPushButton):
     """Dropdown that shows a fixed-height scrollable list (avoids broken native combos on macOS)."""
     # (label, code) tuples, selected index
@@ -1088,20 +1271,18 @@ class _LanguageSelector(QPushButton):
         container = QWidget()
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
-        lst = QListWidget()
+        # Model/view list: one model reset, rows painted only when visible
+        lst = QListView()
         lst.setFixedHeight(200)
         lst.setMinimumWidth(220)
         lst.setUniformItemSizes(True)
-        lst.setStyleSheet(f"""
-            QListWidget {{ background: white; border: 1px solid {_BILIBILI_BLUE}; }}
-            QListWidget::item {{ padding: 4px 8px; min-height: 24px; }}
-            QListWidget::item:selected {{ background: {_BILIBILI_BLUE}; color: white; }}
-        """)
-        for lbl, _ in self._items:
-            lst.addItem(lbl)
-        lst.setCurrentRow(self._idx)
-        lst.currentRowChanged.connect(self._on_row_changed)
-        lst.itemClicked.connect(lambda item: self._menu.close())
+        lst.setEditTriggers(QListView.NoEditTriggers)
+        lst.setStyleSheet(_LANG_MENU_QSS)
+        self._model = QStringListModel([lbl for lbl, _ in self._items], lst)
+        lst.setModel(self._model)
+        lst.setCurrentIndex(self._model.index(self._idx))
+        lst.selectionModel().currentRowChanged.connect(lambda cur, _prev: self._on_row_changed(cur.row()))
+        lst.clicked.connect(lambda _index: self._menu.close())
         layout.addWidget(lst)
         act = QWidgetAction(self._menu)
         act.setDefaultWidget(container)
@@ -1118,7 +1299,7 @@ class _LanguageSelector(QPushButton):
 
     def showMenu(self):
         self._build_menu()
-        self._list.setCurrentRow(self._idx)
+        self._list.setCurrentIndex(self._model.index(self._idx))
         self._menu.exec_(self.mapToGlobal(self.rect().bottomLeft()))
 
     def mousePressEvent(self, e):
@@ -1134,6 +1315,12 @@ class DraggableTitleBar(QWidget):
         super().__init__(parent)
         self._drag_start = None
         self._window_start = None
+        # Window moves are coalesced to ~60 Hz; only the latest delta is applied
+        self._pending_delta = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -1143,22 +1330,340 @@ class DraggableTitleBar(QWidget):
 
     def mouseMoveEvent(self, event):
         if self._drag_start is not None:
-            delta = event.globalPos() - self._drag_start
-            self.window().move(self._window_start + delta)
+            self._pending_delta = event.globalPos() - self._drag_start
+            if not self._move_timer.isActive():
+                self._move_timer.start()
         else:
             super().mouseMoveEvent(event)
 
+    def _flush_move(self):
+        if self._pending_delta is None or self._window_start is None:
+            return
+        self.window().move(self._window_start + self._pending_delta)
+        self._pending_delta = None
+
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
+            self._move_timer.stop()
+            self._flush_move()
             self._drag_start = None
         super().mouseReleaseEvent(event)
 
 
+_LEARN_OVERLAY_QSS = """
+    QWidget#LearnOverlayWidget {
+        background: rgba(28, 24, 42, 0.85);
+        border: none;
+        border-radius: 8px;
+    }
+"""
+_LEARN_TITLEROW_QSS = """
+    background: rgba(28, 24, 42, 0.85);
+    border: 1px solid rgba(0, 161, 214, 0.3);
+    border-radius: 4px;
+"""
+_LEARN_TAB_BTN_QSS = """
+    QPushButton {
+        background: rgba(0, 161, 214, 0.0);
+        color: white;
+        border: 0px solid rgba(0, 161, 214, 1.0);
+        border-radius: 3px;
+        padding: 4px 12px;
+        font-size: 12px;
+    }
+    QPushButton:hover { background: rgba(0, 161, 214, 0.4); }
+    QPushButton:checked { background: rgba(0, 161, 214, 0.7); }
+"""
+_LEARN_SAVE_BTN_QSS = """
+    QPushButton {
+        background: rgba(0, 161, 214, 0.6);
+        color: white;
+        border: 0px solid rgba(0, 161, 214, 0.5);
+        border-radius: 4px;
+        padding: 4px 12px;
+        font-size: 12px;
+    }
+    QPushButton:hover { background: rgba(0, 161, 214, 0.8); }
+    QPushButton:pressed { background: rgba(0, 161, 214, 1); }
+"""
+_LEARN_TOOLTIP_QSS = """
+    background: rgba(0, 0, 0, 0.8);
+    color: white;
+    padding: 6px 12px;
+    border-radius: 4px;
+    font-size: 12px;
+    font-weight: bold;
+"""
+_LEARN_TITLE_QSS = "color: white; font-size: 14px; font-weight: bold; padding: 0; margin: 0; background: transparent; border: none;"
+_LEARN_SEP_QSS = "background: rgba(255,255,255,0.4);"
+_LEARN_STACK_QSS = "QStackedWidget { background: rgba(28, 24, 42, 0.85); border: 1px solid rgba(0, 161, 214, 0.3); border-radius: 6px; }"
+_LEARN_RESIZE_HANDLE_QSS = """
+    color: rgba(0, 161, 214, 0.7);
+    font-size: 10px;
+    padding: 6px 4px;
+    background: rgba(28, 24, 42, 0.85);
+    border: 1px solid rgba(0, 161, 214, 0.3);
+    border-radius: 4px;
+"""
+_LEARN_PLACEHOLDER_QSS = "color: rgba(255, 255, 255, 0.6); font-size: 12px; "  # + padding
+# Shared by the Live and Starred keyword lists
+_LEARN_LIST_QSS = """
+    QListWidget {
+        background: rgba(28, 24, 42, 0.75);
+        border: none;
+        border-radius: 6px;
+        color: rgba(255, 255, 255, 0.95);
+        padding: 4px;
+    }
+    QListWidget::item {
+        border: none;
+        border-radius: 4px;
+        padding: 4px 6px;
+        margin: 2px 0px;
+        background: rgba(255, 255, 255, 0.05);
+        min-height: 50px;
+    }
+    QListWidget::item:hover {
+        background: rgba(255, 255, 255, 0.1);
+        border: none;
+    }
+    QListWidget::item:selected {
+        background: rgba(0, 161, 214, 0.3);
+        border: none;
+    }
+    QListWidget::item:selected:hover {
+        background: rgba(0, 161, 214, 0.3);
+        border: none;
+    }
+    QScrollBar:vertical {
+        background: rgba(255, 255, 255, 0.1);
+        width: 8px;
+        border: none;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(255, 255, 255, 0.3);
+        border-radius: 4px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: rgba(255, 255, 255, 0.5);
+    }
+"""
+
+
+# Markdown table cell escaping for _save_to_markdown: one C-level pass per cell
+_MD_CELL_TRANS = str.maketrans({"|": "\\|", "\n": " "})
+
+def _prepare_keyword_entries(keywords):
+    """Normalize extracted keywords to {word, pinyin, definition[, _metadata]} dicts, dropping empty and
+    repeated words. Pure Python; runs on the learn worker thread so LearnOverlay.update_keywords only adds rows."""
+    entries = {}
+    for kw in keywords:
+        word = kw.get("word", "")
+        if not word or word in entries:
+            continue
+        # Common words recur across subtitles: intern so repeats share one string (and cache keys compare by identity)
+        word = sys.intern(word)
+        pinyin = sys.intern(kw.get("pinyin", "") or "")
+        definition = kw.get("definition", "") or ""
+        if len(definition) < 200:
+            definition = sys.intern(definition)
+        entry = {"word": word, "pinyin": pinyin, "definition": definition}
+        # Preserve metadata if present
+        if "_metadata" in kw:
+            entry["_metadata"] = kw["_metadata"]
+        entries[word] = entry
+    return list(entries.values())
+
+
+_STARRED_EMPTY_TEXT = "No starred words. Click ★ on words in Live tab to add."
+
+_KW_DEF_WIDTH = 170  # Definition wrap width in pixels
+_KW_LINE_CACHE_MAX = 8192
+
+_KEYWORD_FONTS = None
+
+
+def _keyword_fonts():
+    """Keyword row fonts and metrics, built once and shared by every list and delegate.
+    Returns (word_font, text_font, word_metrics, text_metrics, text_line_height); 14px bold word, 12px text."""
+    global _KEYWORD_FONTS
+    if _KEYWORD_FONTS is None:
+        word_font = QFont()
+        word_font.setPixelSize(14)
+        word_font.setBold(True)
+        text_font = QFont()
+        text_font.setPixelSize(12)
+        text_metrics = QFontMetrics(text_font)
+        _KEYWORD_FONTS = (word_font, text_font, QFontMetrics(word_font), text_metrics, text_metrics.lineSpacing())
+    return _KEYWORD_FONTS
+
+
+_STAR_PIX_CACHE: dict[tuple[bool, bool], QPixmap] = {}
+
+
+def _star_pixmap(on: bool, hover: bool = False) -> QPixmap:
+    """28x28 star glyph (★/☆ in #FFD700, #FFA500 on hover), rasterized once at the screen's pixel ratio."""
+    key = (on, hover)
+    pix = _STAR_PIX_CACHE.get(key)
+    if pix is None:
+        dpr = QApplication.instance().devicePixelRatio()
+        font = QFont()
+        font.setPixelSize(16)
+        pix = QPixmap(int(28 * dpr), int(28 * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.transparent)
+        painter = QPainter(pix)
+        painter.setFont(font)
+        painter.setPen(QColor("#FFA500" if hover else "#FFD700"))
+        painter.drawText(QRect(0, 0, 28, 28), Qt.AlignCenter, "★" if on else "☆")
+        painter.end()
+        _STAR_PIX_CACHE[key] = pix
+    return pix
+
+
+# Keyword list item data: the keyword dict ({word, pinyin, definition[, _metadata]}) and its starred flag
+_KW_ROLE = Qt.UserRole
+_KW_STARRED_ROLE = Qt.UserRole + 1
+
+
+class _KwRef:
+    """Item data holder for a keyword dict. A bare dict would be converted to a QVariantMap and back on every data()."""
+    __slots__ = ("kw",)
+
+    def __init__(self, kw):
+        self.kw = kw
+
+
+def _item_kw(obj):
+    """Keyword dict stored on a QListWidgetItem or QModelIndex, or None."""
+    ref = obj.data(_KW_ROLE)
+    return ref.kw if ref is not None else None
+
+
+class _KeywordDelegate(QStyledItemDelegate):
+    """Paints a keyword row (word │ pinyin, definition, star) from item data; no per-row widgets.
+    The star is a cached pixmap; a click inside its rect (editorEvent) calls on_star(index). Never creates editors.
+    Hovering the star (tracked by an event filter on the view's viewport) highlights it and shows a pointing hand."""
+    _STATIC_CACHE_MAX = 2048
+    _STAR_SIZE = 28
+    _WORD_COLOR = QColor(255, 255, 255)
+    _SEP_COLOR = QColor(255, 255, 255, 77)
+    _PINYIN_COLOR = QColor("#B5BCC5")
+    _DEF_COLOR = QColor(255, 255, 255, 230)
+
+    def __init__(self, on_star, star_tooltip, parent=None):
+        super().__init__(parent)
+        self._on_star = on_star
+        self._star_tooltip = star_tooltip
+        word_font, text_font, self._word_fm, self._text_fm, _line_h = _keyword_fonts()
+        self._fonts = (word_font, text_font)
+        self._static: dict[tuple, QStaticText] = {}  # (font idx, text, wrap width) -> prepared QStaticText
+        self._hover = QPersistentModelIndex()  # row whose star is under the mouse
+        self._view = parent
+        if parent is not None:
+            parent.viewport().setMouseTracking(True)
+            parent.viewport().installEventFilter(self)
+
+    def _static_text(self, font_idx, text, width=0):
+        key = (font_idx, text, width)
+        st = self._static.get(key)
+        if st is None:
+            if len(self._static) >= self._STATIC_CACHE_MAX:
+                self._static.clear()
+            st = QStaticText(text)
+            st.setTextFormat(Qt.PlainText)
+            if width > 0:
+                st.setTextWidth(width)
+            st.prepare(QTransform(), self._fonts[font_idx])
+            self._static[key] = st
+        return st
+
+    def _star_rect(self, rect):
+        inner = rect.adjusted(8, 4, -6, -4)
+        return QRect(inner.right() - self._STAR_SIZE + 1, inner.center().y() - self._STAR_SIZE // 2,
+                     self._STAR_SIZE, self._STAR_SIZE)
+
+    def _draw(self, painter, font_idx, color, st, x, cy):
+        painter.setFont(self._fonts[font_idx])
+        painter.setPen(color)
+        painter.drawStaticText(QPointF(x, cy - st.size().height() / 2), st)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)  # background/selection from the list stylesheet
+        kw = _item_kw(index)
+        if not kw:
+            return
+        word, pinyin, definition = kw.get("word", ""), kw.get("pinyin", ""), kw.get("definition", "")
+        inner = option.rect.adjusted(8, 4, -6, -4)
+        star_rect = self._star_rect(option.rect)
+        cy = inner.center().y() + 0.5
+        painter.save()
+        x = inner.left()
+        self._draw(painter, 0, self._WORD_COLOR, self._static_text(0, word), x, cy)
+        x += max(50, self._word_fm.horizontalAdvance(word)) + 4
+        sep = self._static_text(1, "│")
+        self._draw(painter, 1, self._SEP_COLOR, sep, x, cy)
+        x += sep.size().width() + 4
+        self._draw(painter, 1, self._PINYIN_COLOR, self._static_text(1, pinyin), x, cy)
+        x += max(90, self._text_fm.horizontalAdvance(pinyin)) + 4 + 15
+        if definition:
+            # Wrap at the width the row height was measured with; shift left rather than narrow it under the star
+            x = max(inner.left(), min(x, star_rect.left() - 4 - _KW_DEF_WIDTH))
+            self._draw(painter, 1, self._DEF_COLOR, self._static_text(1, definition, _KW_DEF_WIDTH), x, cy)
+        hover = self._hover.isValid() and self._hover == index
+        painter.drawPixmap(star_rect.topLeft(), _star_pixmap(bool(index.data(_KW_STARRED_ROLE)), hover))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and self._star_rect(option.rect).contains(event.pos())):
+            self._on_star(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip and self._star_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), self._star_tooltip, view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+    def _set_hover(self, index):
+        """Move the star highlight and pointing-hand cursor to index (invalid index clears them)."""
+        if self._hover == index:
+            return
+        viewport = self._view.viewport()
+        if self._hover.isValid():
+            old = self._view.model().index(self._hover.row(), self._hover.column())
+            viewport.update(self._view.visualRect(old))
+        self._hover = QPersistentModelIndex(index)
+        if index.isValid():
+            viewport.update(self._view.visualRect(index))
+            viewport.setCursor(Qt.PointingHandCursor)
+        else:
+            viewport.unsetCursor()
+
+    def eventFilter(self, obj, event):
+        et = event.type()
+        if et == QEvent.MouseMove:
+            index = self._view.indexAt(event.pos())
+            if index.isValid() and not self._star_rect(self._view.visualRect(index)).contains(event.pos()):
+                index = QModelIndex()
+            self._set_hover(index)
+        elif et == QEvent.Leave:
+            self._set_hover(QModelIndex())
+        return False
+
+
 class LearnOverlay(QWidget):
     """Learn mode overlay: displays Chinese keywords, pinyin, and definitions. Positioned right side."""
+    # (wrap width px, definition) -> wrapped line count; shared across overlays and sessions, FIFO-capped
+    _LINE_COUNT_CACHE: dict[tuple[int, str], int] = {}
     
     def __init__(self, left=70, top=80, width=450, height=400):
         super().__init__()
+        self.setUpdatesEnabled(False)  # one paint after construction instead of one per addWidget/setStyleSheet
         self.setWindowFlags(
             Qt.FramelessWindowHint
             | Qt.WindowStaysOnTopHint
@@ -1176,32 +1681,25 @@ class LearnOverlay(QWidget):
         self._tooltip_label = QLabel("Copied!")
         self._tooltip_label.setWindowFlags(Qt.ToolTip | Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
         self._tooltip_label.setAttribute(Qt.WA_TranslucentBackground)
-        self._tooltip_label.setStyleSheet("""
-            background: rgba(0, 0, 0, 0.8);
-            color: white;
-            padding: 6px 12px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-
-        """)
+        self._tooltip_label.setStyleSheet(_LEARN_TOOLTIP_QSS)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowStaysOnTopHint)
         self._tooltip_label.setAlignment(Qt.AlignCenter)
         self._tooltip_label.adjustSize()
         self._tooltip_label.hide()
         self._tooltip_timer.timeout.connect(self._tooltip_label.hide)
-        self._keywords = []  # List of keyword dicts: {word, pinyin, definition}
-        self._seen_words = set()  # Track words we've already shown (no repeats)
+        self._pending_scroll = False
+        self._tail_timer = QTimer(self)
+        self._tail_timer.setSingleShot(True)
+        self._tail_timer.setInterval(16)
+        self._tail_timer.timeout.connect(self._finalize_update)
+        self._keywords_by_word: dict[str, dict] = {}  # word -> {word, pinyin, definition}; insertion-ordered, no repeats
+        # Definition text measurement (12px font), shared by all rows
+        _wf, _tf, _wm, self._kw_metrics, self._kw_line_h = _keyword_fonts()
+        self._starred_words = None  # set of starred words, loaded from the DB on first use and kept in sync
 
         # Set background color for the widget - use object name to ensure it applies
         self.setObjectName("LearnOverlayWidget")
-        self.setStyleSheet("""
-            QWidget#LearnOverlayWidget {
-                background: rgba(28, 24, 42, 0.85);
-                border: none;
-                border-radius: 8px;
-            }
-        """)
+        self.setStyleSheet(_LEARN_OVERLAY_QSS)
 
         # Layout
         layout = QVBoxLayout()
@@ -1211,34 +1709,19 @@ class LearnOverlay(QWidget):
         # Header bar (entire row: title + buttons) - draggable
         title_row = DraggableTitleBar(self)
         title_row.setAttribute(Qt.WA_StyledBackground)  # required for stylesheet bg with translucent parent
-        title_row.setStyleSheet("""
-            background: rgba(28, 24, 42, 0.85);
-            border: 1px solid rgba(0, 161, 214, 0.3);
-            border-radius: 4px;
-        """)
+        title_row.setStyleSheet(_LEARN_TITLEROW_QSS)
         title_row_layout = QHBoxLayout(title_row)
         title_row_layout.setContentsMargins(8, 4, 8, 4)
         title_row_layout.setSpacing(8)
         title = QLabel("Learn Keywords")
-        title.setStyleSheet("color: white; font-size: 14px; font-weight: bold; padding: 0; margin: 0; background: transparent; border: none;")
+        title.setStyleSheet(_LEARN_TITLE_QSS)
         title.setAttribute(Qt.WA_TransparentForMouseEvents)  # so drag goes to title bar
         title_row_layout.addWidget(title, 0)
         title_row_layout.addSpacing(8)
         live_btn = QPushButton("Live")
         starred_btn = QPushButton("Starred")
         for btn in (live_btn, starred_btn):
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(0, 161, 214, 0.0);
-                    color: white;
-                    border: 0px solid rgba(0, 161, 214, 1.0);
-                    border-radius: 3px;
-                    padding: 4px 12px;
-                    font-size: 12px;
-                }
-                QPushButton:hover { background: rgba(0, 161, 214, 0.4); }
-                QPushButton:checked { background: rgba(0, 161, 214, 0.7); }
-            """)
+            btn.setStyleSheet(_LEARN_TAB_BTN_QSS)
             btn.setCheckable(True)
         tab_btns = QButtonGroup(self)
         tab_btns.addButton(live_btn)
@@ -1251,24 +1734,13 @@ class LearnOverlay(QWidget):
         sep.setFrameShape(QFrame.VLine)
         sep.setFrameShadow(QFrame.Plain)
         sep.setFixedWidth(1)
-        sep.setStyleSheet("background: rgba(255,255,255,0.4);")
+        sep.setStyleSheet(_LEARN_SEP_QSS)
         sep.setAttribute(Qt.WA_TransparentForMouseEvents)  # so drag goes to title bar
         title_row_layout.addWidget(sep)
         title_row_layout.addWidget(starred_btn)
         title_row_layout.addSpacing(8)
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(0, 161, 214, 0.6);
-                color: white;
-                border: 0px solid rgba(0, 161, 214, 0.5);
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-size: 12px;
-            }
-            QPushButton:hover { background: rgba(0, 161, 214, 0.8); }
-            QPushButton:pressed { background: rgba(0, 161, 214, 1); }
-        """)
+        save_btn.setStyleSheet(_LEARN_SAVE_BTN_QSS)
         save_btn.clicked.connect(self._save_to_markdown)
         # save_btn.setToolTip("Save all keywords to a Markdown file")
         title_row_layout.addWidget(save_btn)
@@ -1276,9 +1748,7 @@ class LearnOverlay(QWidget):
 
         # Stacked content: Live (session) and Starred (persistent)
         self.stacked_widget = QStackedWidget()
-        self.stacked_widget.setStyleSheet("""
-            QStackedWidget { background: rgba(28, 24, 42, 0.85); border: 1px solid rgba(0, 161, 214, 0.3); border-radius: 6px; }
-        """)
+        self.stacked_widget.setStyleSheet(_LEARN_STACK_QSS)
 
         # Live page: session keywords
         live_container = QWidget()
@@ -1289,76 +1759,30 @@ class LearnOverlay(QWidget):
         self.list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         # Enable selection and copying
         self.list_widget.setSelectionMode(QListWidget.ExtendedSelection)
-        self.list_widget.setStyleSheet("""
-            QListWidget {
-                background: rgba(28, 24, 42, 0.75);
-                border: none;
-                border-radius: 6px;
-                color: rgba(255, 255, 255, 0.95);
-                padding: 4px;
-            }
-            QListWidget::item {
-                border: none;
-                border-radius: 4px;
-                padding: 4px 6px;
-                margin: 2px 0px;
-                background: rgba(255, 255, 255, 0.05);
-                min-height: 50px;
-            }
-            QListWidget::item:hover {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-            }
-            QListWidget::item:selected {
-                background: rgba(0, 161, 214, 0.3);
-                border: none;
-            }
-            QListWidget::item:selected:hover {
-                background: rgba(0, 161, 214, 0.3);
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border: none;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-        """)
+        self.list_widget.setStyleSheet(_LEARN_LIST_QSS)
+        self.list_widget.setItemDelegate(_KeywordDelegate(self._on_live_star, "Add to starred", self.list_widget))
+        # Rows are almost always the 1-3 line height: let the view position them arithmetically until one isn't
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setEditTriggers(QListWidget.NoEditTriggers)  # star is hit-tested in the delegate; no editors
+        self._live_row_height = None
         live_layout.addWidget(self.list_widget, 1)
         self.stacked_widget.addWidget(live_container)
 
-        # Starred page: persistent from DB
-        starred_container = QWidget()
-        starred_layout = QVBoxLayout(starred_container)
-        starred_layout.setContentsMargins(0, 0, 0, 0)
-        self.starred_list_widget = QListWidget()
-        self.starred_list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.starred_list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.starred_list_widget.setSelectionMode(QListWidget.ExtendedSelection)
-        self.starred_list_widget.setStyleSheet(self.list_widget.styleSheet())
-        self.starred_placeholder = QLabel("No starred words. Click ★ on words in Live tab to add.")
-        self.starred_placeholder.setStyleSheet("color: rgba(255, 255, 255, 0.6); font-size: 12px; padding: 160px 4px 4px 4px;")
-        self.starred_placeholder.setAlignment(Qt.AlignCenter)
-        self.starred_placeholder.setWordWrap(True)
-        starred_layout.addWidget(self.starred_placeholder)
-        starred_layout.addWidget(self.starred_list_widget, 1)
-        self.starred_list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.starred_list_widget.customContextMenuRequested.connect(self._show_starred_context_menu)
-        self.stacked_widget.addWidget(starred_container)
+        # Starred page: persistent from DB. Placeholder until the Starred tab is first opened.
+        self.starred_list_widget = None
+        self.starred_placeholder = None
+        self._starred_built = False
+        self._starred_word_to_item: dict[str, QListWidgetItem] = {}
+        self.stacked_widget.addWidget(QWidget())
 
         def _on_live_clicked():
             self.stacked_widget.setCurrentIndex(0)
         def _on_starred_clicked():
+            # Loaded from the DB once; the star handlers keep it current after that
+            if not self._starred_built:
+                self._build_starred_page()
+                self._refresh_starred_tab()
             self.stacked_widget.setCurrentIndex(1)
-            self._refresh_starred_tab()
         live_btn.clicked.connect(_on_live_clicked)
         starred_btn.clicked.connect(_on_starred_clicked)
 
@@ -1366,21 +1790,14 @@ class LearnOverlay(QWidget):
 
         # Resize handle indicator
         resize_handle = QLabel("━━━")
-        resize_handle.setStyleSheet("""
-            color: rgba(0, 161, 214, 0.7);
-            font-size: 10px; 
-            padding: 6px 4px;
-            background: rgba(28, 24, 42, 0.85);
-            border: 1px solid rgba(0, 161, 214, 0.3);
-            border-radius: 4px;
-        """)
+        resize_handle.setStyleSheet(_LEARN_RESIZE_HANDLE_QSS)
         resize_handle.setAlignment(Qt.AlignCenter)
         resize_handle.setCursor(Qt.SizeVerCursor)
         layout.addWidget(resize_handle)
 
         # Status/placeholder
         self.placeholder = QLabel("Waiting for Chinese subtitles...")
-        self.placeholder.setStyleSheet("color: rgba(255, 255, 255, 0.6); font-size: 12px; padding: 4px;")
+        self.placeholder.setStyleSheet(_LEARN_PLACEHOLDER_QSS + "padding: 4px;")
         self.placeholder.setAlignment(Qt.AlignCenter)
         self.placeholder.setWordWrap(True)
         layout.addWidget(self.placeholder)
@@ -1391,20 +1808,46 @@ class LearnOverlay(QWidget):
         self.list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list_widget.customContextMenuRequested.connect(self._show_context_menu)
         
-        # Enable keyboard shortcuts (Ctrl+C) for both lists
-        def _install_copy_shortcut(list_widget):
-            orig = list_widget.keyPressEvent
-            def wrapper(event):
-                if event.key() == Qt.Key_C and event.modifiers() == Qt.ControlModifier:
-                    self._copy_selected_from(list_widget)
-                    event.accept()
-                else:
-                    orig(event)
-            list_widget.keyPressEvent = wrapper
+        # Enable keyboard shortcut (Ctrl+C); the Starred list gets it when built
         self.list_widget.setFocusPolicy(Qt.StrongFocus)
+        self._install_copy_shortcut(self.list_widget)
+        self.setUpdatesEnabled(True)
+
+    def _install_copy_shortcut(self, list_widget):
+        # Native shortcut (Ctrl+C / Cmd+C), only while this list has focus; other keys never reach Python
+        shortcut = QShortcut(QKeySequence.Copy, list_widget)
+        shortcut.setContext(Qt.WidgetShortcut)
+        shortcut.activated.connect(lambda: self._copy_selected_from(list_widget))
+
+    def _build_starred_page(self):
+        """Build the Starred page widgets and swap them in for the placeholder page."""
+        starred_container = QWidget()
+        starred_layout = QVBoxLayout(starred_container)
+        starred_layout.setContentsMargins(0, 0, 0, 0)
+        self.starred_list_widget = QListWidget()
+        self.starred_list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.starred_list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.starred_list_widget.setSelectionMode(QListWidget.ExtendedSelection)
+        self.starred_list_widget.setStyleSheet(_LEARN_LIST_QSS)
+        self.starred_list_widget.setItemDelegate(
+            _KeywordDelegate(self._on_starred_star, "Remove from starred", self.starred_list_widget))
+        self.starred_list_widget.setUniformItemSizes(True)  # every starred row is 60px
+        self.starred_list_widget.setEditTriggers(QListWidget.NoEditTriggers)
+        self.starred_placeholder = QLabel(_STARRED_EMPTY_TEXT)
+        self.starred_placeholder.setStyleSheet(_LEARN_PLACEHOLDER_QSS + "padding: 160px 4px 4px 4px;")
+        self.starred_placeholder.setAlignment(Qt.AlignCenter)
+        self.starred_placeholder.setWordWrap(True)
+        starred_layout.addWidget(self.starred_placeholder)
+        starred_layout.addWidget(self.starred_list_widget, 1)
+        self.starred_list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.starred_list_widget.customContextMenuRequested.connect(self._show_starred_context_menu)
         self.starred_list_widget.setFocusPolicy(Qt.StrongFocus)
-        _install_copy_shortcut(self.list_widget)
-        _install_copy_shortcut(self.starred_list_widget)
+        self._install_copy_shortcut(self.starred_list_widget)
+        old = self.stacked_widget.widget(1)
+        self.stacked_widget.removeWidget(old)
+        old.deleteLater()
+        self.stacked_widget.insertWidget(1, starred_container)
+        self._starred_built = True
 
     def update_keywords(self, keywords: list[dict]):
         """Append new keywords to the list (don't clear existing ones)."""
@@ -1420,175 +1863,184 @@ class LearnOverlay(QWidget):
         sb = self.list_widget.verticalScrollBar()
         was_at_bottom = sb.value() >= sb.maximum() - 10
         
-        # Append only new keywords that we haven't seen before (no repeated words)
-        new_count = 0
+        # Append only new keywords that we haven't seen before (no repeated words).
+        # Entries were normalized off the UI thread by _prepare_keyword_entries.
+        entries = []
         for kw in keywords:
-            word = kw.get("word", "")
-            if not word or word in self._seen_words:
+            word = kw["word"]
+            if word in self._keywords_by_word:
                 continue  # Skip if we've already shown this word
-            
-            self._seen_words.add(word)
-            pinyin = kw.get("pinyin", "")
-            definition = kw.get("definition", "")
-            # Preserve metadata if present
-            keyword_dict = {"word": word, "pinyin": pinyin, "definition": definition}
-            if "_metadata" in kw:
-                keyword_dict["_metadata"] = kw["_metadata"]
-            self._keywords.append(keyword_dict)
-
-            # Format item and append to bottom
-            item = QListWidgetItem()
-            try:
-                from starred_db import is_starred
-                starred = is_starred(word)
-            except Exception:
-                starred = False
-            # Get metadata from keyword dict if present
-            metadata = kw.get("_metadata")
-            widget = self._create_keyword_widget(word, pinyin, definition, is_starred=starred, for_starred_tab=False, metadata=metadata)
-            
-            # Calculate accurate line count using QFontMetrics
-            # All measurements in pixels: width=170px, font-size=12px
-            font = QFont()
-            font.setPixelSize(12)  # Use pixel size for consistency
-            metrics = QFontMetrics(font)
-            definition_width_px = 170  # Maximum width in pixels
-            # Calculate how many lines the text actually takes
-            text_rect = metrics.boundingRect(0, 0, definition_width_px, 0, Qt.TextWordWrap | Qt.AlignLeft, definition)
-            line_height_px = metrics.lineSpacing()  # Actual line height in pixels (~14-15px for 12px font)
-            num_lines = max(1, (text_rect.height() + line_height_px - 1) // line_height_px)  # Round up
-            
-            # Default height for 1-3 lines, then scale per line after that
-            default_height_px = 60  # Default height for 1-3 lines
-            item_padding_px = 8  # Item padding top/bottom (4px each)
-            safety_margin_px = 6  # Safety margin to prevent cutoff (top and bottom)
-            
-            if num_lines <= 3:
-                # Use default height for 1-3 lines + safety margin
-                item_height = default_height_px + safety_margin_px
-            else:
-                # Default height + extra height for lines beyond 3 + safety margin
-                extra_lines = num_lines - 3
-                extra_height_px = extra_lines * line_height_px
-                item_height = default_height_px + extra_height_px + safety_margin_px
-            
-            item.setSizeHint(QSize(widget.sizeHint().width(), item_height))
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, widget)
-            new_count += 1
+            self._keywords_by_word[word] = kw
+            entries.append(kw)
+        new_count = self._append_keywords(entries)
 
-        # Auto-scroll to bottom only if user was already at the bottom (within 10px)
+        # Auto-scroll to bottom only if user was already at the bottom (within 10px).
+        # Scroll/resize run once per burst of updates, see _finalize_update.
         if new_count > 0 and was_at_bottom:
-            self.list_widget.scrollToBottom()
+            self._pending_scroll = True
+        self._tail_timer.start()
 
+    def _finalize_update(self):
+        """Coalesced tail of update_keywords: a single scroll and height check per burst."""
+        if self._pending_scroll:
+            self._pending_scroll = False
+            self.list_widget.scrollToBottom()
         # Ensure height stays fixed - don't resize based on content
-        current_height = self.height()
-        if current_height < self._default_height:
+        if self.height() < self._default_height:
             self.resize(self.width(), self._default_height)
 
-    def _create_keyword_widget(self, word: str, pinyin: str, definition: str, is_starred: bool = False, for_starred_tab: bool = False, metadata: dict = None) -> QWidget:
-        """Create a keyword list item widget with star button."""
-        widget = QWidget()
-        widget.setStyleSheet("background: transparent; border: none;")
-        layout = QHBoxLayout()
-        layout.setContentsMargins(8, 4, 6, 4)
-        layout.setSpacing(4)
+    def _append_keywords(self, entries: list[dict]) -> int:
+        """Add keyword rows to the Live list in one batch (no repaint/signals per row). Returns rows added."""
+        if not entries:
+            return 0
+        starred_words = self._get_starred_words()
+        lw = self.list_widget
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            for e in entries:
+                word, definition = e["word"], e["definition"]
+                item = QListWidgetItem()
+                item.setData(_KW_ROLE, _KwRef(e))
+                item.setData(_KW_STARRED_ROLE, word in starred_words)
 
-        # Star button
-        star_btn = QPushButton("★" if is_starred else "☆")
-        star_btn.setFixedSize(28, 28)
-        star_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #FFD700;
-                font-size: 16px;
-                border: none;
-                padding: 0;
-            }
-            QPushButton:hover { color: #FFA500; }
-        """)
-        star_btn.setToolTip("Remove from starred" if for_starred_tab else "Add to starred")
-        star_btn.setCursor(Qt.PointingHandCursor)
+                num_lines = self._measure_lines(definition)
+                line_height_px = self._kw_line_h  # Actual line height in pixels (~14-15px for 12px font)
 
-        def _on_star_clicked():
-            try:
-                from starred_db import add_star, remove_star, get_all_starred
-                if for_starred_tab:
-                    remove_star(word)
-                    self._refresh_starred_tab()
+                # Default height for 1-3 lines, then scale per line after that
+                default_height_px = 60  # Default height for 1-3 lines
+                item_padding_px = 8  # Item padding top/bottom (4px each)
+                safety_margin_px = 6  # Safety margin to prevent cutoff (top and bottom)
+
+                if num_lines <= 3:
+                    # Use default height for 1-3 lines + safety margin
+                    item_height = default_height_px + safety_margin_px
                 else:
-                    # Get metadata from keyword if available
-                    metadata = getattr(widget, "_keyword_metadata", None)
-                    provider = metadata.get("provider") if metadata else None
-                    provider_display = metadata.get("provider_display") if metadata else None
-                    model = metadata.get("model") if metadata else None
-                    add_star(word, pinyin, definition, provider=provider, provider_display=provider_display, model=model)
-                    star_btn.setText("★")
-                    star_btn.setToolTip("Remove from starred")
+                    # Default height + extra height for lines beyond 3 + safety margin
+                    extra_lines = num_lines - 3
+                    extra_height_px = extra_lines * line_height_px
+                    item_height = default_height_px + extra_height_px + safety_margin_px
+
+                item.setSizeHint(QSize(0, item_height))  # rows span the viewport width
+                lw.addItem(item)
+                if item_height != self._live_row_height:
+                    if self._live_row_height is None:
+                        self._live_row_height = item_height
+                    elif lw.uniformItemSizes():
+                        lw.setUniformItemSizes(False)  # a taller (4+ line) row: per-item heights from here on
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+        return len(entries)
+
+    def _get_starred_words(self) -> set:
+        """Starred words as a set: one DB query on first use, then updated by the star handlers."""
+        if self._starred_words is None:
+            try:
+                from starred_db import get_all_starred
+                self._starred_words = {kw["word"] for kw in get_all_starred()}
             except Exception:
-                pass
-
-        star_btn.clicked.connect(_on_star_clicked)
-
-
-        # Chinese word
-        word_lbl = QLabel(word)
-        word_lbl.setStyleSheet("color: white; font-size: 14px; font-weight: bold; padding: 0px; margin: 0px;")
-        word_lbl.setMinimumWidth(50)
-        layout.addWidget(word_lbl, 0)
-
-        # Separator (no spacing)
-        sep = QLabel("│")
-        sep.setStyleSheet("color: rgba(255, 255, 255, 0.3); padding: 0px; margin: 0px;")
-        layout.addWidget(sep, 0)
-
-        # Pinyin (directly next to word with no spacing)
-        pin_lbl = QLabel(pinyin)
-        pin_lbl.setStyleSheet("color: #B5BCC5; font-size: 12px; padding: 0px; margin: 0px;")
-        pin_lbl.setMinimumWidth(90)
-        layout.addWidget(pin_lbl, 0)
-        
-        # Add spacer to push definition to right
-        layout.addSpacing(15)
-
-        # Definition - centered vertically, limited width to prevent cutoff
-        def_lbl = QLabel(definition)
-        def_lbl.setStyleSheet("color: rgba(255, 255, 255, 0.9); font-size: 12px; padding: 0px; margin: 0px;")  # No padding on label itself
-        def_lbl.setWordWrap(True)
-        def_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)  # Vertical center instead of top
-        # Limit width to prevent cutoff
-        def_lbl.setMaximumWidth(170)
-        layout.addWidget(def_lbl, 1)
-        layout.addWidget(star_btn, 0)
-        widget.setLayout(layout)
-        # Store metadata in widget for later retrieval
-        if metadata:
-            widget._keyword_metadata = metadata
-        return widget
+                return set()
+        return self._starred_words
+
+    def _measure_lines(self, definition: str, width_px: int = _KW_DEF_WIDTH) -> int:
+        """Number of lines definition wraps to at width_px in the 12px keyword font (memoized)."""
+        cache = LearnOverlay._LINE_COUNT_CACHE
+        key = (width_px, definition)
+        n = cache.get(key)
+        if n is None:
+            if len(cache) >= _KW_LINE_CACHE_MAX:
+                del cache[next(iter(cache))]  # drop the oldest entry
+            if "\n" not in definition and self._kw_metrics.horizontalAdvance(definition) <= width_px:
+                n = 1  # Fits on one line: skip the word-wrap layout
+            else:
+                rect = self._kw_metrics.boundingRect(0, 0, width_px, 0, Qt.TextWordWrap | Qt.AlignLeft, definition)
+                n = max(1, (rect.height() + self._kw_line_h - 1) // self._kw_line_h)  # Round up
+            cache[key] = n
+        return n
+
+    def _on_live_star(self, index):
+        """Star clicked in the Live list: add the word to the starred DB."""
+        kw = _item_kw(index)
+        if not kw:
+            return
+        try:
+            from starred_db import add_star
+            metadata = kw.get("_metadata") or {}
+            add_star(kw["word"], kw["pinyin"], kw["definition"], provider=metadata.get("provider"),
+                     provider_display=metadata.get("provider_display"), model=metadata.get("model"))
+        except Exception:
+            return
+        self._get_starred_words().add(kw["word"])
+        self.list_widget.model().setData(index, True, _KW_STARRED_ROLE)
+        self._add_starred_row(kw)
+
+    def _on_starred_star(self, index):
+        """Star clicked in the Starred list: remove the word, then drop its row once the click is done."""
+        kw = _item_kw(index)
+        if not kw:
+            return
+        try:
+            from starred_db import remove_star
+            remove_star(kw["word"])
+        except Exception:
+            return
+        word = kw["word"]
+        self._get_starred_words().discard(word)
+        QTimer.singleShot(0, lambda: self._remove_starred_row(word))
 
     def _refresh_starred_tab(self):
         """Load starred words from DB and populate the Starred tab."""
+        if not self._starred_built:
+            return
         try:
             from starred_db import get_all_starred
             starred = get_all_starred()
         except Exception:
             starred = []
+        self._starred_words = {kw["word"] for kw in starred}
         self.starred_list_widget.clear()
+        self._starred_word_to_item.clear()
         if not starred:
-            self.starred_placeholder.setText("No starred words. Click ★ on words in Live tab to add.")
+            self.starred_placeholder.setText(_STARRED_EMPTY_TEXT)
             self.starred_placeholder.show()
         else:
             self.starred_placeholder.hide()
-            for kw in starred:
-                item = QListWidgetItem()
-                metadata = kw.get("_metadata")
-                widget = self._create_keyword_widget(
-                    kw["word"], kw["pinyin"], kw["definition"],
-                    is_starred=True, for_starred_tab=True, metadata=metadata
-                )
-                self.starred_list_widget.addItem(item)
-                item.setSizeHint(QSize(widget.sizeHint().width(), 60))
-                self.starred_list_widget.setItemWidget(item, widget)
+            lw = self.starred_list_widget
+            lw.setUpdatesEnabled(False)
+            lw.blockSignals(True)
+            try:
+                for kw in starred:
+                    lw.addItem(self._make_starred_item(kw))
+            finally:
+                lw.blockSignals(False)
+                lw.setUpdatesEnabled(True)
+
+    def _make_starred_item(self, kw: dict) -> QListWidgetItem:
+        item = QListWidgetItem()
+        item.setData(_KW_ROLE, _KwRef(kw))
+        item.setData(_KW_STARRED_ROLE, True)
+        item.setSizeHint(QSize(0, 60))
+        self._starred_word_to_item[kw["word"]] = item
+        return item
+
+    def _add_starred_row(self, kw: dict):
+        """Add one word at the top of the Starred list (newest first, as get_all_starred orders it)."""
+        if not self._starred_built or kw["word"] in self._starred_word_to_item:
+            return
+        self.starred_list_widget.insertItem(0, self._make_starred_item(kw))
+        self.starred_placeholder.hide()
+
+    def _remove_starred_row(self, word: str):
+        """Remove one word's row from the Starred list."""
+        item = self._starred_word_to_item.pop(word, None)
+        if item is None:
+            return
+        lw = self.starred_list_widget
+        lw.takeItem(lw.row(item))
+        if lw.count() == 0:
+            self.starred_placeholder.setText(_STARRED_EMPTY_TEXT)
+            self.starred_placeholder.show()
 
     def _show_starred_context_menu(self, position):
         menu = QMenu(self)
@@ -1603,14 +2055,13 @@ class LearnOverlay(QWidget):
             return
         texts = []
         for item in selected_items:
-            widget = list_widget.itemWidget(item)
-            if widget:
-                labels = widget.findChildren(QLabel)
-                parts = [lbl.text() for lbl in labels if lbl.text() and lbl.text() != "│"]
+            kw = _item_kw(item)
+            if kw:
+                parts = [t for t in (kw.get("word"), kw.get("pinyin"), kw.get("definition")) if t]
                 if parts:
                     text_line = " | ".join(parts)
                     # Add metadata if available
-                    metadata = getattr(widget, "_keyword_metadata", None)
+                    metadata = kw.get("_metadata")
                     if metadata:
                         provider_display = metadata.get("provider_display", "")
                         model = metadata.get("model", "")
@@ -1636,8 +2087,9 @@ class LearnOverlay(QWidget):
     def clear_keywords(self):
         """Clear all keywords and show placeholder."""
         self.list_widget.clear()
-        self._keywords.clear()
-        self._seen_words.clear()
+        self.list_widget.setUniformItemSizes(True)
+        self._live_row_height = None
+        self._keywords_by_word.clear()
         self.placeholder.setText("No Chinese text detected")
         self.placeholder.show()
 
@@ -1650,23 +2102,10 @@ class LearnOverlay(QWidget):
                 keywords = get_all_starred()
             except Exception:
                 keywords = []
-            default_path = os.path.join(os.path.expanduser("~"), "starred words.md")
+            default_path = os.path.join(_HOME_DIR, "starred words.md")
             caption = "Save Starred Keywords"
         else:
-            keywords = self._keywords
-            if not keywords:
-                keywords = []
-                for i in range(self.list_widget.count()):
-                    item = self.list_widget.item(i)
-                    widget = self.list_widget.itemWidget(item)
-                    if widget:
-                        labels = widget.findChildren(QLabel)
-                        parts = [lbl.text() for lbl in labels if lbl.text() and lbl.text() != "│"]
-                        if len(parts) >= 1:
-                            word = parts[0]
-                            pinyin = parts[1] if len(parts) > 1 else ""
-                            definition = parts[2] if len(parts) > 2 else ""
-                            keywords.append({"word": word, "pinyin": pinyin, "definition": definition})
+            keywords = list(self._keywords_by_word.values())
             default_path = ""
             caption = "Save Keywords"
         if not keywords:
@@ -1678,19 +2117,20 @@ class LearnOverlay(QWidget):
             return
         try:
             def esc(s):
-                return (s or "").replace("|", "\\|").replace("\n", " ")
+                return (s or "").translate(_MD_CELL_TRANS)
             title = "# Starred Keywords\n" if is_starred_tab else "# Learn Keywords\n"
-            lines = [title, f"*{len(keywords)} words*\n"]
-            lines.append("| Word | Pinyin | Definition | Provider | Model |")
-            lines.append("|------|--------|------------|----------|-------|")
+            lines = [
+                title,
+                f"*{len(keywords)} words*\n",
+                "| Word | Pinyin | Definition | Provider | Model |",
+                "|------|--------|------------|----------|-------|",
+            ]
             for kw in keywords:
-                word = esc(kw.get("word", ""))
-                pinyin = esc(kw.get("pinyin", ""))
-                definition = esc(kw.get("definition", ""))
-                metadata = kw.get("_metadata", {})
-                provider_display = esc(metadata.get("provider_display", ""))
-                model = esc(metadata.get("model", ""))
-                lines.append(f"| {word} | {pinyin} | {definition} | {provider_display} | {model} |")
+                metadata = kw.get("_metadata") or {}
+                lines.append(
+                    f"| {esc(kw.get('word'))} | {esc(kw.get('pinyin'))} | {esc(kw.get('definition'))}"
+                    f" | {esc(metadata.get('provider_display'))} | {esc(metadata.get('model'))} |"
+                )
             with open(path, "w", encoding="utf-8") as f:
                 f.write("\n".join(lines))
             if getattr(self, "_tooltip_label", None):
@@ -1775,9 +2215,219 @@ class LearnOverlay(QWidget):
                 self.window().close()
 
 
+# LLM providers (display_name, provider_id) and their models (display_name, model_id)
+_LLM_PROVIDERS = (
+    ("SiliconFlow.com", "siliconflow_com"),
+    ("SiliconFlow.cn", "siliconflow_cn"),
+    ("OpenAI ", "openai"),
+    ("DeepSeek", "deepseek"),
+    ("Anthropic", "anthropic"),
+    ("Groq", "groq"),
+    ("Together", "together"),
+    ("HuggingFace API", "huggingface_api"),
+    ("HuggingFace Local", "huggingface_local"),
+)
+_LLM_MODELS = {
+    "siliconflow_com": [
+        # High Quality Tier
+        ("Qwen2.5-7B", "Qwen/Qwen2.5-7B-Instruct"), 
+        ("Qwen2.5-14B (Recommended)", "Qwen/Qwen2.5-14B-Instruct"), 
+        ("Qwen2.5-32B", "Qwen/Qwen2.5-32B-Instruct"),
+        ("Qwen2.5-72B", "Qwen/Qwen2.5-72B-Instruct"),  
+        ("Qwen3-8B", "Qwen/Qwen3-8B"), # $0.06/ M Tokens  Best quality for complex dialogue
+        ("DeepSeek-V3.2", "deepseek-ai/DeepSeek-V3.2"),
+        ("Tencent Hunyuan-MT-7B (Recommended)", "tencent/Hunyuan-MT-7B"),  # Excellent Chinese, very cheap
+        # ("Deepseek-V3.1", "deepseek-ai/DeepSeek-V3.1"),  # Excellent Chinese, very cheap
+        # ("GLM-4-9B", "THUDM/GLM-4-9B-0414"),  #$0.086/M tokens
+        ("GLM-4-32B", "THUDM/GLM-4-32B-0414"),  #$0.27/M Tokens
+        # ("moonshotai/Kimi-K2.5", "moonshotai/Kimi-K2.5"),
+        ("MiniMax-M2.1", "MiniMaxAI/MiniMax-M2.1"),
+    ],
+    "siliconflow_cn": [
+        # High Quality Tier
+        ("Qwen2.5-7B", "Qwen/Qwen2.5-7B-Instruct"), 
+        ("Qwen2.5-14B", "Qwen/Qwen2.5-14B-Instruct"), 
+        ("Qwen2.5-32B", "Qwen/Qwen2.5-32B-Instruct"),
+        ("Qwen2.5-72B", "Qwen/Qwen2.5-72B-Instruct"),  # Best quality for complex dialogue
+        ("DeepSeek-V3.2", "deepseek-ai/DeepSeek-V3.2"),  # Excellent Chinese, very cheap
+        ("Deepseek V3 (Pro)", "Prodeepseek-ai/DeepSeek-V3"),  
+        # Fast/Cheap Tier (Pro/ optimized endpoints)
+        ("GLM-4-9B", "THUDM/GLM-4-9B-0414"),  
+        ("GLM-4-32B", "THUDM/GLM-4-32B-0414"),  
+        ("moonshotai/Kimi-K2.5", "moonshotai/Kimi-K2.5"),
+        ("MiniMax-M2.1", "MiniMaxAI/MiniMax-M2.1"),
+    ],
+    "openai": [
+
+        ("GPT-4o mini (Recommended)", "gpt-4o-mini"),              # Fastest, cheapest, good enough for most subs
+        ("GPT-4o", "gpt-4o"),                        # Best quality for nuance/idioms
+        # ("GPT-4o-latest", "gpt-4o-2024-11-20"),      # Auto-updates to newest 4o                     # Reasoning model - good for ambiguous context
+        ("GPT-3.5 Turbo", "gpt-3.5-turbo"),  
+        ("o3-mini", "o3-mini"), 
+        ("GPT-5", "gpt-5"),              # Fastest, cheapest, good enough for most subs
+        ("GPT-5 mini", "gpt-5-mini"),    
+        ("GPT-5 nano", "gpt-5-nano"),          # Legacy fallback (cheapest)
+    ],
+
+    "deepseek": [
+        ("DeepSeek-V3", "deepseek-chat"),            # General chat (the V3 model) - excellent Chinese
+        ("DeepSeek-V2.5", "deepseek-chat-v2.5"),     # Older but very cheap fallback (if supported)
+    ],
+
+    # "gemini": [
+    #     ("Gemini 1.5 Flash", "gemini-1.5-flash"),      # Cheap, fast, good enough
+    #     ("Gemini 1.5 Pro", "gemini-1.5-pro"),          # Quality, huge context
+    #     ("Gemini 1.5 Flash-8B", "gemini-1.5-flash-8b") # Experimental, fastest
+    # ],
+    "anthropic": [
+        ("Claude 3.5 Haiku", "claude-3-5-haiku-20241022"),     # Fastest Claude, great for real-time
+        ("Claude 3.5 Sonnet", "claude-3-5-sonnet-20241022"),   # Best quality/price ratio
+        ("Claude 3.5 Sonnet v2", "claude-3-5-sonnet-20241022-v2"),  # Latest version with better instruction following
+        ("Claude 3 Opus", "claude-3-opus-20240229"),           # Heavy quality (slowest, most expensive) - only for film/artistic content
+    ],
+    # "groq": [("Llama 3.1 8B", "llama-3.1-8b-instant"), ("Llama 3.1 70B", "llama-3.1-70b-versatile"), ("Mixtral 8x7B", "mixtral-8x7b-32768")],
+    # "together": [("Llama 3 8B", "meta-llama/Llama-3-8b-chat-hf"), ("Llama 3 70B", "meta-llama/Llama-3-70b-chat-hf"), ("Mixtral 8x7B", "mistralai/Mixtral-8x7B-Instruct-v0.1")],
+    "huggingface_api": [("opus-mt-zh-en", "Helsinki-NLP/opus-mt-zh-en"), ("nllb-200", "facebook/nllb-200-distilled-600M"), ("m2m100", "facebook/m2m100_418M"), ("Qwen2-7B", "Qwen/Qwen2-7B-Instruct")],
+    "huggingface_local": [("opus-mt-zh-en", "Helsinki-NLP/opus-mt-zh-en"), ("nllb-200", "facebook/nllb-200-distilled-600M"), ("m2m100", "facebook/m2m100_418M"), ("Qwen2-7B", "Qwen/Qwen2-7B-Instruct")],
+}
+# Env var holding each LLM provider's API key (None: no key needed)
+_LLM_PROVIDER_KEY_ENV = {
+    "siliconflow_com": "SILICONFLOW_COM_API_KEY",
+    "siliconflow_cn": "SILICONFLOW_CN_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "groq": "GROQ_API_KEY",
+    "together": "TOGETHER_API_KEY",
+    "huggingface_api": "HF_API_KEY",
+    "huggingface_local": None,
+}
+# Same data split into parallel per-provider tuples, built once, for filling the model combo
+_LLM_MODEL_DISPLAYS = {p: tuple(disp for disp, _ in models) for p, models in _LLM_MODELS.items()}
+_LLM_MODEL_IDS = {p: tuple(model_id for _, model_id in models) for p, models in _LLM_MODELS.items()}
+# Learn-mode MT providers (no model selection)
+_MT_PROVIDERS = frozenset({"deepl", "google", "baidu", "youdao", "yandex", "libretranslate", "caiyun", "niutrans"})
+# Learn-mode provider choices in combo order: (provider_id, display_name, env vars that must all be set)
+_LEARN_PROVIDER_KEYS = (
+    (("local_dict", "Local Dictionary (English only)", ()),)
+    + tuple(
+        (prov_id, display_name, (_LLM_PROVIDER_KEY_ENV[prov_id],) if _LLM_PROVIDER_KEY_ENV.get(prov_id) else ())
+        for display_name, prov_id in _LLM_PROVIDERS
+    )
+    + (
+        ("deepl", "DeepL", ("DEEPL_AUTH_KEY",)),
+        ("google", "Google Translate", ("GOOGLE_TRANSLATE_API_KEY",)),
+        ("baidu", "Baidu", ("BAIDU_APP_ID", "BAIDU_APP_SECRET")),
+        ("youdao", "Youdao", ("YOUDAO_APP_KEY", "YOUDAO_APP_SECRET")),
+        ("yandex", "Yandex", ("YANDEX_API_KEY",)),
+        ("caiyun", "Caiyun 彩云小译", ("CAIYUN_TOKEN",)),
+        ("niutrans", "Niutrans 小牛翻译", ("NIUTRANS_APIKEY",)),
+        ("libretranslate", "LibreTranslate", ()),  # Public instance works without a key
+    )
+)
+
+
+def _available_learn_providers():
+    """(provider_id, display_name) for learn-mode providers whose API keys are configured."""
+    return [
+        (prov_id, display_name)
+        for prov_id, display_name, env_names in _LEARN_PROVIDER_KEYS
+        if all(_api_key_present(k) for k in env_names)
+    ]
+
+
+# TTS model language support info shown under the voice row
+_TTS_LANG_INFO = {
+    "openai": (
+        "Cloud based, medium to high latency.\n"
+        "English (Native – best), Strong American accent when speaking other languages.\n"
+        "Supports Chinese/Mandarin (Fluent), Japanese (Fluent), Korean (Fluent), "
+        "German (Fluent), Spanish (Fluent), French (Fluent), Italian (Fluent), Portuguese (Fluent), "
+        "Dutch (Fluent), Russian (Fluent), Turkish (Good), Vietnamese (Good), Arabic (Good), "
+        "Hindi (Good), Indonesian (Good)."
+    ),
+    "piper": (
+        "Local, low latency."
+        "Installs locally automatically on first use.\n"
+        "Each voice profile takes a few seconds to download on first use (50-100mb per voice).\n"
+        "Primarily an English speaking model. Strong American accent when speaking other languages.\n"
+        "Specialized voices for certain languages (see dropdown)"
+        # "English US (Excellent), English UK (Excellent), German (Good), Spanish (Good), French (Good), "
+        # "Italian (Good), Portuguese (Good), Polish (Good), Czech (Fair), Russian (Fair), Ukrainian (Fair), Dutch (Fair)."
+    ),
+    "elevenlabs": (
+        "Cloud based, medium latency.\n"
+        "English only."
+    ),
+    "elevenlabs_multilingual_v2": (
+        "Cloud based, high latency.\n"
+        "28 languages: English, Chinese, German, Spanish, French, Italian, Japanese, Korean, Portuguese, "
+        "Polish, Hindi, Arabic, Turkish, Dutch, Swedish, Finnish, Czech, Greek, Hebrew, Indonesian, Malay, "
+        "Ukrainian, Vietnamese, Romanian, Hungarian, Danish, Norwegian, Russian.\n"
+        "Voices have \"native speaker\" quality in their training language."
+        # "A voice cloned from an English speaker will have an English accent when speaking other languages."
+    ),
+}
+
+
+def _fill_combo(combo, displays, data):
+    """Replace combo contents in one insertItems call, then attach UserRole data.
+    The index is reset before signals are unblocked, so connected slots never see the rebuild."""
+    combo.blockSignals(True)
+    combo.clear()
+    combo.addItems(displays)
+    for i, d in enumerate(data):
+        combo.setItemData(i, d)
+    combo.setCurrentIndex(0)
+    combo.blockSignals(False)
+
+
+_TTS_VOICES_CACHE = {}
+
+
+def _tts_voices(backend_id):
+    """(displays, voice_ids) tuples for a TTS backend, or None for backends without a voice list.
+    tts_engine (numpy, sounddevice) is imported on first use."""
+    if backend_id not in _TTS_VOICES_CACHE:
+        import tts_engine
+        name = {
+            "piper": "PIPER_VOICES",
+            "openai": "OPENAI_VOICES",
+            "elevenlabs": "ELEVENLABS_VOICES",
+            "elevenlabs_multilingual_v2": "ELEVENLABS_VOICES",
+            "xtts": "XTTS_VOICES",
+        }.get(backend_id)
+        voices = getattr(tts_engine, name) if name else None
+        _TTS_VOICES_CACHE[backend_id] = (
+            (tuple(disp for disp, _ in voices), tuple(vid for _, vid in voices)) if voices else None
+        )
+    return _TTS_VOICES_CACHE[backend_id]
+
+
+_INPUT_DEVICE_CACHE = None
+
+
+def _get_input_devices(force=False):
+    """Audio input devices as ([(id, name, max_input_channels), ...], default_input_id, blackhole_id).
+    Enumerated once per process (slow on some hosts); force=True re-queries."""
+    global _INPUT_DEVICE_CACHE
+    if _INPUT_DEVICE_CACHE is None or force:
+        import sounddevice as sd
+        devices = [
+            (i, dev["name"], dev["max_input_channels"])
+            for i, dev in enumerate(sd.query_devices())
+            if dev["max_input_channels"] > 0
+        ]
+        # First BlackHole loopback device, auto-selected by the language dialog
+        blackhole_id = next((i for i, name, _ in devices if "blackhole" in name.lower()), None)
+        _INPUT_DEVICE_CACHE = (devices, sd.default.device[0], blackhole_id)
+    return _INPUT_DEVICE_CACHE
+
+
 def show_language_dialog(parent=None):
     """Show language selection dialog. Returns (source_lang, target_lang) as internal codes."""
     dlg = QDialog(parent)
+    dlg.setUpdatesEnabled(False)  # build everything, then paint once
     dlg.setWindowTitle("BiliOCR")
     dlg.setMinimumWidth(340)
     dlg.setStyleSheet(f"""
@@ -1858,80 +2508,6 @@ def show_language_dialog(parent=None):
     layout.addWidget(small_rb)
     layout.addWidget(large_rb)
 
-    _LLM_PROVIDERS = [
-        ("SiliconFlow.com", "siliconflow_com"),
-        ("SiliconFlow.cn", "siliconflow_cn"),
-        ("OpenAI ", "openai"),
-        ("DeepSeek", "deepseek"),
-        ("Anthropic", "anthropic"),
-        ("Groq", "groq"),
-        ("Together", "together"),
-        ("HuggingFace API", "huggingface_api"),
-        ("HuggingFace Local", "huggingface_local"),
-    ]
-    _LLM_MODELS = {
-        "siliconflow_com": [
-            # High Quality Tier
-            ("Qwen2.5-7B", "Qwen/Qwen2.5-7B-Instruct"), 
-            ("Qwen2.5-14B (Recommended)", "Qwen/Qwen2.5-14B-Instruct"), 
-            ("Qwen2.5-32B", "Qwen/Qwen2.5-32B-Instruct"),
-            ("Qwen2.5-72B", "Qwen/Qwen2.5-72B-Instruct"),  
-            ("Qwen3-8B", "Qwen/Qwen3-8B"), # $0.06/ M Tokens  Best quality for complex dialogue
-            ("DeepSeek-V3.2", "deepseek-ai/DeepSeek-V3.2"),
-            ("Tencent Hunyuan-MT-7B (Recommended)", "tencent/Hunyuan-MT-7B"),  # Excellent Chinese, very cheap
-            # ("Deepseek-V3.1", "deepseek-ai/DeepSeek-V3.1"),  # Excellent Chinese, very cheap
-            # ("GLM-4-9B", "THUDM/GLM-4-9B-0414"),  #$0.086/M tokens
-            ("GLM-4-32B", "THUDM/GLM-4-32B-0414"),  #$0.27/M Tokens
-            # ("moonshotai/Kimi-K2.5", "moonshotai/Kimi-K2.5"),
-            ("MiniMax-M2.1", "MiniMaxAI/MiniMax-M2.1"),
-        ],
-        "siliconflow_cn": [
-            # High Quality Tier
-            ("Qwen2.5-7B", "Qwen/Qwen2.5-7B-Instruct"), 
-            ("Qwen2.5-14B", "Qwen/Qwen2.5-14B-Instruct"), 
-            ("Qwen2.5-32B", "Qwen/Qwen2.5-32B-Instruct"),
-            ("Qwen2.5-72B", "Qwen/Qwen2.5-72B-Instruct"),  # Best quality for complex dialogue
-            ("DeepSeek-V3.2", "deepseek-ai/DeepSeek-V3.2"),  # Excellent Chinese, very cheap
-            ("Deepseek V3 (Pro)", "Prodeepseek-ai/DeepSeek-V3"),  
-            # Fast/Cheap Tier (Pro/ optimized endpoints)
-            ("GLM-4-9B", "THUDM/GLM-4-9B-0414"),  
-            ("GLM-4-32B", "THUDM/GLM-4-32B-0414"),  
-            ("moonshotai/Kimi-K2.5", "moonshotai/Kimi-K2.5"),
-            ("MiniMax-M2.1", "MiniMaxAI/MiniMax-M2.1"),
-        ],
-        "openai": [
-          
-            ("GPT-4o mini (Recommended)", "gpt-4o-mini"),              # Fastest, cheapest, good enough for most subs
-            ("GPT-4o", "gpt-4o"),                        # Best quality for nuance/idioms
-            # ("GPT-4o-latest", "gpt-4o-2024-11-20"),      # Auto-updates to newest 4o                     # Reasoning model - good for ambiguous context
-            ("GPT-3.5 Turbo", "gpt-3.5-turbo"),  
-            ("o3-mini", "o3-mini"), 
-            ("GPT-5", "gpt-5"),              # Fastest, cheapest, good enough for most subs
-            ("GPT-5 mini", "gpt-5-mini"),    
-            ("GPT-5 nano", "gpt-5-nano"),          # Legacy fallback (cheapest)
-        ],
-
-        "deepseek": [
-            ("DeepSeek-V3", "deepseek-chat"),            # General chat (the V3 model) - excellent Chinese
-            ("DeepSeek-V2.5", "deepseek-chat-v2.5"),     # Older but very cheap fallback (if supported)
-        ],
-
-        # "gemini": [
-        #     ("Gemini 1.5 Flash", "gemini-1.5-flash"),      # Cheap, fast, good enough
-        #     ("Gemini 1.5 Pro", "gemini-1.5-pro"),          # Quality, huge context
-        #     ("Gemini 1.5 Flash-8B", "gemini-1.5-flash-8b") # Experimental, fastest
-        # ],
-        "anthropic": [
-            ("Claude 3.5 Haiku", "claude-3-5-haiku-20241022"),     # Fastest Claude, great for real-time
-            ("Claude 3.5 Sonnet", "claude-3-5-sonnet-20241022"),   # Best quality/price ratio
-            ("Claude 3.5 Sonnet v2", "claude-3-5-sonnet-20241022-v2"),  # Latest version with better instruction following
-            ("Claude 3 Opus", "claude-3-opus-20240229"),           # Heavy quality (slowest, most expensive) - only for film/artistic content
-        ],
-        # "groq": [("Llama 3.1 8B", "llama-3.1-8b-instant"), ("Llama 3.1 70B", "llama-3.1-70b-versatile"), ("Mixtral 8x7B", "mixtral-8x7b-32768")],
-        # "together": [("Llama 3 8B", "meta-llama/Llama-3-8b-chat-hf"), ("Llama 3 70B", "meta-llama/Llama-3-70b-chat-hf"), ("Mixtral 8x7B", "mistralai/Mixtral-8x7B-Instruct-v0.1")],
-        "huggingface_api": [("opus-mt-zh-en", "Helsinki-NLP/opus-mt-zh-en"), ("nllb-200", "facebook/nllb-200-distilled-600M"), ("m2m100", "facebook/m2m100_418M"), ("Qwen2-7B", "Qwen/Qwen2-7B-Instruct")],
-        "huggingface_local": [("opus-mt-zh-en", "Helsinki-NLP/opus-mt-zh-en"), ("nllb-200", "facebook/nllb-200-distilled-600M"), ("m2m100", "facebook/m2m100_418M"), ("Qwen2-7B", "Qwen/Qwen2-7B-Instruct")],
-    }
     llm_label = QLabel("LLM provider:")
     llm_sel = _LanguageSelector(_LLM_PROVIDERS, 0, dlg)
     llm_sel.setObjectName("lang_selector")
@@ -1947,34 +2523,18 @@ def show_language_dialog(parent=None):
     
     def check_llm_provider_api_key(provider_id):
         """Check if a provider has an API key available. Returns (has_key, key_name)."""
-        key_map = {
-            "siliconflow_com": "SILICONFLOW_COM_API_KEY",
-            "siliconflow_cn": "SILICONFLOW_CN_API_KEY",
-            "openai": "OPENAI_API_KEY",
-            "deepseek": "DEEPSEEK_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "groq": "GROQ_API_KEY",
-            "together": "TOGETHER_API_KEY",
-            "huggingface_api": "HF_API_KEY",
-            "huggingface_local": None,  # No key needed
-        }
-        key_env = key_map.get(provider_id)
+        key_env = _LLM_PROVIDER_KEY_ENV.get(provider_id)
         if key_env is None:
             return (True, None)  # No key needed
-        if isinstance(key_env, tuple):
-            # Multiple keys needed
-            has_all = all(os.environ.get(k) for k in key_env)
-            return (has_all, key_env[0] if not has_all else None)
-        has_key = bool(os.environ.get(key_env))
+        has_key = _api_key_present(key_env)
         return (has_key, key_env if not has_key else None)
     
     def _populate_models():
         provider = _LLM_PROVIDERS[llm_sel.get_index()][1]
-        models = _LLM_MODELS.get(provider, _LLM_MODELS["siliconflow_com"])
+        displays = _LLM_MODEL_DISPLAYS.get(provider, _LLM_MODEL_DISPLAYS["siliconflow_com"])
         model_combo.blockSignals(True)
         model_combo.clear()
-        for disp, _ in models:
-            model_combo.addItem(disp)
+        model_combo.addItems(displays)
         model_combo.setCurrentIndex(0)
         model_combo.blockSignals(False)
         
@@ -2042,7 +2602,7 @@ def show_language_dialog(parent=None):
     # OCR Backend selection (moved here from main dialog)
     ocr_label = QLabel("OCR Backend:")
     ocr_combo = QComboBox()
-    ocr_combo.setObjectName("ocr_backend_combo")  # Set object name for easy lookup
+    ocr_combo.setObjectName("ocr_backend_combo")
     ocr_combo.addItem("Vision (Local, Fast)", "vision")
     ocr_combo.addItem("EasyOCR (Local, Small Model)", "easyocr")
     ocr_combo.setCurrentIndex(0)  # Default to Vision
@@ -2067,7 +2627,6 @@ def show_language_dialog(parent=None):
     ocr_layout.addLayout(tts_row)
     
     # TTS Voice - dropdown that updates when backend changes
-    from tts_engine import PIPER_VOICES, OPENAI_VOICES, ELEVENLABS_VOICES, XTTS_VOICES
     tts_voice_label = QLabel("Voice:")
     tts_voice_combo = QComboBox()
     tts_voice_combo.setObjectName("tts_voice_combo")
@@ -2080,38 +2639,17 @@ def show_language_dialog(parent=None):
     tts_speed_spin.setToolTip("Speech speed (OpenAI only). 1.0 = normal, 1.2 = faster.")
     
     def _populate_tts_voice_combo(backend_id):
-        tts_voice_combo.blockSignals(True)
-        tts_voice_combo.clear()
         bid = (backend_id or "piper").lower()
-        if bid == "piper":
-            for disp, vid in PIPER_VOICES:
-                tts_voice_combo.addItem(disp, vid)
-            tts_speed_label.setVisible(False)
-            tts_speed_spin.setVisible(False)
-        elif bid == "openai":
-            for disp, vid in OPENAI_VOICES:
-                tts_voice_combo.addItem(disp, vid)
-            tts_speed_label.setVisible(True)
-            tts_speed_spin.setVisible(True)
-        elif bid in ("elevenlabs", "elevenlabs_multilingual_v2"):
-            for disp, vid in ELEVENLABS_VOICES:
-                tts_voice_combo.addItem(disp, vid)
-            tts_speed_label.setVisible(False)
-            tts_speed_spin.setVisible(False)
-        elif bid == "xtts":
-            for disp, vid in XTTS_VOICES:
-                tts_voice_combo.addItem(disp, vid)
-            tts_speed_label.setVisible(False)
-            tts_speed_spin.setVisible(False)
+        voices = _tts_voices(bid)
+        if voices:
+            _fill_combo(tts_voice_combo, *voices)
         else:
-            tts_voice_combo.addItem("Default", "default")
-            tts_speed_label.setVisible(False)
-            tts_speed_spin.setVisible(False)
-        tts_voice_combo.setCurrentIndex(0)
-        tts_voice_combo.blockSignals(False)
+            _fill_combo(tts_voice_combo, ("Default",), ("default",))
+        show_speed = bid == "openai"  # Speed applies to OpenAI only
+        tts_speed_label.setVisible(show_speed)
+        tts_speed_spin.setVisible(show_speed)
     
     _populate_tts_voice_combo("piper")
-    tts_combo.currentIndexChanged.connect(lambda: _populate_tts_voice_combo(tts_combo.currentData()))
     
     tts_voice_row = QHBoxLayout()
     tts_voice_row.addWidget(tts_voice_label)
@@ -2120,38 +2658,6 @@ def show_language_dialog(parent=None):
     tts_voice_row.addWidget(tts_speed_spin)
     ocr_layout.addLayout(tts_voice_row)
     
-    # TTS model language support info - updates when backend changes
-    TTS_LANG_INFO = {
-        "openai": (
-            "Cloud based, medium to high latency.\n"
-            "English (Native – best), Strong American accent when speaking other languages.\n"
-            "Supports Chinese/Mandarin (Fluent), Japanese (Fluent), Korean (Fluent), "
-            "German (Fluent), Spanish (Fluent), French (Fluent), Italian (Fluent), Portuguese (Fluent), "
-            "Dutch (Fluent), Russian (Fluent), Turkish (Good), Vietnamese (Good), Arabic (Good), "
-            "Hindi (Good), Indonesian (Good)."
-        ),
-        "piper": (
-            "Local, low latency."
-            "Installs locally automatically on first use.\n"
-            "Each voice profile takes a few seconds to download on first use (50-100mb per voice).\n"
-            "Primarily an English speaking model. Strong American accent when speaking other languages.\n"
-            "Specialized voices for certain languages (see dropdown)"
-            # "English US (Excellent), English UK (Excellent), German (Good), Spanish (Good), French (Good), "
-            # "Italian (Good), Portuguese (Good), Polish (Good), Czech (Fair), Russian (Fair), Ukrainian (Fair), Dutch (Fair)."
-        ),
-        "elevenlabs": (
-            "Cloud based, medium latency.\n"
-            "English only."
-        ),
-        "elevenlabs_multilingual_v2": (
-            "Cloud based, high latency.\n"
-            "28 languages: English, Chinese, German, Spanish, French, Italian, Japanese, Korean, Portuguese, "
-            "Polish, Hindi, Arabic, Turkish, Dutch, Swedish, Finnish, Czech, Greek, Hebrew, Indonesian, Malay, "
-            "Ukrainian, Vietnamese, Romanian, Hungarian, Danish, Norwegian, Russian.\n"
-            "Voices have \"native speaker\" quality in their training language."
-            # "A voice cloned from an English speaker will have an English accent when speaking other languages."
-        ),
-    }
     tts_lang_info_label = QLabel()
     tts_lang_info_label.setObjectName("tts_lang_info_label")
     tts_lang_info_label.setWordWrap(True)
@@ -2161,12 +2667,18 @@ def show_language_dialog(parent=None):
     
     def _update_tts_lang_info(backend_id):
         bid = (backend_id or "piper").lower()
-        text = TTS_LANG_INFO.get(bid, "")
+        text = _TTS_LANG_INFO.get(bid, "")
         tts_lang_info_label.setText(text)
         tts_lang_info_label.setVisible(bool(text))
     
     _update_tts_lang_info("piper")
-    tts_combo.currentIndexChanged.connect(lambda: _update_tts_lang_info(tts_combo.currentData()))
+    
+    def _on_tts_backend_changed():
+        bid = tts_combo.currentData()
+        _populate_tts_voice_combo(bid)
+        _update_tts_lang_info(bid)
+    
+    tts_combo.currentIndexChanged.connect(_on_tts_backend_changed)
     ocr_layout.addWidget(tts_lang_info_label)
     
     ocr_layout.addStretch()
@@ -2186,47 +2698,37 @@ def show_language_dialog(parent=None):
     audio_layout.addWidget(audio_info)
     
     # Audio device selection
-    import sounddevice as sd
     device_label = QLabel("Audio Input Device:")
     device_combo = QComboBox()
-    devices = sd.query_devices()
-    print("[DEBUG] Available audio devices:")
-    default_input = sd.default.device[0]
-    print(f"[DEBUG] Default input device: {default_input}")
-    
-    # Show ALL devices (input and virtual) - filter for those with >0 input channels
-    available_devices = []
-    for i, dev in enumerate(devices):
-        if dev['max_input_channels'] > 0:
-            label = f"{dev['name']} (ID: {i}, {dev['max_input_channels']}ch)"
-            print(f"  [{i}] {label}")
-            device_combo.addItem(label, i)
-            available_devices.append((i, dev['name']))
-    
-    # Auto-select BlackHole if available
-    blackhole_id = None
-    for idx, name in available_devices:
-        if "blackhole" in name.lower():
-            blackhole_id = idx
-            break
-    
-    if blackhole_id is not None:
-        device_combo.setCurrentIndex(device_combo.findData(blackhole_id))
-        print(f"[DEBUG] Auto-selected BlackHole device: {blackhole_id}")
-    elif default_input >= 0:
-        device_combo.setCurrentIndex(device_combo.findData(default_input))
+
+    def _populate_device_combo():
+        # Filled the first time the Audio tab is shown (imports sounddevice / PortAudio)
+        available_devices, default_input, blackhole_id = _get_input_devices()
+        
+        # Show ALL devices (input and virtual) with >0 input channels
+        _fill_combo(
+            device_combo,
+            [f"{name} (ID: {i}, {channels}ch)" for i, name, channels in available_devices],
+            [i for i, _, _ in available_devices],
+        )
+        
+        # Auto-select BlackHole if available
+        if blackhole_id is not None:
+            device_combo.setCurrentIndex(device_combo.findData(blackhole_id))
+        elif default_input >= 0:
+            device_combo.setCurrentIndex(device_combo.findData(default_input))
     audio_layout.addWidget(device_label)
     audio_layout.addWidget(device_combo)
     
     # ASR Backend selection
     asr_label = QLabel("ASR Backend:")
     asr_combo = QComboBox()
-    asr_combo.addItems([
+    _fill_combo(asr_combo, (
         "openai (Whisper API, OpenAI key required)",
         "whisper (local, fast, good accuracy)", 
         "funasr (local, Chinese optimized; first load takes time)", 
         "mlx (local, Apple Silicon acceleration)"
-    ])
+    ), ("openai", "whisper", "funasr", "mlx"))
     audio_layout.addWidget(asr_label)
     audio_layout.addWidget(asr_combo)
     
@@ -2254,14 +2756,20 @@ def show_language_dialog(parent=None):
     audio_layout.addWidget(funasr_model_combo)
     
     def _update_funasr_visibility():
-        is_funasr = asr_combo.currentText().strip().lower().startswith("funasr")
+        is_funasr = asr_combo.currentData() == "funasr"
         funasr_model_label.setVisible(is_funasr)
         funasr_model_combo.setVisible(is_funasr)
-    asr_combo.currentTextChanged.connect(_update_funasr_visibility)
+    asr_combo.currentIndexChanged.connect(_update_funasr_visibility)
     _update_funasr_visibility()
     
     audio_layout.addStretch()
-    mode_tabs.addTab(audio_tab, "🎙️ Audio Mode")
+    audio_tab_index = mode_tabs.addTab(audio_tab, "🎙️ Audio Mode")
+
+    def _on_mode_tab_changed(index):
+        if index == audio_tab_index:
+            mode_tabs.currentChanged.disconnect(_on_mode_tab_changed)
+            _populate_device_combo()
+    mode_tabs.currentChanged.connect(_on_mode_tab_changed)
     
     layout.addWidget(mode_tabs)
 
@@ -2279,128 +2787,52 @@ def show_language_dialog(parent=None):
     learn_provider_combo.setVisible(False)
     learn_model_combo.setVisible(False)
     
-    def get_available_providers():
-        """Get list of providers that have API keys available."""
-        available = []
-        key_map = {
-            "siliconflow_com": "SILICONFLOW_COM_API_KEY",
-            "siliconflow_cn": "SILICONFLOW_CN_API_KEY",
-            "openai": "OPENAI_API_KEY",
-            "deepseek": "DEEPSEEK_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "groq": "GROQ_API_KEY",
-            "together": "TOGETHER_API_KEY",
-            "huggingface_api": "HF_API_KEY",
-            "huggingface_local": None,  # No key needed
-            "deepl": "DEEPL_AUTH_KEY",
-            "google": "GOOGLE_TRANSLATE_API_KEY",
-            "baidu": ("BAIDU_APP_ID", "BAIDU_APP_SECRET"),
-            "youdao": ("YOUDAO_APP_KEY", "YOUDAO_APP_SECRET"),
-            "yandex": "YANDEX_API_KEY",
-            "libretranslate": "LIBRETRANSLATE_API_KEY",
-            "caiyun": "CAIYUN_TOKEN",
-            "niutrans": "NIUTRANS_APIKEY",
-        }
-        
-        # Add local dictionary option (English only)
-        # All entries: (provider_id, display_name) for consistency
-        available.append(("local_dict", "Local Dictionary (English only)"))
-        
-        # _LLM_PROVIDERS is (display_name, provider_id) - we need (provider_id, display_name)
-        for display_name, prov_id in _LLM_PROVIDERS:
-            key_env = key_map.get(prov_id)
-            if key_env is None:  # No key needed (e.g., huggingface_local)
-                available.append((prov_id, display_name))
-            elif isinstance(key_env, tuple):
-                # Multiple keys needed
-                if all(os.environ.get(k) for k in key_env):
-                    available.append((prov_id, display_name))
-            elif os.environ.get(key_env):
-                available.append((prov_id, display_name))
-        
-        # Add MT providers
-        if os.environ.get("DEEPL_AUTH_KEY"):
-            available.append(("deepl", "DeepL"))
-        if os.environ.get("GOOGLE_TRANSLATE_API_KEY"):
-            available.append(("google", "Google Translate"))
-        if os.environ.get("BAIDU_APP_ID") and os.environ.get("BAIDU_APP_SECRET"):
-            available.append(("baidu", "Baidu"))
-        if os.environ.get("YOUDAO_APP_KEY") and os.environ.get("YOUDAO_APP_SECRET"):
-            available.append(("youdao", "Youdao"))
-        if os.environ.get("YANDEX_API_KEY"):
-            available.append(("yandex", "Yandex"))
-        if os.environ.get("CAIYUN_TOKEN"):
-            available.append(("caiyun", "Caiyun 彩云小译"))
-        if os.environ.get("NIUTRANS_APIKEY"):
-            available.append(("niutrans", "Niutrans 小牛翻译"))
-        # LibreTranslate can work without API key (public instance)
-        available.append(("libretranslate", "LibreTranslate"))
-        
-        return available
+    # Computed once per dialog open; the provider combo and every fallback below index into it
+    available_providers = _available_learn_providers()
     
     def update_learn_provider_combo():
         """Update learn provider combo with available providers."""
-        learn_provider_combo.blockSignals(True)
-        learn_provider_combo.clear()
-        available = get_available_providers()
-        if available:
-            for provider_id, provider_name in available:
-                # Use setItemData to ensure the data is properly stored
-                index = learn_provider_combo.count()
-                learn_provider_combo.addItem(provider_name)
-                learn_provider_combo.setItemData(index, provider_id)
+        if available_providers:
+            _fill_combo(
+                learn_provider_combo,
+                [name for _, name in available_providers],
+                [provider_id for provider_id, _ in available_providers],
+            )
         else:
-            learn_provider_combo.addItem("No API keys configured")
-            learn_provider_combo.setItemData(0, None)
-        learn_provider_combo.blockSignals(False)
+            _fill_combo(learn_provider_combo, ("No API keys configured",), (None,))
         # Update model combo after provider combo is populated
         if learn_provider_combo.count() > 0:
             update_learn_model_combo()
     
+    last_learn_provider = [None]  # Provider the model combo was last filled for
+    
     def update_learn_model_combo():
         """Update learn model combo based on selected provider."""
-        learn_model_combo.blockSignals(True)
-        learn_model_combo.clear()
-        
-        if learn_provider_combo.count() == 0:
-            learn_model_combo.blockSignals(False)
-            return
-        
         # Get provider ID from current selection
         current_index = learn_provider_combo.currentIndex()
         if current_index < 0:
-            learn_model_combo.blockSignals(False)
+            last_learn_provider[0] = None
+            _fill_combo(learn_model_combo, (), ())
             return
         
         # Get the data (provider_id) from the combo box item
         provider_id = learn_provider_combo.itemData(current_index)
         
         # If itemData returns None, try to get it from the available providers list
-        if provider_id is None:
-            available = get_available_providers()
-            if current_index < len(available):
-                provider_id = available[current_index][0]  # Get the ID from the tuple
+        if provider_id is None and current_index < len(available_providers):
+            provider_id = available_providers[current_index][0]  # Get the ID from the tuple
         
-        # Define MT providers (no models)
-        mt_providers = {"deepl", "google", "baidu", "youdao", "yandex", "libretranslate", "caiyun", "niutrans"}
+        # Same provider re-selected: keep the current models (and the user's pick)
+        if provider_id == last_learn_provider[0] and learn_model_combo.count():
+            return
+        last_learn_provider[0] = provider_id
         
-        # Local dictionary doesn't need a model
-        if provider_id == "local_dict":
-            learn_model_combo.addItem("N/A", None)
-        elif provider_id in mt_providers:
-            # MT providers don't have models
-            learn_model_combo.addItem("N/A", None)
-        elif provider_id and provider_id in _LLM_MODELS:
-            models = _LLM_MODELS[provider_id]
-            if models and len(models) > 0:
-                for disp_name, model_name in models:
-                    learn_model_combo.addItem(disp_name, model_name)
-            else:
-                learn_model_combo.addItem("N/A", None)
+        # Local dictionary and MT providers don't have models
+        if provider_id and provider_id != "local_dict" and provider_id not in _MT_PROVIDERS and _LLM_MODEL_IDS.get(provider_id):
+            _fill_combo(learn_model_combo, _LLM_MODEL_DISPLAYS[provider_id], _LLM_MODEL_IDS[provider_id])
         else:
             # Unknown provider or no models available
-            learn_model_combo.addItem("N/A", None)
-        learn_model_combo.blockSignals(False)
+            _fill_combo(learn_model_combo, ("N/A",), (None,))
     
     def on_learn_provider_changed():
         update_learn_model_combo()
@@ -2420,10 +2852,8 @@ def show_language_dialog(parent=None):
 
     # Check if From language is Chinese
     def update_learn_visibility():
-        from_idx = from_sel.get_index()
-        from_code = _LANG_OPTIONS[from_idx][1]
-        to_idx = to_sel.get_index()
-        to_code = _LANG_OPTIONS_TARGET[to_idx][1]
+        from_code = _LANG_CODES[from_sel.get_index()]
+        to_code = _LANG_CODES_TARGET[to_sel.get_index()]
         is_chinese = (from_code == "zh")
         is_english = (to_code == "en")
         learn_cb.setVisible(is_chinese)
@@ -2435,14 +2865,11 @@ def show_language_dialog(parent=None):
         if learn_provider_combo.count() > 0 and learn_provider_combo.currentIndex() >= 0:
             current_index = learn_provider_combo.currentIndex()
             provider_id = learn_provider_combo.itemData(current_index)
-            if provider_id is None:
-                available = get_available_providers()
-                if current_index < len(available):
-                    provider_id = available[current_index][0]
+            if provider_id is None and current_index < len(available_providers):
+                provider_id = available_providers[current_index][0]
         
-        mt_providers = {"deepl", "google", "baidu", "youdao", "yandex", "libretranslate"}
         # Hide model dropdown only when we KNOW it's local_dict or MT
-        hide_model = provider_id == "local_dict" or provider_id in mt_providers
+        hide_model = provider_id == "local_dict" or provider_id in _MT_PROVIDERS
         show_model = is_chinese and learn_cb.isChecked() and not hide_model
         learn_model_label.setVisible(show_model)
         learn_model_combo.setVisible(show_model)
@@ -2472,19 +2899,20 @@ def show_language_dialog(parent=None):
     btns.rejected.connect(dlg.reject)
     layout.addWidget(btns)
 
-    dlg.installEventFilter(_DialogRaiseFilter(dlg))
+    _install_dialog_raise_filter(dlg)
+    dlg.setUpdatesEnabled(True)
     if dlg.exec_() != QDialog.Accepted:
         return None, None, False, None, None, False, None, None, "ocr", None, "whisper", "vision"
     use_large = large_rb.isChecked()
     llm_provider = _LLM_PROVIDERS[llm_sel.get_index()][1] if use_large else None
     llm_model = None
     if use_large and llm_provider:
-        models = _LLM_MODELS.get(llm_provider, _LLM_MODELS["siliconflow_com"])
+        model_ids = _LLM_MODEL_IDS.get(llm_provider, _LLM_MODEL_IDS["siliconflow_com"])
         idx = model_combo.currentIndex()
-        if 0 <= idx < len(models):
-            llm_model = models[idx][1]
-    from_lang = _LANG_OPTIONS[from_sel.get_index()][1]
-    to_lang = _LANG_OPTIONS_TARGET[to_sel.get_index()][1]
+        if 0 <= idx < len(model_ids):
+            llm_model = model_ids[idx]
+    from_lang = _LANG_CODES[from_sel.get_index()]
+    to_lang = _LANG_CODES_TARGET[to_sel.get_index()]
     # Learn mode: only enable if From language is Chinese AND checkbox is checked
     is_chinese_source = (from_lang == "zh")
     learn_mode = is_chinese_source and learn_cb.isChecked()
@@ -2497,11 +2925,9 @@ def show_language_dialog(parent=None):
         provider_index = learn_provider_combo.currentIndex()
         if provider_index >= 0:
             learn_mode_provider = learn_provider_combo.itemData(provider_index)
-            if learn_mode_provider is None:
+            if learn_mode_provider is None and provider_index < len(available_providers):
                 # Fallback: get from available providers list
-                available = get_available_providers()
-                if provider_index < len(available):
-                    learn_mode_provider = available[provider_index][0]
+                learn_mode_provider = available_providers[provider_index][0]
         
         # Get model from combo box
         model_index = learn_model_combo.currentIndex()
@@ -2517,7 +2943,7 @@ def show_language_dialog(parent=None):
     
     # Audio settings (only for audio mode)
     audio_device_index = device_combo.currentData() if transcription_mode == "audio" else None
-    audio_asr_backend = asr_combo.currentText().split()[0] if transcription_mode == "audio" else "whisper"
+    audio_asr_backend = asr_combo.currentData() if transcription_mode == "audio" else "whisper"
     # Get FunASR model if FunASR backend is selected (from language dialog's combo)
     audio_funasr_model = None
     if transcription_mode == "audio" and audio_asr_backend == "funasr":
@@ -2532,17 +2958,10 @@ def show_language_dialog(parent=None):
     tts_voice = None
     tts_speed = 1.2
     if transcription_mode == "ocr":
-        ocr_tab_widgets = ocr_tab.findChildren(QComboBox)
-        for widget in ocr_tab_widgets:
-            if widget.objectName() == "ocr_backend_combo":
-                ocr_backend = widget.currentData() if widget.currentData() else "vision"
-            if widget.objectName() == "tts_backend_combo":
-                tts_backend = widget.currentData() if widget.currentData() else "piper"
-            if widget.objectName() == "tts_voice_combo":
-                tts_voice = widget.currentData() if widget.currentData() else None
-        speed_spin = ocr_tab.findChild(QDoubleSpinBox, "tts_speed_spin")
-        if speed_spin:
-            tts_speed = speed_spin.value()
+        ocr_backend = ocr_combo.currentData() or "vision"
+        tts_backend = tts_combo.currentData() or "piper"
+        tts_voice = tts_voice_combo.currentData() or None
+        tts_speed = tts_speed_spin.value()
     
     print(f"[Language Dialog] Returning: from={from_lang}, to={to_lang}, learn_mode={learn_mode}, learn_provider={learn_mode_provider}, learn_model={learn_mode_model}, transcription_mode={transcription_mode}, audio_device={audio_device_index}, asr_backend={audio_asr_backend}, funasr_model={audio_funasr_model}, ocr_backend={ocr_backend}, tts_backend={tts_backend}, tts_voice={tts_voice}, tts_speed={tts_speed}")
     return (
@@ -2567,6 +2986,14 @@ def show_language_dialog(parent=None):
 
 # --- Region selector: draggable frame (NO fullscreen - you see your video) ---
 
+# Resize edges as bit flags (0 = no edge); a corner is two flags combined
+_EDGE_N, _EDGE_S, _EDGE_W, _EDGE_E = 1, 2, 4, 8
+_CORNER_CURSORS = {
+    _EDGE_N | _EDGE_W: Qt.SizeFDiagCursor, _EDGE_S | _EDGE_E: Qt.SizeFDiagCursor,
+    _EDGE_N | _EDGE_E: Qt.SizeBDiagCursor, _EDGE_S | _EDGE_W: Qt.SizeBDiagCursor,
+    _EDGE_N: Qt.SizeVerCursor, _EDGE_S: Qt.SizeVerCursor, _EDGE_E: Qt.SizeHorCursor, _EDGE_W: Qt.SizeHorCursor,
+}
+
 
 class RegionSelector(QWidget):
     """Draggable frame. Red when selecting; white/semi-transparent when active. Stays visible for repositioning."""
@@ -2580,7 +3007,8 @@ class RegionSelector(QWidget):
         self.setAttribute(Qt.WA_NoSystemBackground)
         w, h = 800, 120
         self._inner_w, self._inner_h = w, h
-        p = self._padding()
+        self._recalc_geom()
+        p = self._pad
         cx = max(0, (screen_w - w) // 2)
         cy = screen_h - h - 80
         self.setGeometry(cx - p, cy - p, w + 2 * p, h + 2 * p)
@@ -2589,6 +3017,7 @@ class RegionSelector(QWidget):
         self._needs_reconfirm = False
         self._drag_start = None
         self._resize_corner = None
+        self._translator_app = None  # Set by main once the translator exists
 
         self._confirm_label = QLabel("Press Enter to confirm", self)
         self._confirm_label.setAlignment(Qt.AlignCenter)
@@ -2598,51 +3027,39 @@ class RegionSelector(QWidget):
         self._update_confirm_label()
 
     def _update_confirm_label(self):
-        r = self._inner_rect()
+        r = self._inner_r
         self._confirm_label.setGeometry(r)
         show = not self._active or self._needs_reconfirm
         self._confirm_label.setVisible(show)
 
-    def _padding(self):
-        """Buffer around inner rect for grabbing; scales with box size."""
-        m = min(self._inner_w, self._inner_h)
-        return max(24, min(60, int(m * 0.12)))
-
-    def _resize_zone_size(self):
-        """Resize cursor only within 5-10 px of the edge lines; shrink to 2 px for tiny boxes."""
+    def _recalc_geom(self):
+        """Cache padding, inner rect and resize zone; call whenever _inner_w/_inner_h change."""
         m = min(self._inner_w, self._inner_h)
-        return 2 if m < 80 else 8
-
-    def _inner_rect(self):
-        p = self._padding()
-        return QRect(p, p, self._inner_w, self._inner_h)
+        # Buffer around inner rect for grabbing; scales with box size
+        self._pad = max(24, min(60, int(m * 0.12)))
+        # Resize cursor only within 5-10 px of the edge lines; shrink to 2 px for tiny boxes
+        self._zone = 2 if m < 80 else 8
+        self._inner_r = QRect(self._pad, self._pad, self._inner_w, self._inner_h)
 
     def _screen_pos(self):
-        p = self._padding()
+        p = self._pad
         tl = self.mapToGlobal(self.rect().topLeft())
         return tl + QPoint(p, p)
 
     def _get_corner(self, pos):
-        m = self._resize_zone_size()
-        r = self._inner_rect()
+        m = self._zone
+        r = self._inner_r
         x, y = pos.x(), pos.y()
-        if x < r.left() + m and y < r.top() + m:
-            return "nw"
-        if x > r.right() - m and y < r.top() + m:
-            return "ne"
-        if x < r.left() + m and y > r.bottom() - m:
-            return "sw"
-        if x > r.right() - m and y > r.bottom() - m:
-            return "se"
+        edges = 0
         if y < r.top() + m:
-            return "n"
-        if y > r.bottom() - m:
-            return "s"
+            edges |= _EDGE_N
+        elif y > r.bottom() - m:
+            edges |= _EDGE_S
         if x < r.left() + m:
-            return "w"
-        if x > r.right() - m:
-            return "e"
-        return None
+            edges |= _EDGE_W
+        elif x > r.right() - m:
+            edges |= _EDGE_E
+        return edges
 
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton:
@@ -2653,24 +3070,26 @@ class RegionSelector(QWidget):
                 self._drag_start = (e.globalPos(), self.frameGeometry().topLeft())
 
     def mouseMoveEvent(self, e):
-        cursors = {"nw": Qt.SizeFDiagCursor, "se": Qt.SizeFDiagCursor, "ne": Qt.SizeBDiagCursor, "sw": Qt.SizeBDiagCursor, "n": Qt.SizeVerCursor, "s": Qt.SizeVerCursor, "e": Qt.SizeHorCursor, "w": Qt.SizeHorCursor}
-        p = self._padding()
         if self._resize_corner:
+            p = self._pad
             g = e.globalPos()
             geom = self.geometry()
             c = self._resize_corner
             min_inner = 80
-            if "e" in c:
+            if c & _EDGE_E:
                 geom.setRight(max(geom.left() + min_inner + 2 * p, g.x()))
-            if "w" in c:
+            if c & _EDGE_W:
                 geom.setLeft(min(geom.right() - min_inner - 2 * p, g.x()))
-            if "s" in c:
+            if c & _EDGE_S:
                 geom.setBottom(max(geom.top() + 40 + 2 * p, g.y()))
-            if "n" in c:
+            if c & _EDGE_N:
                 geom.setTop(min(geom.bottom() - 40 - 2 * p, g.y()))
+            if geom == self.geometry():
+                return  # Cursor moved along the edge or past the minimum size: nothing to resize
             self.setGeometry(geom)
             self._inner_w = max(min_inner, self.width() - 2 * p)
             self._inner_h = max(40, self.height() - 2 * p)
+            self._recalc_geom()
             self._update_confirm_label()
         elif self._drag_start:
             self.setCursor(Qt.ClosedHandCursor)
@@ -2678,7 +3097,7 @@ class RegionSelector(QWidget):
             self.move(self._drag_start[1] + delta)
         else:
             c = self._get_corner(e.pos())
-            self.setCursor(cursors.get(c, Qt.OpenHandCursor) if c else Qt.OpenHandCursor)
+            self.setCursor(_CORNER_CURSORS.get(c, Qt.OpenHandCursor))
 
     def _emit_region(self):
         p = self._screen_pos()
@@ -2688,10 +3107,12 @@ class RegionSelector(QWidget):
     def mouseReleaseEvent(self, e):
         if e.button() == Qt.LeftButton:
             if self._resize_corner:
-                # Reapply padding for new inner size so buffer scales
-                p = self._padding()
-                tl = self.mapToGlobal(self.rect().topLeft())
-                self.setGeometry(tl.x(), tl.y(), self._inner_w + 2 * p, self._inner_h + 2 * p)
+                # Reapply padding for new inner size so buffer scales (skip if the drag already left it right)
+                p = self._pad
+                w, h = self._inner_w + 2 * p, self._inner_h + 2 * p
+                if self.width() != w or self.height() != h:
+                    tl = self.mapToGlobal(self.rect().topLeft())
+                    self.setGeometry(tl.x(), tl.y(), w, h)
             if self._active and (self._drag_start or self._resize_corner):
                 self._emit_region()
                 self._needs_reconfirm = True
@@ -2699,9 +3120,8 @@ class RegionSelector(QWidget):
                 self.update()
             self._drag_start = None
             self._resize_corner = None
-            cursors = {"nw": Qt.SizeFDiagCursor, "se": Qt.SizeFDiagCursor, "ne": Qt.SizeBDiagCursor, "sw": Qt.SizeBDiagCursor, "n": Qt.SizeVerCursor, "s": Qt.SizeVerCursor, "e": Qt.SizeHorCursor, "w": Qt.SizeHorCursor}
             c = self._get_corner(e.pos())
-            self.setCursor(cursors.get(c, Qt.OpenHandCursor) if c else Qt.OpenHandCursor)
+            self.setCursor(_CORNER_CURSORS.get(c, Qt.OpenHandCursor))
 
     def keyPressEvent(self, e):
         if e.key() in (Qt.Key_Return, Qt.Key_Enter):
@@ -2738,8 +3158,9 @@ class RegionSelector(QWidget):
     def paintEvent(self, e):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        r = self._inner_rect()
-        ocr_paused = bool(getattr(self, "_translator_app", None) and getattr(self._translator_app, "_ocr_paused", False))
+        r = self._inner_r
+        translator = self._translator_app
+        ocr_paused = translator is not None and translator._ocr_paused
         if self._active and not self._needs_reconfirm and not ocr_paused:
             painter.setPen(QPen(QColor(255, 255, 255), 1))
             painter.setBrush(QColor(255, 255, 255, 25))
@@ -2775,39 +3196,40 @@ def select_region(app):
 
 # --- Side buttons (main menu, settings) ---
 
-def _icon_path(name):
-    """Resolve path to img/ SVG icons."""
-    base = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base, "img", f"{name}.svg")
+_IMG_DIR = os.path.join(_APP_DIR, "img")
+_ICON_CACHE = {}  # (name, ext) -> QIcon, or None when the file is missing
 
 
-def _icon_path_png(name):
-    """Resolve path to img/ PNG icons (play, pause)."""
-    base = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base, "img", f"{name}.png")
+def _cached_icon(name, ext="svg"):
+    """Shared QIcon for img/<name>.<ext>, or None if the file is missing. Checked and loaded once per process."""
+    key = (name, ext)
+    if key not in _ICON_CACHE:
+        path = os.path.join(_IMG_DIR, f"{name}.{ext}")
+        _ICON_CACHE[key] = QIcon(path) if os.path.exists(path) else None
+    return _ICON_CACHE[key]
 
 
 class _SideButton(QPushButton):
-    """Transparent icon button for the side panel."""
+    """Transparent icon button for the side panel. Styled by _SideButtons' sheet via the SideButton object name."""
     _BTN_STYLE = """
-        QPushButton {
+        QPushButton#SideButton {
             background: rgba(0, 0, 0, 25);
             border: 0px solid rgba(255, 255, 255, 50);
             border-radius: 8px;
         }
-        QPushButton:hover {
+        QPushButton#SideButton:hover {
             background: rgba(0, 0, 0, 70);
             border-color: rgba(255, 255, 255, 0.85);
         }
     """
-    def __init__(self, icon_path, parent=None):
+    def __init__(self, icon, parent=None):
         super().__init__(parent)
+        self.setObjectName("SideButton")
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedSize(44, 44)
-        if os.path.exists(icon_path):
-            self.setIcon(QIcon(icon_path))
+        if icon is not None:
+            self.setIcon(icon)
         self.setIconSize(QSize(24, 24))
-        self.setStyleSheet(self._BTN_STYLE)
 
 
 class _SideButtons(QWidget):
@@ -2818,12 +3240,13 @@ class _SideButtons(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_NoSystemBackground)
         self.setFixedSize(44, 96)  # 44+8+44
+        self.setStyleSheet(_SideButton._BTN_STYLE)  # Parsed once for both buttons
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
-        self.menu_btn = _SideButton(_icon_path("menu"), self)
+        self.menu_btn = _SideButton(_cached_icon("menu"), self)
         self.menu_btn.clicked.connect(self._on_menu)
-        self.settings_btn = _SideButton(_icon_path("settings"), self)
+        self.settings_btn = _SideButton(_cached_icon("settings"), self)
         self.settings_btn.clicked.connect(self._on_settings)
         layout.addWidget(self.menu_btn)
         layout.addWidget(self.settings_btn)
@@ -2854,6 +3277,97 @@ class _SideButtons(QWidget):
 
 # --- Overlay ---
 
+# Play/pause buttons: the clickable one keeps the overlay background; the other is lighter.
+# Keyed on the "enabled" property, which _update_button_states sets (and which also enables/disables the button).
+_PLAY_PAUSE_QSS = """
+    QPushButton {
+        background-color: rgba(0, 0, 0, 180);
+        border: none;
+        border-radius: 6px;
+        padding: 4px;
+    }
+    QPushButton[enabled="true"]:hover {
+        background-color: rgba(0, 0, 0, 160);
+    }
+    QPushButton[enabled="false"] {
+        background-color: rgba(0, 0, 0, 120);
+    }
+"""
+# Speak button: darker with a green border when TTS is on (tts="on"), lighter with no border when off
+_SPEAK_BTN_QSS = """
+    QPushButton {
+        background-color: rgba(60, 60, 60, 255);
+        border: none;
+        border-radius: 6px;
+        padding: 4px;
+    }
+    QPushButton:hover {
+        background-color: rgba(80, 80, 80, 255);
+    }
+    QPushButton[tts="on"] {
+        background-color: rgba(0, 0, 0, 255);
+        border: 2px solid rgba(12, 133, 88, 180);
+    }
+    QPushButton[tts="on"]:hover {
+        background-color: rgba(40, 40, 40, 255);
+    }
+"""
+
+
+# Status line escaping for the rich-text status label (one C-level pass instead of chained replace)
+_STATUS_ESCAPE_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;"})
+# Subtitle escaping; newlines become <br> for RichText mode
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br>"})
+_HTML_ESCAPE_RE = re.compile(r"[&<>\n]")
+
+
+def _to_html(s):
+    """Escape subtitle text for the RichText label. A regex pre-check returns text with nothing to escape unchanged."""
+    if _HTML_ESCAPE_RE.search(s) is None:
+        return s  # Common case: clean OCR/ASR text, nothing to escape
+    return s.translate(_HTML_ESCAPE_TABLE)
+
+
+def _repolish(widget):
+    """Re-evaluate property selectors after setProperty."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class _RoundedBgLabel(QLabel):
+    """QLabel with a rounded translucent background blitted from a pixmap, rebuilt only when the size changes."""
+    def __init__(self, text="", color=QColor(0, 0, 0, 180), radius=5, parent=None):
+        super().__init__(text, parent)
+        self._bg_color = color
+        self._bg_radius = radius
+        self._bg_pix = None
+
+    def _build_bg(self):
+        dpr = self.devicePixelRatioF()
+        pix = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.transparent)
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        p.setBrush(self._bg_color)
+        p.drawRoundedRect(QRect(0, 0, self.width(), self.height()), self._bg_radius, self._bg_radius)
+        p.end()
+        return pix
+
+    def resizeEvent(self, e):
+        self._bg_pix = None
+        super().resizeEvent(e)
+
+    def paintEvent(self, e):
+        if self._bg_pix is None:
+            self._bg_pix = self._build_bg()
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._bg_pix)
+        p.end()
+        super().paintEvent(e)
+
 
 class SubtitleOverlay(QWidget):
     """Overlay that can be vertically resized (expandable at top and bottom edges) and moved by dragging."""
@@ -2875,6 +3389,12 @@ class SubtitleOverlay(QWidget):
         self.setFocusPolicy(Qt.StrongFocus)
 
         self._drag_start = None
+        # Drag moves are coalesced to one move() per ~frame
+        self._pending_drag_pos = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._apply_drag)
         self._screen_w = screen_w
         self._region_width = width
         self._below_ocr = below_ocr  # True = overlay below OCR (grow down); False = above (grow up)
@@ -2892,6 +3412,7 @@ class SubtitleOverlay(QWidget):
         self.status_label = QLabel()
         self.status_label.setWordWrap(True)
         self.status_label.setFont(QFont("Arial", 12))
+        self._status_line_spacing = QFontMetrics(self.status_label.font()).lineSpacing()
         self.status_label.setTextFormat(Qt.RichText)
         self.status_label.setStyleSheet("color: #ff6b6b; padding: 2px 0;")
         self.status_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
@@ -2904,16 +3425,16 @@ class SubtitleOverlay(QWidget):
         status_row.addWidget(self.status_label, 1)
         layout.addLayout(status_row)
 
-        self.label = QLabel("Waiting for subtitles... (Esc to quit)")
+        self.label = _RoundedBgLabel("Waiting for subtitles... (Esc to quit)", radius=5)
         self.label.setWordWrap(True)
-        self.label.setTextFormat(Qt.RichText)
+        self.label.setTextFormat(Qt.PlainText)  # Switched per update by _set_subtitle
+        self._subtitle_state = None  # (text, rich) last passed to the label
         self._update_subtitle_font()
+        # Background is painted by _RoundedBgLabel
         self.label.setStyleSheet("""
             QLabel {
                 color: white;
-                background-color: rgba(0, 0, 0, 180);
                 padding: 10px;
-                border-radius: 5px;
             }
         """)
         # Make overlay background transparent to show through
@@ -2946,14 +3467,21 @@ class SubtitleOverlay(QWidget):
         self._last_display_text = None
         self._status_messages = []
         self._status_bar_height = 0
+        self._last_adjust_key = None  # (subtitle_h, status_h) applied by the last adjust_height_to_content
+        self._snap_anim = None  # QPropertyAnimation on pos, created on first snap
+        self._measure_doc = None  # Reused QTextDocument for _content_height_for_text
+        self._measure_font_size = None
+        self._content_h_cache = {}  # (text, available_width, font_size) -> height
+        self._last_pill_counts = None  # Counts shown by the info pill
+        self._pill_prefix = {}  # model name -> "name · "
+        self._status_html_cache = {}  # (text, is_good) -> escaped <span> fragment
+        self._last_status_html = None
         # Info pill: tab sticking off top right of subtitle area (does not move with status stack)
-        self.info_pill = QLabel()
+        self.info_pill = _RoundedBgLabel(radius=6)
         self.info_pill.setFont(QFont("Arial", 10))
         self.info_pill.setStyleSheet("""
             color: rgba(255,255,255,0.95);
-            background-color: rgba(0, 0, 0, 180);
             padding: 4px 12px 6px;
-            border-radius: 6px 6px 6px 6px;
         """)
         self.info_pill.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         # Ensure the pill can extend slightly beyond widget bounds if needed
@@ -2966,14 +3494,9 @@ class SubtitleOverlay(QWidget):
     def _create_play_pause_buttons(self):
         """Create play and pause buttons stacked vertically for audio mode."""
         container = QWidget(self)
-        container_layout = QVBoxLayout()
-        container_layout.setSpacing(8)
-        container_layout.setContentsMargins(0, 0, 0, 0)
         
-        play_path = _icon_path_png("play")
-        pause_path = _icon_path_png("pause")
-        self._play_icon = QIcon(play_path) if os.path.exists(play_path) else QIcon()
-        self._pause_icon = QIcon(pause_path) if os.path.exists(pause_path) else QIcon()
+        self._play_icon = _cached_icon("play", "png") or QIcon()
+        self._pause_icon = _cached_icon("pause", "png") or QIcon()
         
         # Play button (shown when paused)
         self._play_btn = QPushButton(container)
@@ -2991,26 +3514,14 @@ class SubtitleOverlay(QWidget):
         self._pause_btn.setIcon(self._pause_icon)
         self._pause_btn.setIconSize(QSize(20, 20))
         
-        # Shared stylesheet: no border, different states for enabled/disabled
-        button_style = """
-            QPushButton {
-                background-color: rgba(0, 0, 0, 180);
-                border: none;
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QPushButton[enabled="true"] {
-                background-color: rgba(0, 0, 0, 120);
-            }
-            QPushButton[enabled="true"]:hover {
-                background-color: rgba(0, 0, 0, 160);
-            }
-            QPushButton[enabled="false"] {
-                background-color: rgba(0, 0, 0, 180);
-            }
-        """
-        self._play_btn.setStyleSheet(button_style)
-        self._pause_btn.setStyleSheet(button_style)
+        # Shared stylesheet, installed once; state changes only flip the "enabled" property
+        self._play_btn.setStyleSheet(_PLAY_PAUSE_QSS)
+        self._pause_btn.setStyleSheet(_PLAY_PAUSE_QSS)
+        # Icon opacity effects, created once; _update_button_states only changes their opacity
+        self._play_opacity = QGraphicsOpacityEffect(self._play_btn)
+        self._play_btn.setGraphicsEffect(self._play_opacity)
+        self._pause_opacity = QGraphicsOpacityEffect(self._pause_btn)
+        self._pause_btn.setGraphicsEffect(self._pause_opacity)
         
         def on_play_click():
             app = getattr(self, "_translator_app", None)
@@ -3032,12 +3543,10 @@ class SubtitleOverlay(QWidget):
         
         self._play_btn.clicked.connect(on_play_click)
         self._pause_btn.clicked.connect(on_pause_click)
-        container_layout.addWidget(self._play_btn)   # Play below
-        container_layout.addWidget(self._pause_btn)  # Pause on top (default: running)
-
-        container_layout.addStretch()  # Add stretch to prevent cutoff
-        container.setLayout(container_layout)
-        container.setFixedHeight(92)  # 40 + 8 spacing + 40 + 4 margin = 92
+        # Fixed-size container: place the buttons directly instead of through a layout
+        self._play_btn.move(0, 0)    # Play on top
+        self._pause_btn.move(0, 48)  # Pause below (40 + 8 spacing)
+        container.setFixedSize(40, 92)  # 40 + 8 spacing + 40 + 4 margin = 92
         
         # Set initial state (running = pause button enabled)
         self._update_button_states()
@@ -3048,18 +3557,16 @@ class SubtitleOverlay(QWidget):
         """Create Speak button for TTS (OCR mode only). Style matches play/pause."""
         container = QWidget(self)
         container.setFixedSize(30,30)
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
         
-        speak_path = _icon_path_png("speak")
+        speak_icon = _cached_icon("speak", "png")
         self._speak_btn = QPushButton(container)
         self._speak_btn.setCursor(Qt.PointingHandCursor)
         self._speak_btn.setFixedSize(30, 30)
         self._speak_btn.setFocusPolicy(Qt.NoFocus)
+        self._speak_btn.setStyleSheet(_SPEAK_BTN_QSS)
         
-        if os.path.exists(speak_path):
-            self._speak_btn.setIcon(QIcon(speak_path))
+        if speak_icon is not None:
+            self._speak_btn.setIcon(speak_icon)
             self._speak_btn.setIconSize(QSize(20, 20))
         else:
             self._speak_btn.setText("S")
@@ -3079,7 +3586,7 @@ class SubtitleOverlay(QWidget):
             self._update_speak_button_states()
         
         self._speak_btn.clicked.connect(on_speak_click)
-        layout.addWidget(self._speak_btn)
+        self._speak_btn.move(0, 0)  # Fills the fixed 30x30 container; no layout needed
         
         self._speak_container = container
         self._update_speak_button_states()
@@ -3096,33 +3603,8 @@ class SubtitleOverlay(QWidget):
         # Clear any graphics effect
         self._speak_btn.setGraphicsEffect(None)
         
-        if tts_enabled:
-            # TTS ON: darker background with green border
-            self._speak_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 255);
-                    border: 2px solid rgba(12, 133, 88, 180);
-                    border-radius: 6px;
-                    padding: 4px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(40, 40, 40, 255);
-                }
-            """)
-        else:
-            # TTS OFF: lighter background, no border
-            self._speak_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(60, 60, 60, 255);
-                    border: none;
-                    border-radius: 6px;
-                    padding: 4px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(80, 80, 80, 255);
-                }
-            """)
-        
+        self._speak_btn.setProperty("tts", "on" if tts_enabled else "off")
+        _repolish(self._speak_btn)
         self._speak_btn.update()
 
     
@@ -3141,71 +3623,19 @@ class SubtitleOverlay(QWidget):
             # Play button enabled, pause button disabled
             self._play_btn.setProperty("enabled", "true")
             self._pause_btn.setProperty("enabled", "false")
-            # Enabled button: overlay background, very transparent icon
-            self._play_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 180);
-                    border: none;
-                    border-radius: 6px;
-                    padding: 4px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(0, 0, 0, 160);
-                }
-            """)
-            # Disabled button: lighter background, fully opaque icon
-            self._pause_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 120);
-                    border: none;
-                    border-radius: 6px;
-                    padding: 4px;
-                }
-            """)
-            # Use QGraphicsOpacityEffect for icon transparency
-            play_opacity = QGraphicsOpacityEffect()
-            play_opacity.setOpacity(0.3)  # Enabled: very transparent
-            self._play_btn.setGraphicsEffect(play_opacity)
-            pause_opacity = QGraphicsOpacityEffect()
-            pause_opacity.setOpacity(1.0)  # Disabled: fully opaque (bolder)
-            self._pause_btn.setGraphicsEffect(pause_opacity)
+            # Icon transparency via the cached opacity effects
+            self._play_opacity.setOpacity(0.3)  # Enabled: very transparent
+            self._pause_opacity.setOpacity(1.0)  # Disabled: fully opaque (bolder)
         else:
             # Pause button enabled, play button disabled
             self._pause_btn.setProperty("enabled", "true")
             self._play_btn.setProperty("enabled", "false")
-            # Enabled button: overlay background, very transparent icon
-            self._pause_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 180);
-                    border: none;
-                    border-radius: 6px;
-                    padding: 4px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(0, 0, 0, 160);
-                }
-            """)
-            # Disabled button: lighter background, fully opaque icon
-            self._play_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 120);
-                    border: none;
-                    border-radius: 6px;
-                    padding: 4px;
-                }
-            """)
-            pause_opacity = QGraphicsOpacityEffect()
-            pause_opacity.setOpacity(0.3)  # Enabled: very transparent
-            self._pause_btn.setGraphicsEffect(pause_opacity)
-            play_opacity = QGraphicsOpacityEffect()
-            play_opacity.setOpacity(1.0)  # Disabled: fully opaque (bolder)
-            self._play_btn.setGraphicsEffect(play_opacity)
+            self._pause_opacity.setOpacity(0.3)  # Enabled: very transparent
+            self._play_opacity.setOpacity(1.0)  # Disabled: fully opaque (bolder)
         
         # Refresh styles
-        self._play_btn.style().unpolish(self._play_btn)
-        self._play_btn.style().polish(self._play_btn)
-        self._pause_btn.style().unpolish(self._pause_btn)
-        self._pause_btn.style().polish(self._pause_btn)
+        _repolish(self._play_btn)
+        _repolish(self._pause_btn)
     
     def update_play_pause_state(self):
         """Sync play/pause buttons with translator state (for Space/Enter)."""
@@ -3215,20 +3645,25 @@ class SubtitleOverlay(QWidget):
         """Show error/status messages at top. messages: list of (text, is_good_news) or plain strings (treated as error)."""
         self._status_messages = list(messages) if messages else []
         if self._status_messages:
+            cache = self._status_html_cache
             parts = []
             for m in self._status_messages:
-                if isinstance(m, tuple):
-                    text, is_good = m
+                key = m if isinstance(m, tuple) else (m, False)
+                frag = cache.get(key)
+                if frag is None:
+                    text, is_good = key
                     color = "white" if is_good else "#ff6b6b"
-                else:
-                    text, is_good = m, False
-                    color = "#ff6b6b"
-                escaped = text.replace("&", "&amp;").replace("<", "&lt;")
-                parts.append(f'<span style="color: {color};">{escaped}</span>')
-            html = "<br>".join(parts)
-            self.status_label.setText(html)
+                    frag = cache[key] = f'<span style="color: {color};">{text.translate(_STATUS_ESCAPE_TRANS)}</span>'
+                parts.append(frag)
+            if len(cache) > 256:
+                cache.clear()  # Messages are short-lived; keep the cache from growing unbounded
+            status_html = "<br>".join(parts)
+            if status_html != self._last_status_html:
+                self._last_status_html = status_html
+                self.status_label.setText(status_html)
             self.status_label.show()
         else:
+            self._last_status_html = None
             self.status_label.hide()
             self.status_label.clear()
         self.adjust_height_to_content()
@@ -3237,15 +3672,13 @@ class SubtitleOverlay(QWidget):
         """Recalculate overlay height. Grows downward when below OCR, upward when above OCR."""
         text = self._last_display_text
         if not text:
-            metrics = QFontMetrics(self.label.font())
-            subtitle_h = max(100, int(metrics.lineSpacing() * 3))
+            subtitle_h = max(100, int(self._label_line_spacing * 3))
         else:
             subtitle_h = self._content_height_for_text(text, self.width())
         subtitle_h = max(subtitle_h, 100)  # Minimum height before first translations
         status_h = 0
         if self._status_messages:
-            metrics = QFontMetrics(self.status_label.font())
-            status_h = metrics.lineSpacing() * len(self._status_messages) + 8
+            status_h = self._status_line_spacing * len(self._status_messages) + 8
         self._status_bar_height = status_h
         # Add bottom margin (5px) to account for border-radius so corners aren't clipped
         bottom_margin = 5
@@ -3253,10 +3686,15 @@ class SubtitleOverlay(QWidget):
         new_h = subtitle_h + status_h + bottom_margin + top_margin
         old_h = self.height()
         delta = new_h - old_h
-        if delta != 0 and not self._below_ocr:
-            # Above OCR: grow upward (move window up so bottom stays fixed)
-            self.move(self.x(), self.y() - delta)
-        self.setFixedHeight(new_h)
+        key = (subtitle_h, status_h)
+        if delta == 0 and key == self._last_adjust_key:
+            return  # Same layout as last time: skip the geometry cascade
+        self._last_adjust_key = key
+        if delta != 0:
+            if not self._below_ocr:
+                # Above OCR: grow upward (move window up so bottom stays fixed)
+                self.move(self.x(), self.y() - delta)
+            self.setFixedHeight(new_h)
         self.label.setMinimumHeight(subtitle_h)  # Prevent status bar from shrinking translation area
         self.updateGeometry()
         self._update_info_pill_pos()
@@ -3268,6 +3706,7 @@ class SubtitleOverlay(QWidget):
         else:
             size = 16
         self.label.setFont(QFont("Arial", size))
+        self._label_line_spacing = QFontMetrics(self.label.font()).lineSpacing()  # Read on every height adjust
 
     def set_region_size(self, region_width, screen_w=None):
         """Update font size when OCR region changes."""
@@ -3280,16 +3719,12 @@ class SubtitleOverlay(QWidget):
     def _update_info_pill_pos(self):
         """Position pill slightly above the main subtitle label (always in the 'above' position)."""
         if hasattr(self, "info_pill") and self.info_pill:
-            margin = 4
             status_h = getattr(self, "_status_bar_height", 0)
-            layout_spacing = 4  # Matches layout.setSpacing(4)
-            top_margin = 25  # Matches layout top margin
-            # Label starts after top margin + status bar + spacing
-            label_start_y = top_margin + status_h + layout_spacing
-            # Position pill 15px above the label (same position as when status bar has messages)
-            pill_offset_above = 25
-            pill_y = label_start_y - pill_offset_above
-            self.info_pill.move(self.width() - self.info_pill.width() - margin - 10, pill_y)
+            # Label starts after top margin (25) + status bar + layout spacing (4); pill sits 25px above it.
+            # x: right edge minus pill width, margin 4 and 10px inset.
+            target = QPoint(self.width() - self.info_pill.width() - 14, 4 + status_h)
+            if self.info_pill.pos() != target:
+                self.info_pill.move(target)
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
@@ -3298,47 +3733,48 @@ class SubtitleOverlay(QWidget):
     def set_info_pill_text(self, word_count_by_model):
         """Update info pill: per-model word count stack (vertical). word_count_by_model: {model: count}."""
         if hasattr(self, "info_pill") and self.info_pill:
+            if self._last_pill_counts is not None and word_count_by_model == self._last_pill_counts:
+                return  # Called every UI tick; counts usually unchanged
+            self._last_pill_counts = dict(word_count_by_model or {})
             if not word_count_by_model:
                 text = "0 words"
             else:
-                lines = [f"{name} · {cnt:,} words" for name, cnt in word_count_by_model.items()]
-                total = sum(word_count_by_model.values())
-                # lines.append(f"{total:,} total")
-                text = "\n".join(lines)
-            self.info_pill.setText(text)
-            self.info_pill.adjustSize()
-            self._update_info_pill_pos()
+                prefix = self._pill_prefix
+                for name in word_count_by_model.keys() - prefix.keys():
+                    prefix[name] = f"{name} · "
+                text = "\n".join(prefix[name] + format(cnt, ",") + " words" for name, cnt in word_count_by_model.items())
+            self.info_pill.setText(text)  # Schedules its own repaint
+            # Resize/reposition only when the text's size actually changed (e.g. a digit was added)
+            size = self.info_pill.sizeHint()
+            if size != self.info_pill.size():
+                self.info_pill.resize(size)
+                self._update_info_pill_pos()
 
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton:
-            # Forward clicks on Speak button area - overlay may receive them when
-            # label/pill pass through, so we must explicitly deliver to the button
-            speak_btn = getattr(self, "_speak_btn", None)
-            speak_container = getattr(self, "_speak_container", None)
-            if speak_btn and speak_container:
-                local_in_container = speak_container.mapFrom(self, e.pos())
-                if speak_container.rect().contains(local_in_container):
-                    from PyQt5.QtWidgets import QApplication
-                    from PyQt5.QtCore import QEvent
-                    from PyQt5.QtGui import QMouseEvent
-                    local_in_btn = speak_btn.mapFrom(self, e.pos())
-                    ev = QMouseEvent(
-                        QEvent.MouseButtonPress,
-                        local_in_btn,
-                        e.globalPos(),
-                        e.button(),
-                        e.buttons(),
-                        e.modifiers(),
-                    )
-                    QApplication.sendEvent(speak_btn, ev)
-                    return
+            # Clicks on the Speak button area - overlay may receive them when
+            # label/pill pass through; the button is clicked on release (see mouseReleaseEvent)
+            if self._in_speak_area(e.pos()):
+                return
             self._drag_start = (e.globalPos(), self.frameGeometry().topLeft())
 
+    def _in_speak_area(self, pos):
+        speak_btn = getattr(self, "_speak_btn", None)
+        speak_container = getattr(self, "_speak_container", None)
+        return bool(speak_btn and speak_container and speak_container.geometry().contains(pos))
+
     def mouseMoveEvent(self, e):
         if self._drag_start:
             delta = e.globalPos() - self._drag_start[0]
-            self.move(self._drag_start[1] + delta)
-            self.setCursor(Qt.ClosedHandCursor)
+            self._pending_drag_pos = self._drag_start[1] + delta
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
+                self.setCursor(Qt.ClosedHandCursor)
+
+    def _apply_drag(self):
+        if self._pending_drag_pos is not None:
+            self.move(self._pending_drag_pos)
+            self._pending_drag_pos = None
 
     def snap_away_from_ocr(self, region, gap=10):
         """Animate overlay above or below OCR region (magnetic snap). Target chosen by overlay center vs region center."""
@@ -3357,55 +3793,38 @@ class SubtitleOverlay(QWidget):
                 target_y = region_bottom + gap  # Snap below
             if abs(oy - target_y) < 5:
                 return
-            start_y = oy
-            steps = 12
-            step_ms = 16
-            step_idx = [0]
-
-            def step():
-                step_idx[0] += 1
-                t = min(1.0, step_idx[0] / steps)
-                eased = 1.0 - (1.0 - t) ** 3
-                new_y = int(start_y + (target_y - start_y) * eased)
-                self.move(self.x(), new_y)
-                if step_idx[0] < steps:
-                    QTimer.singleShot(step_ms, step)
-                else:
-                    self._snap_animating = False
-                    app = getattr(self, "_translator_app", None)
-                    if app:
-                        app._snap_animating = False
+            anim = self._snap_anim
+            if anim is None:
+                # Ease-out cubic over ~12 frames, driven by Qt's animation timer
+                anim = self._snap_anim = QPropertyAnimation(self, b"pos", self)
+                anim.setDuration(192)
+                anim.setEasingCurve(QEasingCurve.OutCubic)
+                anim.finished.connect(self._on_snap_finished)
+            anim.setStartValue(QPoint(self.x(), oy))
+            anim.setEndValue(QPoint(self.x(), target_y))
 
             self._snap_animating = True
             app = getattr(self, "_translator_app", None)
             if app:
                 app._snap_animating = True
-            QTimer.singleShot(step_ms, step)
+            anim.start()
         except Exception:
             self._snap_animating = False
 
+    def _on_snap_finished(self):
+        self._snap_animating = False
+        app = getattr(self, "_translator_app", None)
+        if app:
+            app._snap_animating = False
+
     def mouseReleaseEvent(self, e):
         if e.button() == Qt.LeftButton:
-            # Forward release to Speak button if we forwarded the press
-            speak_btn = getattr(self, "_speak_btn", None)
-            speak_container = getattr(self, "_speak_container", None)
-            if speak_btn and speak_container:
-                local_in_container = speak_container.mapFrom(self, e.pos())
-                if speak_container.rect().contains(local_in_container):
-                    from PyQt5.QtWidgets import QApplication
-                    from PyQt5.QtCore import QEvent
-                    from PyQt5.QtGui import QMouseEvent
-                    local_in_btn = speak_btn.mapFrom(self, e.pos())
-                    ev = QMouseEvent(
-                        QEvent.MouseButtonRelease,
-                        local_in_btn,
-                        e.globalPos(),
-                        e.button(),
-                        e.buttons(),
-                        e.modifiers(),
-                    )
-                    QApplication.sendEvent(speak_btn, ev)
-                    return
+            # Press landed on the Speak area: click the button directly (no synthetic mouse events)
+            if self._drag_start is None and self._in_speak_area(e.pos()):
+                self._speak_btn.click()
+                return
+            self._drag_timer.stop()
+            self._apply_drag()  # Land exactly where the button was released
             self._drag_start = None
             self.setCursor(Qt.OpenHandCursor)
 
@@ -3436,13 +3855,21 @@ class SubtitleOverlay(QWidget):
         # Match actual label text width: overlay - (speak 30 or play 40) - spacing 8 - label padding 20
         fixed = 40 if self._transcription_mode == "audio" else 30
         available_width = max(100, width - fixed - 8 - 20)
-        parts = [p.strip() for p in text.replace("\n\n", "\n").split("\n") if p.strip()]
+        font = self.label.font()
+        cache_key = (text, available_width, font.pointSize())
+        cached = self._content_h_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        parts = [p for p in map(str.strip, text.splitlines()) if p]  # Blank lines (from "\n\n") drop out
         if not parts:
             return 80
-        metrics = QFontMetrics(self.label.font())
-        half_line = metrics.lineSpacing() / 2
-        doc = QTextDocument()
-        doc.setDefaultFont(self.label.font())
+        half_line = self._label_line_spacing / 2
+        doc = self._measure_doc
+        if doc is None:
+            doc = self._measure_doc = QTextDocument()
+        if self._measure_font_size != font.pointSize():
+            doc.setDefaultFont(font)
+            self._measure_font_size = font.pointSize()
         doc.setTextWidth(available_width)
         content_height = 0
         for i, part in enumerate(parts):
@@ -3450,22 +3877,31 @@ class SubtitleOverlay(QWidget):
             content_height += doc.size().height()
             if i < len(parts) - 1:
                 content_height += half_line
-        return int(content_height * 1.15 + 10)  
+        height = int(content_height * 1.15 + 10)
+        if len(self._content_h_cache) >= 64:
+            self._content_h_cache.clear()
+        self._content_h_cache[cache_key] = height
+        return height
+
+    def _set_subtitle(self, text, rich=True):
+        """Set label text; plain strings skip the rich-text parser, identical updates are skipped entirely."""
+        state = (text, rich)
+        if state == self._subtitle_state:
+            return
+        self._subtitle_state = state
+        self.label.setTextFormat(Qt.RichText if rich else Qt.PlainText)
+        self.label.setText(text)
 
     def update_text(self, text, allow_show=True, partial_text=None):
         """Update text. allow_show=False keeps overlay hidden during brief capture hide.
         partial_text: Last/bottom item to style with muted color.
         """
         if not text:
-            self.label.setText("Waiting for subtitles...")
+            self._set_subtitle("Waiting for subtitles...", rich=False)
             if allow_show:
                 self.setVisible(False)
             return
         
-        # Use <br> for line breaks in RichText mode
-        def to_html(s):
-            return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\n", "<br>")
-        
         # Line-height 1.1 within lines; half-line gap between the two sentences via margin-bottom
         line_style = 'style="line-height: 1.1"'
         block1_style = 'style="line-height: 1.1; margin-bottom: 0em"'
@@ -3475,28 +3911,28 @@ class SubtitleOverlay(QWidget):
             parts = text.replace("\n\n", "\n").split("\n")
             if parts and parts[-1].strip():
                 last_part = parts[-1].strip()
-                last_html = to_html(last_part)
+                last_html = _to_html(last_part)
                 complete_parts = parts[:-1]
                 if complete_parts:
-                    styled = f'<p {block1_style}>' + '</p><p ' + block1_style + '>'.join(to_html(p) for p in complete_parts) + '</p>'
+                    styled = f'<p {block1_style}>' + '</p><p ' + block1_style + '>'.join(_to_html(p) for p in complete_parts) + '</p>'
                     styled += f'<p {line_style}><span style="color: rgba(255,255,255,0.55); font-style: italic;">{last_html}</span></p>'
                 else:
                     styled = f'<p {line_style}><span style="color: rgba(255,255,255,0.55); font-style: italic;">{last_html}</span></p>'
-                self.label.setText(styled)
+                self._set_subtitle(styled)
             else:
-                self.label.setText(f'<p {line_style}>{to_html(text)}</p>')
+                self._set_subtitle(f'<p {line_style}>{_to_html(text)}</p>')
         elif partial_text:
-            self.label.setText(f'<p {line_style}><span style="color: rgba(255,255,255,0.55); font-style: italic;">{to_html(text.strip())}</span></p>')
+            self._set_subtitle(f'<p {line_style}><span style="color: rgba(255,255,255,0.55); font-style: italic;">{_to_html(text.strip())}</span></p>')
         else:
             if "\n" in text:
                 parts = text.replace("\n\n", "\n").split("\n")
                 if len(parts) == 2:
-                    html = f'<p {block1_style}>{to_html(parts[0])}</p><p {line_style}>{to_html(parts[1])}</p>'
+                    html = f'<p {block1_style}>{_to_html(parts[0])}</p><p {line_style}>{_to_html(parts[1])}</p>'
                 else:
-                    html = f'<p {line_style}>' + '<br>'.join(to_html(p) for p in parts) + '</p>'
+                    html = f'<p {line_style}>' + '<br>'.join(_to_html(p) for p in parts) + '</p>'
             else:
-                html = f'<p {line_style}>{to_html(text)}</p>'
-            self.label.setText(html)
+                html = f'<p {line_style}>{_to_html(text)}</p>'
+            self._set_subtitle(html)
         
         self._last_display_text = text
         # Recompute height when content changes (adapts lines1+lines2) or when width changed
@@ -3560,11 +3996,11 @@ class TranslatorApp:
         if transcription_mode == "audio":
             settings = get_app_settings()
             self.audio_buffer_settings = {
-                "reconciler_period_sec": settings.get("audio_reconciler_period_sec", 2.0),
-                "reconciler_num_checks": settings.get("audio_reconciler_num_checks", 4),
-                "reconciler_min_words": settings.get("audio_reconciler_min_words", 7),
-                "silence_duration": settings.get("audio_silence_duration", 1.0),
-                "max_phrase_duration": settings.get("audio_max_phrase_duration", 5.0),
+                "reconciler_period_sec": settings.audio_reconciler_period_sec,
+                "reconciler_num_checks": settings.audio_reconciler_num_checks,
+                "reconciler_min_words": settings.audio_reconciler_min_words,
+                "silence_duration": settings.audio_silence_duration,
+                "max_phrase_duration": settings.audio_max_phrase_duration,
             }
         else:
             self.audio_buffer_settings = {}
@@ -3595,12 +4031,12 @@ class TranslatorApp:
         # Reconcilers: MT uses segment-by-segment stability; LLM uses accumulate-and-split-on-sentences
         # Get settings from environment or use defaults
         settings = get_app_settings()
-        mt_stability = settings.get("ocr_mt_reconciler_stability", 0.2)
-        llm_stability = settings.get("ocr_llm_reconciler_stability", 0.12)
-        llm_max_buffer = settings.get("ocr_llm_reconciler_max_buffer", 0.6)
-        self.ocr_min_words_before_translate = settings.get("ocr_min_words_before_translate", 0)
-        self.ocr_similarity_substring_chars = max(0, settings.get("ocr_similarity_substring_chars", 15))
-        self.llm_context_count = max(0, settings.get("llm_context_count", 3))
+        mt_stability = settings.ocr_mt_reconciler_stability
+        llm_stability = settings.ocr_llm_reconciler_stability
+        llm_max_buffer = settings.ocr_llm_reconciler_max_buffer
+        self.ocr_min_words_before_translate = settings.ocr_min_words_before_translate
+        self.ocr_similarity_substring_chars = settings.ocr_similarity_substring_chars
+        self.llm_context_count = settings.llm_context_count
         try:
             from streaming_reconciler import StreamingReconciler, LLMReconciler, AudioReconciler
             self.reconciler = StreamingReconciler(stability_threshold=mt_stability, debug=debug)
@@ -3697,6 +4133,7 @@ class TranslatorApp:
         """Initialize and start the audio transcription pipeline"""
         if self.transcription_mode != "audio" or not self.audio_settings:
             return
+        from audio_pipeline import AudioPipeline
             
         def translate_wrapper(text):
             """Wrapper to use our existing translation method"""
@@ -3785,9 +4222,9 @@ class TranslatorApp:
         from PIL import Image
         import numpy as np
         pil = Image.fromarray(img).resize((64, 16)).convert("L")
-        arr = np.array(pil)
-        avg = arr.mean()
-        return "".join("1" if p > avg else "0" for p in arr.flatten())
+        arr = np.asarray(pil)
+        # 1024-bit mask packed to 128 bytes; compared directly, no string building or digest
+        return np.packbits(arr > arr.mean()).tobytes()
 
     def has_changed(self, frame):
         if frame is None:
@@ -3800,13 +4237,12 @@ class TranslatorApp:
 
     def _translate_deepl(self, text):
         """DeepL API - 500K chars/month free. Set DEEPL_AUTH_KEY."""
+        import requests
         key = os.environ.get("DEEPL_AUTH_KEY")
         if not key:
             return None
-        row = _LANG_MAP.get(self.source_lang, (None, "auto", "auto", None))
-        dl = row[0]
-        row = _LANG_MAP.get(self.target_lang, (None, "en", "en", "en"))
-        tl = row[0]
+        dl = _DEEPL_CODE.get(self.source_lang)
+        tl = _DEEPL_CODE.get(self.target_lang)
         payload = {"text": [text], "target_lang": tl}
         if dl:
             payload["source_lang"] = dl
@@ -3824,6 +4260,7 @@ class TranslatorApp:
 
     def _translate_baidu(self, text):
         """Baidu 百度翻译 - ~2M chars/month free. Set BAIDU_APP_ID, BAIDU_APP_SECRET."""
+        import requests
         app_id = os.environ.get("BAIDU_APP_ID")
         secret = os.environ.get("BAIDU_APP_SECRET")
         if not app_id or not secret:
@@ -3831,10 +4268,8 @@ class TranslatorApp:
         salt = str(uuid.uuid4().hex)[:16]
         sign_str = f"{app_id}{text}{salt}{secret}"
         sign = hashlib.md5(sign_str.encode("utf-8")).hexdigest()
-        row = _LANG_MAP.get(self.source_lang, (None, "auto", "auto", None))
-        bd_from = row[1]
-        row = _LANG_MAP.get(self.target_lang, (None, "en", "en", "en"))
-        bd_to = row[1]
+        bd_from = _BAIDU_CODE.get(self.source_lang, "auto")
+        bd_to = _BAIDU_CODE.get(self.target_lang, "en")
         r = requests.get(
             "https://api.fanyi.baidu.com/api/trans/vip/translate",
             params={"q": text, "from": bd_from, "to": bd_to, "appid": app_id, "salt": salt, "sign": sign},
@@ -3848,6 +4283,7 @@ class TranslatorApp:
 
     def _translate_youdao(self, text):
         """Youdao 有道 - ~1M chars/month free. Set YOUDAO_APP_KEY, YOUDAO_APP_SECRET."""
+        import requests
         app_key = os.environ.get("YOUDAO_APP_KEY")
         app_secret = os.environ.get("YOUDAO_APP_SECRET")
         if not app_key or not app_secret:
@@ -3857,10 +4293,8 @@ class TranslatorApp:
         raw = text if len(text) <= 20 else text[:10] + str(len(text)) + text[-10:]
         sign_str = app_key + raw + salt + curtime + app_secret
         sign = hashlib.sha256(sign_str.encode("utf-8")).hexdigest()
-        row = _LANG_MAP.get(self.source_lang, (None, "auto", "auto", None))
-        yd_from = row[2]
-        row = _LANG_MAP.get(self.target_lang, (None, "en", "en", "en"))
-        yd_to = row[2]
+        yd_from = _YOUDAO_CODE.get(self.source_lang, "auto")
+        yd_to = _YOUDAO_CODE.get(self.target_lang, "en")
         r = requests.post(
             "https://openapi.youdao.com/api",
             data={
@@ -3884,13 +4318,12 @@ class TranslatorApp:
 
     def _translate_google(self, text):
         """Google Cloud Translation API v2 - 500K chars/month free. Set GOOGLE_TRANSLATE_API_KEY."""
+        import requests
         key = os.environ.get("GOOGLE_TRANSLATE_API_KEY")
         if not key:
             return None
-        row = _LANG_MAP.get(self.source_lang, (None, "auto", "auto", None))
-        gl_from = row[3]
-        row = _LANG_MAP.get(self.target_lang, (None, "en", "en", "en"))
-        gl_to = row[3]
+        gl_from = _GOOGLE_CODE.get(self.source_lang)
+        gl_to = _GOOGLE_CODE.get(self.target_lang, "en")
         params = {"q": text, "target": gl_to, "key": key, "format": "text"}
         if gl_from:
             params["source"] = gl_from
@@ -3904,13 +4337,12 @@ class TranslatorApp:
 
     def _translate_yandex(self, text):
         """Yandex Translate API. Set YANDEX_API_KEY."""
+        import requests
         key = os.environ.get("YANDEX_API_KEY")
         if not key:
             return None
-        row = _LANG_MAP.get(self.source_lang, (None, "auto", "auto", None))
-        yandex_from = row[3] if row[3] else "auto"
-        row = _LANG_MAP.get(self.target_lang, (None, "en", "en", "en"))
-        yandex_to = row[3] if row[3] else "en"
+        yandex_from = _GOOGLE_CODE.get(self.source_lang) or "auto"
+        yandex_to = _GOOGLE_CODE.get(self.target_lang) or "en"
         r = requests.post(
             "https://translate.yandex.net/api/v1.5/tr.json/translate",
             params={
@@ -3926,12 +4358,11 @@ class TranslatorApp:
 
     def _translate_libretranslate(self, text):
         """LibreTranslate (self-hosted or public instance). Set LIBRETRANSLATE_API_KEY and optionally LIBRETRANSLATE_URL."""
+        import requests
         key = os.environ.get("LIBRETRANSLATE_API_KEY")
         url = os.environ.get("LIBRETRANSLATE_URL", "https://libretranslate.com")
-        row = _LANG_MAP.get(self.source_lang, (None, "auto", "auto", None))
-        lt_from = row[3] if row[3] else "auto"
-        row = _LANG_MAP.get(self.target_lang, (None, "en", "en", "en"))
-        lt_to = row[3] if row[3] else "en"
+        lt_from = _GOOGLE_CODE.get(self.source_lang) or "auto"
+        lt_to = _GOOGLE_CODE.get(self.target_lang) or "en"
         payload = {
             "q": text,
             "source": lt_from,
@@ -3951,6 +4382,7 @@ class TranslatorApp:
     def _translate_caiyun(self, text):
         """Caiyun (彩云小译) - Great for natural/literary Chinese translation.
         Set CAIYUN_TOKEN environment variable."""
+        import requests
         token = os.environ.get("CAIYUN_TOKEN")
         if not token:
             raise ValueError("CAIYUN_TOKEN not set")
@@ -4005,6 +4437,7 @@ class TranslatorApp:
     def _translate_niutrans(self, text):
         """Niutrans (小牛翻译) - Good for Asian languages and technical content.
         Set NIUTRANS_APIKEY environment variable."""
+        import requests
         apikey = os.environ.get("NIUTRANS_APIKEY")
         if not apikey:
             raise ValueError("NIUTRANS_APIKEY not set")
@@ -4172,6 +4605,7 @@ class TranslatorApp:
 
     def _translate_llm_openai_compat(self, text, base_url, api_key_env, model, extra_headers=None, context=None, timeout=15):
         """OpenAI-compatible chat completion (SiliconFlow, OpenAI, DeepSeek)."""
+        import requests
         key = os.environ.get(api_key_env)
         if not key:
             if self.debug:
@@ -4359,6 +4793,7 @@ class TranslatorApp:
 
     def _translate_anthropic(self, text, context=None, timeout=15):
         """Anthropic Claude. Set ANTHROPIC_API_KEY. Uses Messages API."""
+        import requests
         key = os.environ.get("ANTHROPIC_API_KEY")
         if not key:
             return None
@@ -4413,6 +4848,7 @@ class TranslatorApp:
 
     def _translate_huggingface_api(self, text, context=None, timeout=15):
         """HuggingFace Inference API. Set HF_API_KEY."""
+        import requests
         key = os.environ.get("HF_API_KEY")
         if not key:
             return None
@@ -4769,7 +5205,7 @@ class TranslatorApp:
             if self._session_output_path is None:
                 base_dir = getattr(self, "session_output_path", "").strip()
                 if not base_dir or not os.path.isdir(base_dir):
-                    base_dir = os.path.dirname(os.path.abspath(__file__)) if not getattr(sys, "frozen", False) else os.path.dirname(sys.executable)
+                    base_dir = _APP_DIR
                 stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 self._session_output_path = os.path.join(base_dir, f"session_{stamp}.json")
             first_ts = self._session_output_buffer[0].get("timestamp", 0)
@@ -5008,6 +5444,7 @@ class TranslatorApp:
         return overlap >= 0.6  # 60% overlap threshold
         
     def capture_thread(self):
+        from capture_mac import DynamicRegionCapture
         print("[Capture Thread] Starting capture thread...")
         if self.region_selector:
             def get_region():
@@ -6120,9 +6557,7 @@ class TranslatorApp:
                             # Get human-readable provider name
                             # Try to find in _LLM_PROVIDERS (defined at module level)
                             try:
-                                # Access module-level _LLM_PROVIDERS via globals()
-                                llm_providers = globals().get('_LLM_PROVIDERS', [])
-                                for disp_name, prov_id in llm_providers:
+                                for disp_name, prov_id in _LLM_PROVIDERS:
                                     if prov_id == self.learn_mode_provider:
                                         provider_display = disp_name
                                         break
@@ -6153,10 +6588,12 @@ class TranslatorApp:
                                 "provider_display": provider_display,
                                 "model": model_display,
                             }
+                        # Normalize here, off the UI thread; the learn panel only dedupes and adds rows
+                        keywords = _prepare_keyword_entries(keywords)
                         if self.debug:
                             words_list = ", ".join([f"{kw.get('word', '')} ({kw.get('pinyin', '')})" for kw in keywords])
                             print(f"[Learn] Extracted {len(keywords)} keywords from '{text[:30]}...': {words_list}")
-                        if not self._keywords_similar_to_recent(keywords):
+                        if keywords and not self._keywords_similar_to_recent(keywords):
                             try:
                                 self.keyword_queue.put_nowait(keywords)
                                 if self.debug:
@@ -6929,13 +7366,13 @@ def main():
         learn_mode=learn_mode,
         learn_mode_provider=learn_mode_provider,
         learn_mode_model=learn_mode_model,
-        detect_mixed_content=settings.get("detect_mixed_content", False),
-        max_words_for_translation=settings.get("max_words_for_translation", 50),
-        max_words_enabled=settings.get("max_words_enabled", False),
-        allow_overlap=settings.get("allow_overlap", False),
-        auto_detect_text_region=settings.get("auto_detect_text_region", False),
-        session_output_enabled=settings.get("session_output_enabled", False),
-        session_output_path=settings.get("session_output_path", "") or "",
+        detect_mixed_content=settings.detect_mixed_content,
+        max_words_for_translation=settings.max_words_for_translation,
+        max_words_enabled=settings.max_words_enabled,
+        allow_overlap=settings.allow_overlap,
+        auto_detect_text_region=settings.auto_detect_text_region,
+        session_output_enabled=settings.session_output_enabled,
+        session_output_path=settings.session_output_path,
         transcription_mode=transcription_mode,
         audio_device_index=audio_settings.get("device_index"),
         audio_asr_backend=audio_settings.get("asr_backend", "whisper"),
@@ -6945,6 +7382,8 @@ def main():
         tts_voice=tts_voice,
         tts_speed=tts_speed,
     )
+    # Baseline for _apply_settings_to_translator: the translator starts from these values
+    translator._last_applied_settings = settings
     overlay._translator_app = translator
     # Sync initial play/pause button state after app reference is set
     if transcription_mode == "audio" and hasattr(overlay, "update_play_pause_state"):
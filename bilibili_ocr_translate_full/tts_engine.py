@@ -265,7 +265,7 @@ DEFAULT_PIPER_VOICE = "en_US-lessac-medium"
 DEFAULT_PIPER_VOICE_DIR = os.path.expanduser("~/.local/share/piper/voices")
 
 # Piper voices: (display_name, model_id)
-PIPER_VOICES = [
+PIPER_VOICES = (
     # English (US)
     ("Lessac (US, medium)", "en_US-lessac-medium"),
     ("Lessac (US, low)", "en_US-lessac-low"),
@@ -284,7 +284,7 @@ PIPER_VOICES = [
     ("Sharvard (ES, medium)", "es_ES-sharvard-medium"),
     # Italian
     ("Riccardo (IT, x_low)", "it_IT-riccardo-x_low"),
-]
+)
 
 
 # Voices that no longer exist on Hugging Face - map to valid alternative
@@ -439,9 +439,9 @@ def redownload_piper_voices(voice_ids=None):
 # --- Backend: XTTS v2 (local) ---
 
 # XTTS uses language for voice; speaker cloning would need wav file
-XTTS_VOICES = [
+XTTS_VOICES = (
     ("Default (language-based)", "default"),
-]
+)
 
 
 class XTTSBackend:
@@ -501,7 +501,7 @@ class XTTSBackend:
 # --- Backend: ElevenLabs (API) ---
 
 # ElevenLabs preset voices: (display_name, voice_id)
-ELEVENLABS_VOICES = [
+ELEVENLABS_VOICES = (
     ("Adam", "pNInz6obpgDQGcFmaJgB"),
     ("Rachel", "21m00Tcm4TlvDq8ikWAM"),
     ("Sam", "yoZ06aMxZJJ28mfd3POQ"),
@@ -510,7 +510,7 @@ ELEVENLABS_VOICES = [
     ("Josh", "TxGEqnHWrfWFTfGW9XjX"),
     ("Arnold", "VR6AewLTigWG4xSOukaG"),
     ("Emily", "LcfcDJNUP1GQjkzn1xUU"),
-]
+)
 
 
 class ElevenLabsBackend:
@@ -566,7 +566,7 @@ class ElevenLabsBackend:
 # --- Backend: OpenAI TTS (API) ---
 
 # OpenAI voices (tts-1/tts-1-hd compatible)
-OPENAI_VOICES = [
+OPENAI_VOICES = (
     ("Alloy", "alloy"),
     ("Echo", "echo"),
     ("Fable", "fable"),
@@ -580,7 +580,7 @@ OPENAI_VOICES = [
     ("Verse", "verse"),
     ("Cedar", "cedar"),
     ("Marin", "marin"),
-]
+)
 
 
 class OpenAIBackend: